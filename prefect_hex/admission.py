@@ -0,0 +1,212 @@
+"""
+This is a module containing the admission controller that adapts how many
+project runs are live at a time to the kernel capacity of the Hex workspace.
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+from prefect_hex.models import project as models
+
+
+@dataclass
+class AdmissionStats:
+    """
+    Counters describing the decisions of an admission controller.
+
+    Attributes:
+        admitted: Number of runs admitted, including requeued runs.
+        kernel_rejections: Number of runs that ended with
+            `UNABLE_TO_ALLOCATE_KERNEL` status.
+        requeues: Number of rejected runs admitted again.
+        decreases: Number of times the concurrency limit was decreased.
+        concurrency_limit: The current concurrency limit.
+        live: The number of runs currently admitted.
+    """
+
+    admitted: int = 0
+    kernel_rejections: int = 0
+    requeues: int = 0
+    decreases: int = 0
+    concurrency_limit: int = 0
+    live: int = 0
+
+
+class KernelAdmissionController:
+    """
+    Admits project runs so that no more than a concurrency limit are live at
+    a time, adapting the limit to the kernel capacity of the workspace: the
+    limit grows additively with every run that gets a kernel, and shrinks
+    multiplicatively when a run ends with `UNABLE_TO_ALLOCATE_KERNEL` status.
+    Rejected runs are requeued after a backoff.
+
+    Failures of runs admitted before the last decrease don't decrease the limit
+    again, so a burst of rejections caused by the same overload shrinks the
+    limit once.
+
+    Args:
+        initial_concurrency: The concurrency limit to start with.
+        min_concurrency: Lower bound of the concurrency limit.
+        max_concurrency: Upper bound of the concurrency limit.
+        increase_step: Amount the limit grows by once a full window of runs,
+            i.e. as many runs as the limit, got a kernel.
+        decrease_factor: Factor the limit is multiplied by on a rejection.
+        max_requeues: Maximum number of times a rejected run is requeued.
+        backoff_base_seconds: Backoff before the first requeue of a run.
+        backoff_max_seconds: Upper bound of the backoff before a requeue.
+
+    Examples:
+        Run many projects, adapting the number of live runs to the workspace.
+        ```python
+        from prefect_hex import HexCredentials
+        from prefect_hex.admission import KernelAdmissionController
+        from prefect_hex.batch import sweep_project_input_params
+
+        async def adaptive_sweep(project_id, input_params):
+            controller = KernelAdmissionController(max_concurrency=50)
+            async for result in sweep_project_input_params(
+                project_id,
+                input_params,
+                HexCredentials.load("hex-token"),
+                max_in_flight=50,
+                admission_controller=controller,
+            ):
+                print(result.key, result.succeeded)
+            print(controller.stats)
+        ```
+    """
+
+    def __init__(
+        self,
+        initial_concurrency: int = 10,
+        min_concurrency: int = 1,
+        max_concurrency: int = 50,
+        increase_step: float = 1,
+        decrease_factor: float = 0.5,
+        max_requeues: int = 5,
+        backoff_base_seconds: float = 5,
+        backoff_max_seconds: float = 300,
+    ):
+        if not 1 <= min_concurrency <= initial_concurrency <= max_concurrency:
+            raise ValueError(
+                "Expected 1 <= min_concurrency <= initial_concurrency "
+                "<= max_concurrency"
+            )
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.max_requeues = max_requeues
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+
+        self._limit = float(initial_concurrency)
+        self._live = 0
+        self._epoch = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._stats = AdmissionStats()
+
+    @property
+    def concurrency_limit(self) -> int:
+        """
+        The current number of runs admitted at a time.
+        """
+        return int(self._limit)
+
+    @property
+    def live(self) -> int:
+        """
+        The number of runs currently admitted.
+        """
+        return self._live
+
+    @property
+    def stats(self) -> AdmissionStats:
+        """
+        A snapshot of the counters of the controller.
+        """
+        return AdmissionStats(
+            admitted=self._stats.admitted,
+            kernel_rejections=self._stats.kernel_rejections,
+            requeues=self._stats.requeues,
+            decreases=self._stats.decreases,
+            concurrency_limit=self.concurrency_limit,
+            live=self._live,
+        )
+
+    def _get_condition(self) -> asyncio.Condition:
+        """
+        Creates the condition lazily, so the controller can be created
+        outside of an event loop.
+        """
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self, requeue: bool = False) -> int:
+        """
+        Waits until a run can be admitted under the concurrency limit.
+
+        Args:
+            requeue: Whether the run is a requeue of a rejected run.
+
+        Returns:
+            A ticket to pass to `release` once the run is over.
+        """
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._live < self.concurrency_limit)
+            self._live += 1
+            self._stats.admitted += 1
+            self._stats.requeues += requeue
+            return self._epoch
+
+    async def release(
+        self, ticket: int, status: Optional[models.ProjectRunStatus]
+    ) -> None:
+        """
+        Releases an admitted run and adapts the concurrency limit to its
+        terminal status.
+
+        Args:
+            ticket: The ticket returned by `acquire`.
+            status: The terminal status of the run, or None if the run was not
+                triggered or did not finish, which leaves the limit unchanged.
+        """
+        condition = self._get_condition()
+        async with condition:
+            self._live -= 1
+            if status == models.ProjectRunStatus.unabletoallocatekernel:
+                self._stats.kernel_rejections += 1
+                if ticket == self._epoch:
+                    self._epoch += 1
+                    self._stats.decreases += 1
+                    self._limit = max(
+                        self.min_concurrency, self._limit * self.decrease_factor
+                    )
+            elif status is not None:
+                # the run got a kernel; grow by increase_step per window
+                self._limit = min(
+                    self.max_concurrency,
+                    self._limit + self.increase_step / self._limit,
+                )
+            condition.notify_all()
+
+    def get_backoff_seconds(self, requeue: int) -> float:
+        """
+        Computes the backoff before requeueing a rejected run, with full jitter.
+
+        Args:
+            requeue: The number of the requeue, starting at 1.
+
+        Returns:
+            The number of seconds to wait.
+        """
+        # cap the exponent so long retries don't overflow
+        exponent = min(requeue - 1, 64)
+        cap = min(self.backoff_max_seconds, self.backoff_base_seconds * 2**exponent)
+        return random.uniform(0, cap)
@@ -0,0 +1,918 @@
+"""
+This is a module containing tasks and flows for triggering many Hex
+project runs at once.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+)
+
+from prefect import flow, get_run_logger, task
+from prefect.context import FlowRunContext
+from prefect.exceptions import MissingContextError
+from prefect.logging import get_logger
+from prefect.utilities.asyncutils import run_sync_in_worker_thread
+from pydantic import VERSION as PYDANTIC_VERSION
+
+if PYDANTIC_VERSION.startswith("2."):
+    from pydantic.v1 import BaseModel, Field
+else:
+    from pydantic import BaseModel, Field
+
+from prefect_hex import HexCredentials
+from prefect_hex.admission import KernelAdmissionController
+from prefect_hex.exceptions import TERMINAL_STATUS_EXCEPTIONS, HexProjectRunError
+from prefect_hex.models import project as models
+from prefect_hex.polling import PollingStrategy
+from prefect_hex.project import CompletedRunLedger, run_project
+from prefect_hex.store import HexStateStore, get_state_store
+from prefect_hex.watcher import ProjectRunWatcher
+
+
+class ProjectRunSpec(BaseModel):
+    """
+    Specification of a project run to trigger.
+
+    Attributes:
+        project_id: Project ID to run.
+        input_params: Optional input parameter value map for the run.
+        update_cache: Whether the run updates the cached state of the
+            published app.
+        key: Key of the run in the results; defaults to the project ID.
+            Required to tell apart several runs of the same project.
+    """
+
+    project_id: str = Field(default=..., description="Project ID to run.")
+    input_params: Optional[Dict[str, Any]] = Field(
+        default=None, description="Optional input parameter value map for the run."
+    )
+    update_cache: bool = Field(
+        default=False,
+        description="Whether the run updates the cached state of the published app.",
+    )
+    key: Optional[str] = Field(
+        default=None, description="Key of the run in the results."
+    )
+
+    @property
+    def result_key(self) -> str:
+        """
+        The key of the run in the results.
+        """
+        return self.key or self.project_id
+
+
+class ProjectRunResult(BaseModel):
+    """
+    Outcome of a project run triggered in a batch.
+
+    Attributes:
+        key: Key of the run in the results.
+        project_id: Project ID of the run.
+        input_params: Input parameter value map of the run.
+        project_run: Information about the triggered run, if it was triggered.
+        project_metadata: The final status payload of the run, if it was
+            waited for and reached a terminal status.
+        error: Description of why the run failed, if it did.
+    """
+
+    key: str
+    project_id: str
+    input_params: Optional[Dict[str, Any]] = None
+    project_run: Optional[models.ProjectRunResponsePayload] = None
+    project_metadata: Optional[models.ProjectStatusResponsePayload] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Whether the run was triggered and, if waited for, completed.
+        """
+        return self.error is None
+
+
+def _parse_project_run_specs(
+    project_run_specs: List[Union[ProjectRunSpec, Dict[str, Any]]],
+    spec_class: Type[ProjectRunSpec] = ProjectRunSpec,
+) -> List[ProjectRunSpec]:
+    """
+    Helper method to parse project run specs and validate that their
+    result keys are unique.
+    """
+    specs = [
+        spec if isinstance(spec, spec_class) else spec_class.parse_obj(spec)
+        for spec in project_run_specs
+    ]
+    keys = [spec.result_key for spec in specs]
+    duplicate_keys = sorted({key for key in keys if keys.count(key) > 1})
+    if duplicate_keys:
+        raise ValueError(
+            f"Project run specs have duplicate keys {duplicate_keys}; "
+            "set a unique key on runs of the same project"
+        )
+    return specs
+
+
+async def _trigger(
+    spec: ProjectRunSpec, hex_credentials: HexCredentials
+) -> ProjectRunResult:
+    """
+    Helper method to trigger a project run, capturing any error in the result.
+    """
+    result = ProjectRunResult(
+        key=spec.result_key,
+        project_id=spec.project_id,
+        input_params=spec.input_params,
+    )
+    try:
+        result.project_run = await run_project.fn(
+            project_id=spec.project_id,
+            hex_credentials=hex_credentials,
+            input_params=spec.input_params,
+            update_cache=spec.update_cache,
+        )
+    except Exception as exc:
+        result.error = f"Failed to trigger run: {exc!r}"
+    return result
+
+
+class RunCheckpoint:
+    """
+    Checkpoint of the runs of a batch or sweep, recording the run triggered
+    for each item and its final status in the local state store, so that a
+    resumed batch or sweep skips items that completed and re-attaches to runs
+    that are still in flight instead of triggering new ones.
+
+    Items whose run finished unsuccessfully are triggered again on resume.
+
+    Args:
+        checkpoint_key: Key identifying the batch or sweep, e.g. the ID of the
+            flow run, which stays the same when the flow run is retried.
+        store: State store to persist the checkpoint in; defaults to the
+            process-wide store.
+        ttl_seconds: Number of seconds after which checkpointed items expire.
+
+    Examples:
+        Resume a sweep under the same checkpoint key after a crash.
+        ```python
+        from prefect_hex import HexCredentials
+        from prefect_hex.batch import RunCheckpoint, sweep_project_input_params
+
+        async def resumable_sweep(project_id, input_params):
+            checkpoint = RunCheckpoint("regions-2023-01-31")
+            async for result in sweep_project_input_params(
+                project_id,
+                input_params,
+                HexCredentials.load("hex-token"),
+                checkpoint=checkpoint,
+            ):
+                print(result.key, result.succeeded)
+        ```
+    """
+
+    def __init__(
+        self,
+        checkpoint_key: str,
+        store: Optional[HexStateStore] = None,
+        ttl_seconds: float = 7 * 24 * 60 * 60,
+    ):
+        self.checkpoint_key = checkpoint_key
+        self.store = store or get_state_store()
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def namespace(self) -> str:
+        """
+        The namespace of the checkpoint in the state store.
+        """
+        return f"checkpoint/{self.checkpoint_key}"
+
+    def get(self, item_key: str) -> Dict[str, Any]:
+        """
+        Gets the checkpointed state of an item.
+
+        Args:
+            item_key: Key of the item in the batch or sweep.
+
+        Returns:
+            The item's `project_run` and `project_metadata` payloads, if
+            recorded.
+        """
+        return self.store.get(self.namespace, item_key) or {}
+
+    def record(
+        self,
+        item_key: str,
+        project_run: models.ProjectRunResponsePayload,
+        project_metadata: Optional[models.ProjectStatusResponsePayload] = None,
+    ) -> None:
+        """
+        Records the run triggered for an item and, once known, its final status.
+
+        Args:
+            item_key: Key of the item in the batch or sweep.
+            project_run: Information about the triggered run.
+            project_metadata: The final status payload of the run.
+        """
+        state = {"project_run": json.loads(project_run.json(by_alias=True))}
+        if project_metadata is not None:
+            state["project_metadata"] = json.loads(project_metadata.json(by_alias=True))
+        self.store.set(self.namespace, item_key, state, ttl_seconds=self.ttl_seconds)
+
+
+def _get_item_key(spec: ProjectRunSpec) -> str:
+    """
+    Helper method to compute a key identifying a run spec by its content.
+    """
+    content = json.dumps(
+        [spec.project_id, spec.input_params, spec.update_cache],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _get_checkpoint(
+    checkpoint: bool, checkpoint_key: Optional[str]
+) -> Optional[RunCheckpoint]:
+    """
+    Helper method to build the checkpoint of a flow, keyed by the given key
+    or by the ID of the current flow run.
+    """
+    if not checkpoint and checkpoint_key is None:
+        return None
+    if checkpoint_key is None:
+        checkpoint_key = str(FlowRunContext.get().flow_run.id)
+    return RunCheckpoint(checkpoint_key)
+
+
+def _get_admission_controller(
+    adaptive_concurrency: bool, max_concurrency: int
+) -> Optional[KernelAdmissionController]:
+    """
+    Helper method to build the admission controller of a flow, starting at
+    and capped by its maximum concurrency.
+    """
+    if not adaptive_concurrency:
+        return None
+    return KernelAdmissionController(
+        initial_concurrency=max_concurrency, max_concurrency=max_concurrency
+    )
+
+
+def _set_terminal_status(
+    result: ProjectRunResult, project_metadata: models.ProjectStatusResponsePayload
+):
+    """
+    Helper method to record the final status of a run in its result.
+    """
+    result.project_metadata = project_metadata
+    project_status = project_metadata.status
+    if project_status != models.ProjectRunStatus.completed:
+        exception_class = TERMINAL_STATUS_EXCEPTIONS.get(
+            project_status, HexProjectRunError
+        )
+        result.error = (
+            f"{exception_class.__name__}: run was unsuccessful "
+            f"with {project_status.value!r} status"
+        )
+
+
+async def _trigger_and_wait(
+    spec: ProjectRunSpec,
+    hex_credentials: HexCredentials,
+    watcher: ProjectRunWatcher,
+    max_wait_seconds: Optional[float],
+    logger: logging.Logger,
+    checkpoint: Optional[RunCheckpoint] = None,
+    item_key: Optional[str] = None,
+    reuse_if_completed_within: Optional[float] = None,
+) -> ProjectRunResult:
+    """
+    Helper method to trigger a project run and wait for it through the watcher,
+    capturing any error or unsuccessful terminal status in the result.
+    Completed items of the checkpoint are skipped and in-flight ones
+    re-attached to; recent completed runs with identical inputs are reused.
+    """
+    checkpointed = (
+        await run_sync_in_worker_thread(checkpoint.get, item_key)
+        if checkpoint is not None
+        else {}
+    )
+    project_run = checkpointed.get("project_run")
+    if "project_metadata" in checkpointed:
+        project_metadata = models.ProjectStatusResponsePayload.parse_obj(
+            checkpointed["project_metadata"]
+        )
+        if project_metadata.status == models.ProjectRunStatus.completed:
+            logger.info(
+                "Skipping %s; project %s run %s already completed",
+                repr(spec.result_key),
+                repr(spec.project_id),
+                repr(project_metadata.run_id),
+            )
+            result = ProjectRunResult(
+                key=spec.result_key,
+                project_id=spec.project_id,
+                input_params=spec.input_params,
+                project_run=project_run,
+            )
+            _set_terminal_status(result, project_metadata)
+            return result
+        # the run finished unsuccessfully, so trigger a new one
+        project_run = None
+
+    ledger = CompletedRunLedger() if reuse_if_completed_within is not None else None
+    if ledger is not None and project_run is None:
+        project_metadata = await run_sync_in_worker_thread(
+            ledger.get,
+            spec.project_id,
+            spec.input_params,
+            within_seconds=reuse_if_completed_within,
+        )
+        if project_metadata is not None:
+            logger.info(
+                "Reusing project %s run %s for %s; it completed with identical "
+                "input parameters within the last %s seconds",
+                repr(spec.project_id),
+                repr(project_metadata.run_id),
+                repr(spec.result_key),
+                reuse_if_completed_within,
+            )
+            return ProjectRunResult(
+                key=spec.result_key,
+                project_id=spec.project_id,
+                input_params=spec.input_params,
+                project_metadata=project_metadata,
+            )
+
+    if project_run is not None:
+        result = ProjectRunResult(
+            key=spec.result_key,
+            project_id=spec.project_id,
+            input_params=spec.input_params,
+            project_run=project_run,
+        )
+        logger.info(
+            "Re-attaching %s to project %s run %s",
+            repr(spec.result_key),
+            repr(spec.project_id),
+            repr(result.project_run.run_id),
+        )
+    else:
+        result = await _trigger(spec, hex_credentials)
+        if result.project_run is None:
+            return result
+        if checkpoint is not None:
+            await run_sync_in_worker_thread(
+                checkpoint.record, item_key, result.project_run
+            )
+        logger.info(
+            "Started project %s run %s; visit %s to view the run.",
+            repr(spec.project_id),
+            repr(result.project_run.run_id),
+            str(result.project_run.run_status_url),
+        )
+
+    try:
+        project_metadata = await watcher.watch(
+            spec.project_id,
+            result.project_run.run_id,
+            max_wait_seconds=max_wait_seconds,
+        )
+    except Exception as exc:
+        result.error = f"Failed to wait for run: {exc!r}"
+        return result
+
+    _set_terminal_status(result, project_metadata)
+    if checkpoint is not None:
+        await run_sync_in_worker_thread(
+            checkpoint.record, item_key, result.project_run, project_metadata
+        )
+    if ledger is not None and result.succeeded:
+        await run_sync_in_worker_thread(
+            ledger.record, project_metadata, spec.input_params
+        )
+    return result
+
+
+async def _trigger_and_wait_admitted(
+    spec: ProjectRunSpec,
+    hex_credentials: HexCredentials,
+    watcher: ProjectRunWatcher,
+    max_wait_seconds: Optional[float],
+    logger: logging.Logger,
+    admission_controller: Optional[KernelAdmissionController] = None,
+    **kwargs: Any,
+) -> ProjectRunResult:
+    """
+    Helper method to trigger and wait for a project run once admitted by the
+    admission controller, if any, requeueing runs that could not allocate
+    a kernel.
+    """
+    if admission_controller is None:
+        return await _trigger_and_wait(
+            spec, hex_credentials, watcher, max_wait_seconds, logger, **kwargs
+        )
+
+    requeue = 0
+    while True:
+        ticket = await admission_controller.acquire(requeue=requeue > 0)
+        status = None
+        try:
+            result = await _trigger_and_wait(
+                spec, hex_credentials, watcher, max_wait_seconds, logger, **kwargs
+            )
+            if result.project_metadata is not None:
+                status = result.project_metadata.status
+        finally:
+            await admission_controller.release(ticket, status)
+
+        if (
+            status != models.ProjectRunStatus.unabletoallocatekernel
+            or requeue >= admission_controller.max_requeues
+        ):
+            return result
+        requeue += 1
+        backoff_seconds = admission_controller.get_backoff_seconds(requeue)
+        logger.info(
+            "Project %s run %s for %s could not allocate a kernel; requeueing "
+            "in %.2f seconds with a concurrency limit of %s",
+            repr(spec.project_id),
+            repr(result.project_run.run_id),
+            repr(spec.result_key),
+            backoff_seconds,
+            admission_controller.concurrency_limit,
+        )
+        await asyncio.sleep(backoff_seconds)
+
+
+def _log_admission_stats(admission_controller: KernelAdmissionController):
+    """
+    Helper method to report the decisions of the admission controller.
+    """
+    stats = admission_controller.stats
+    _get_logger().info(
+        "Admission ended with a concurrency limit of %s after %s kernel "
+        "allocation failures and %s requeues",
+        stats.concurrency_limit,
+        stats.kernel_rejections,
+        stats.requeues,
+    )
+
+
+def _log_failures(results: Dict[str, ProjectRunResult]):
+    """
+    Helper method to report the runs of a batch that failed.
+    """
+    logger = _get_logger()
+    failed = [result for result in results.values() if not result.succeeded]
+    for result in failed:
+        logger.warning("Project run %s failed: %s", repr(result.key), result.error)
+    logger.info(
+        "%s of %s project runs succeeded", len(results) - len(failed), len(results)
+    )
+
+
+@task
+async def run_projects(
+    project_run_specs: List[Union[ProjectRunSpec, Dict[str, Any]]],
+    hex_credentials: HexCredentials,
+    max_concurrency: int = 10,
+) -> Dict[str, ProjectRunResult]:
+    """
+    Trigger runs of many projects concurrently; a failure to trigger one run
+    does not prevent the others from being triggered.
+
+    Args:
+        project_run_specs:
+            Specifications of the runs to trigger.
+        hex_credentials:
+            Credentials to use for authentication with Hex.
+        max_concurrency:
+            Maximum number of trigger requests in flight.
+
+    Returns:
+        The result of each run, keyed by the key of its spec.
+
+    Examples:
+        Trigger the nightly refresh of several projects.
+        ```python
+        from prefect import flow
+        from prefect_hex import HexCredentials
+        from prefect_hex.batch import run_projects
+
+        @flow
+        def nightly_refresh_flow(project_ids):
+            hex_credentials = HexCredentials.load("hex-token")
+            results = run_projects(
+                [{"project_id": project_id} for project_id in project_ids],
+                hex_credentials,
+                max_concurrency=20,
+            )
+            return {key: result.succeeded for key, result in results.items()}
+        ```
+    """
+    specs = _parse_project_run_specs(project_run_specs)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _trigger_with_limit(spec: ProjectRunSpec) -> ProjectRunResult:
+        """
+        Triggers a run once fewer than `max_concurrency` triggers are in flight.
+        """
+        async with semaphore:
+            return await _trigger(spec, hex_credentials)
+
+    results = await asyncio.gather(*(_trigger_with_limit(spec) for spec in specs))
+    results = {result.key: result for result in results}
+    _log_failures(results)
+    return results
+
+
+@flow
+async def trigger_project_runs_and_wait_for_completion(
+    project_run_specs: List[ProjectRunSpec],
+    hex_credentials: HexCredentials,
+    max_concurrency: int = 10,
+    max_wait_seconds: int = 900,
+    poll_frequency_seconds: int = 10,
+    polling_strategy: Optional[PollingStrategy] = None,
+    checkpoint: bool = False,
+    checkpoint_key: Optional[str] = None,
+    reuse_if_completed_within: Optional[float] = None,
+    adaptive_concurrency: bool = False,
+) -> Dict[str, ProjectRunResult]:
+    """
+    Flow that triggers runs of many projects and waits for them to complete,
+    with at most `max_concurrency` runs in flight at a time. All runs are
+    waited for by a single `ProjectRunWatcher` and share the pooled client of
+    the credentials. A failed run does not abort the others; failures are
+    reported in the results.
+
+    Args:
+        project_run_specs:
+            Specifications of the runs to trigger.
+        hex_credentials:
+            Credentials to use for authentication with Hex.
+        max_concurrency:
+            Maximum number of runs triggered and not yet finished at a time.
+        max_wait_seconds: Maximum number of seconds to wait for each run
+            to complete.
+        poll_frequency_seconds: Number of seconds to wait in between checks for
+            run completion.
+        polling_strategy: Strategy deciding how long to wait in between checks
+            for run completion; overrides `poll_frequency_seconds`.
+        checkpoint: Whether to checkpoint the runs in the local state store,
+            so that a retry of this flow run skips completed runs and
+            re-attaches to runs still in flight.
+        checkpoint_key: Key of the checkpoint, to resume a batch across flow
+            runs; defaults to the ID of the flow run. Implies `checkpoint`.
+        reuse_if_completed_within: Number of seconds within which a completed
+            run of a project with identical input parameters is reused instead
+            of triggering a new run; reused results have no `project_run`.
+        adaptive_concurrency: Whether to shrink the number of live runs below
+            `max_concurrency` when runs cannot allocate a kernel, requeueing
+            those runs, and grow it back as runs get kernels again; see
+            `KernelAdmissionController`.
+
+    Returns:
+        The result of each run, keyed by the key of its spec.
+
+    Examples:
+        Refresh several projects, two of them with different inputs.
+        ```python
+        from prefect import flow
+        from prefect_hex import HexCredentials
+        from prefect_hex.batch import (
+            ProjectRunSpec,
+            trigger_project_runs_and_wait_for_completion,
+        )
+
+        @flow
+        def refresh_flow():
+            hex_credentials = HexCredentials.load("hex-token")
+            results = trigger_project_runs_and_wait_for_completion(
+                project_run_specs=[
+                    ProjectRunSpec(project_id="012345c6-b67c", update_cache=True),
+                    ProjectRunSpec(
+                        project_id="654321c6-b67c",
+                        input_params={"region": "emea"},
+                        key="emea",
+                    ),
+                    ProjectRunSpec(
+                        project_id="654321c6-b67c",
+                        input_params={"region": "amer"},
+                        key="amer",
+                    ),
+                ],
+                hex_credentials=hex_credentials,
+                max_concurrency=20,
+            )
+            return [key for key, result in results.items() if not result.succeeded]
+        ```
+    """
+    logger = get_run_logger()
+    specs = _parse_project_run_specs(project_run_specs)
+    watcher = ProjectRunWatcher(
+        hex_credentials,
+        poll_frequency_seconds=poll_frequency_seconds,
+        polling_strategy=polling_strategy,
+        max_concurrency=max_concurrency,
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    run_checkpoint = _get_checkpoint(checkpoint, checkpoint_key)
+    admission_controller = _get_admission_controller(
+        adaptive_concurrency, max_concurrency
+    )
+
+    async def _trigger_and_wait_with_limit(spec: ProjectRunSpec) -> ProjectRunResult:
+        """
+        Runs a project once fewer than `max_concurrency` runs are in flight.
+        """
+        async with semaphore:
+            return await _trigger_and_wait_admitted(
+                spec,
+                hex_credentials,
+                watcher,
+                max_wait_seconds,
+                logger,
+                admission_controller=admission_controller,
+                checkpoint=run_checkpoint,
+                item_key=spec.result_key,
+                reuse_if_completed_within=reuse_if_completed_within,
+            )
+
+    try:
+        results = await asyncio.gather(
+            *(_trigger_and_wait_with_limit(spec) for spec in specs)
+        )
+    finally:
+        await watcher.aclose()
+
+    results = {result.key: result for result in results}
+    if admission_controller is not None:
+        _log_admission_stats(admission_controller)
+    _log_failures(results)
+    return results
+
+
+async def sweep_project_input_params(
+    project_id: str,
+    input_params: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+    hex_credentials: HexCredentials,
+    max_in_flight: int = 10,
+    max_wait_seconds: Optional[float] = 900,
+    polling_strategy: Optional[PollingStrategy] = None,
+    watcher: Optional[ProjectRunWatcher] = None,
+    checkpoint: Optional[RunCheckpoint] = None,
+    reuse_if_completed_within: Optional[float] = None,
+    admission_controller: Optional[KernelAdmissionController] = None,
+) -> AsyncIterator[ProjectRunResult]:
+    """
+    Runs a project once for every input parameter value map and yields the
+    results in the order the runs finish.
+
+    The input parameter value maps are consumed lazily, with at most
+    `max_in_flight` runs triggered and not yet finished at a time, so memory
+    use stays constant however long the sweep is. All runs are waited for
+    through one `ProjectRunWatcher`.
+
+    Args:
+        project_id:
+            Project ID to run.
+        input_params:
+            Iterable or async iterable of input parameter value maps.
+        hex_credentials:
+            Credentials to use for authentication with Hex.
+        max_in_flight:
+            Maximum number of runs triggered and not yet finished at a time.
+        max_wait_seconds:
+            Maximum number of seconds to wait for each run to complete.
+        polling_strategy:
+            Strategy deciding how long to wait in between checks for
+            run completion, if no watcher is given.
+        watcher:
+            Watcher to wait for the runs through, e.g. one shared with other
+            sweeps; a new one is used for this sweep if None.
+        checkpoint:
+            Checkpoint to record the runs in, so that resuming the sweep with
+            the same checkpoint skips completed items and re-attaches to runs
+            still in flight. Items are identified by their input parameters.
+        reuse_if_completed_within:
+            Number of seconds within which a completed run of the project with
+            identical input parameters is reused instead of triggering a new
+            run; reused results have no `project_run`.
+        admission_controller:
+            Controller adapting the number of live runs, below `max_in_flight`,
+            to the kernel capacity of the workspace; runs that cannot allocate
+            a kernel are requeued.
+
+    Yields:
+        The result of each run, keyed by the position of its input
+        parameter value map in the sweep.
+
+    Examples:
+        Run a project for every region and customer.
+        ```python
+        import itertools
+        from prefect import flow
+        from prefect_hex import HexCredentials
+        from prefect_hex.batch import sweep_project_input_params
+
+        @flow
+        async def sweep_flow(project_id: str, regions, customers):
+            hex_credentials = HexCredentials.load("hex-token")
+            input_params = (
+                {"region": region, "customer": customer}
+                for region, customer in itertools.product(regions, customers)
+            )
+            failed = 0
+            async for result in sweep_project_input_params(
+                project_id, input_params, hex_credentials, max_in_flight=25
+            ):
+                failed += not result.succeeded
+            return failed
+        ```
+    """
+    logger = _get_logger()
+    owns_watcher = watcher is None
+    if owns_watcher:
+        watcher = ProjectRunWatcher(
+            hex_credentials,
+            polling_strategy=polling_strategy,
+            max_concurrency=max_in_flight,
+        )
+
+    input_params_iterator = _aiter(input_params)
+    in_flight = set()
+    index = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(in_flight) < max_in_flight:
+                try:
+                    params = await input_params_iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                spec = ProjectRunSpec(
+                    project_id=project_id, input_params=params, key=str(index)
+                )
+                index += 1
+                in_flight.add(
+                    asyncio.ensure_future(
+                        _trigger_and_wait_admitted(
+                            spec,
+                            hex_credentials,
+                            watcher,
+                            max_wait_seconds,
+                            logger,
+                            admission_controller=admission_controller,
+                            checkpoint=checkpoint,
+                            item_key=_get_item_key(spec),
+                            reuse_if_completed_within=reuse_if_completed_within,
+                        )
+                    )
+                )
+
+            if not in_flight:
+                return
+            done, in_flight = await asyncio.wait(
+                in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
+            for completed in done:
+                yield completed.result()
+    finally:
+        for pending in in_flight:
+            pending.cancel()
+        if owns_watcher:
+            await watcher.aclose()
+
+
+@flow
+async def trigger_project_sweep_and_wait_for_completion(
+    project_id: str,
+    input_params: List[Dict[str, Any]],
+    hex_credentials: HexCredentials,
+    max_in_flight: int = 10,
+    max_wait_seconds: int = 900,
+    polling_strategy: Optional[PollingStrategy] = None,
+    checkpoint: bool = False,
+    checkpoint_key: Optional[str] = None,
+    reuse_if_completed_within: Optional[float] = None,
+    adaptive_concurrency: bool = False,
+) -> List[ProjectRunResult]:
+    """
+    Flow that runs a project once for every input parameter value map, with
+    at most `max_in_flight` runs in flight at a time, and waits for all of
+    them to complete. A failed run does not abort the others; failures are
+    reported in the results.
+
+    Args:
+        project_id:
+            Project ID to run.
+        input_params:
+            Input parameter value maps to run the project with.
+        hex_credentials:
+            Credentials to use for authentication with Hex.
+        max_in_flight:
+            Maximum number of runs triggered and not yet finished at a time.
+        max_wait_seconds:
+            Maximum number of seconds to wait for each run to complete.
+        polling_strategy:
+            Strategy deciding how long to wait in between checks for
+            run completion.
+        checkpoint:
+            Whether to checkpoint the runs in the local state store, so that a
+            retry of this flow run skips completed runs and re-attaches to
+            runs still in flight.
+        checkpoint_key:
+            Key of the checkpoint, to resume a sweep across flow runs;
+            defaults to the ID of the flow run. Implies `checkpoint`.
+        reuse_if_completed_within:
+            Number of seconds within which a completed run of the project with
+            identical input parameters is reused instead of triggering a new
+            run; reused results have no `project_run`.
+        adaptive_concurrency:
+            Whether to shrink the number of live runs below `max_in_flight`
+            when runs cannot allocate a kernel, requeueing those runs, and grow
+            it back as runs get kernels again; see `KernelAdmissionController`.
+
+    Returns:
+        The result of each run, in the order the runs finished.
+
+    Examples:
+        Run a project for every region.
+        ```python
+        from prefect import flow
+        from prefect_hex import HexCredentials
+        from prefect_hex.batch import trigger_project_sweep_and_wait_for_completion
+
+        @flow
+        def regions_flow(project_id: str):
+            return trigger_project_sweep_and_wait_for_completion(
+                project_id=project_id,
+                input_params=[{"region": region} for region in ("amer", "emea")],
+                hex_credentials=HexCredentials.load("hex-token"),
+            )
+        ```
+    """
+    admission_controller = _get_admission_controller(
+        adaptive_concurrency, max_in_flight
+    )
+    results = [
+        result
+        async for result in sweep_project_input_params(
+            project_id,
+            input_params,
+            hex_credentials,
+            max_in_flight=max_in_flight,
+            max_wait_seconds=max_wait_seconds,
+            polling_strategy=polling_strategy,
+            checkpoint=_get_checkpoint(checkpoint, checkpoint_key),
+            reuse_if_completed_within=reuse_if_completed_within,
+            admission_controller=admission_controller,
+        )
+    ]
+    if admission_controller is not None:
+        _log_admission_stats(admission_controller)
+    _log_failures({result.key: result for result in results})
+    return results
+
+
+async def _aiter(
+    iterable: Union[Iterable[Any], AsyncIterable[Any]],
+) -> AsyncIterator[Any]:
+    """
+    Helper method to iterate over a sync or async iterable asynchronously.
+    """
+    if hasattr(iterable, "__aiter__"):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+def _get_logger() -> logging.Logger:
+    """
+    Helper method to get the run logger, or the module logger when called
+    outside of a flow or task run.
+    """
+    try:
+        return get_run_logger()
+    except MissingContextError:
+        return get_logger(__name__)
@@ -0,0 +1,229 @@
+"""
+This is a module containing a process-wide registry of pooled Hex REST clients.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+import httpx
+
+if TYPE_CHECKING:
+    from prefect_hex import HexCredentials
+
+
+def token_fingerprint(hex_credentials: "HexCredentials") -> str:
+    """
+    Computes a stable, non-reversible fingerprint of the token of a
+    `HexCredentials` block, suitable for use as a dictionary key.
+
+    Args:
+        hex_credentials: Credentials to fingerprint.
+
+    Returns:
+        The hex digest of the SHA-256 hash of the token.
+    """
+    token = hex_credentials.token.get_secret_value()
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+@dataclass
+class _PooledClient:
+    """
+    A pooled client, the event loop it is bound to and when it was last used.
+    """
+
+    client: httpx.AsyncClient
+    loop: asyncio.AbstractEventLoop
+    last_used: float
+
+
+class HexClientRegistry:
+    """
+    Registry of long-lived `httpx.AsyncClient`s keyed by the domain, the token
+    fingerprint and the transport settings of the `HexCredentials` they were
+    created from, so that connections to Hex are kept alive and reused across
+    requests.
+
+    Clients are bound to the event loop they were created on; a separate client is
+    created for every running event loop and clients on closed loops are discarded.
+    The registry is safe to use from several threads, each running its own loop.
+
+    Args:
+        limits: Connection pool limits applied to clients created by the registry,
+            unless the credentials configure their own.
+        idle_timeout: Number of seconds a client may go unused before it is
+            closed and evicted from the registry.
+
+    Examples:
+        Reuse one connection pool for many requests.
+        ```python
+        from prefect_hex import HexCredentials
+        from prefect_hex.clients import get_client_registry
+
+        async def example():
+            hex_credentials = HexCredentials(token="a1b2c3d4")
+            client = await get_client_registry().get_client(hex_credentials)
+            response = await client.get("/project/123/runs")
+        ```
+    """
+
+    def __init__(
+        self,
+        limits: Optional[httpx.Limits] = None,
+        idle_timeout: float = 300,
+    ):
+        self.limits = limits or httpx.Limits(
+            max_connections=100, max_keepalive_connections=20, keepalive_expiry=30
+        )
+        self.idle_timeout = idle_timeout
+        self._clients: Dict[Tuple, _PooledClient] = {}
+        self._lock = threading.Lock()
+
+    def _get_key(self, hex_credentials: "HexCredentials") -> Tuple:
+        """
+        Builds the registry key of the client for the given credentials
+        and transport settings on the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        transport_settings = tuple(
+            (key, repr(value))
+            for key, value in sorted(hex_credentials._get_client_kwargs().items())
+            if key not in ("base_url", "headers")
+        )
+        return (
+            hex_credentials.domain,
+            token_fingerprint(hex_credentials),
+            transport_settings,
+            id(loop),
+        )
+
+    async def get_client(self, hex_credentials: "HexCredentials") -> httpx.AsyncClient:
+        """
+        Gets the pooled client for the given credentials, creating one if needed.
+
+        The returned client is owned by the registry and must not be closed
+        by the caller.
+
+        Args:
+            hex_credentials: Credentials to use for authentication with Hex.
+
+        Returns:
+            A long-lived Hex REST AsyncClient.
+        """
+        await self.evict_idle()
+
+        key = self._get_key(hex_credentials)
+        running_loop = asyncio.get_running_loop()
+        with self._lock:
+            pooled = self._clients.get(key)
+            if (
+                pooled is None
+                or pooled.client.is_closed
+                # the ID of a closed loop may be reused by a new one
+                or pooled.loop is not running_loop
+            ):
+                client_kwargs = hex_credentials._get_client_kwargs()
+                client_kwargs.setdefault("limits", self.limits)
+                pooled = _PooledClient(
+                    client=httpx.AsyncClient(**client_kwargs),
+                    loop=running_loop,
+                    last_used=0,
+                )
+                self._clients[key] = pooled
+            pooled.last_used = time.monotonic()
+        return pooled.client
+
+    async def evict_idle(self) -> int:
+        """
+        Closes and removes clients that have been idle longer than `idle_timeout`
+        and drops clients whose event loop has been closed.
+
+        Returns:
+            The number of evicted clients.
+        """
+        now = time.monotonic()
+        running_loop = asyncio.get_running_loop()
+        evicted = 0
+        idle = []
+        with self._lock:
+            for key, pooled in list(self._clients.items()):
+                if pooled.loop.is_closed():
+                    # the transport cannot be closed gracefully without its loop
+                    self._clients.pop(key, None)
+                    evicted += 1
+                elif (
+                    pooled.loop is running_loop
+                    and now - pooled.last_used > self.idle_timeout
+                ):
+                    self._clients.pop(key, None)
+                    idle.append(pooled)
+        for pooled in idle:
+            await pooled.client.aclose()
+        return evicted + len(idle)
+
+    async def aclose(self) -> None:
+        """
+        Closes all clients bound to the running event loop and drops clients
+        whose event loop has been closed. Clients bound to other event loops
+        are kept, since they can only be closed from their own loop.
+        Clients requested afterwards are created anew.
+        """
+        running_loop = asyncio.get_running_loop()
+        closing = []
+        with self._lock:
+            for key, pooled in list(self._clients.items()):
+                if pooled.loop is running_loop or pooled.loop.is_closed():
+                    self._clients.pop(key, None)
+                    if pooled.loop is running_loop:
+                        closing.append(pooled)
+        for pooled in closing:
+            await pooled.client.aclose()
+
+    def __len__(self) -> int:
+        """
+        The number of clients currently held by the registry.
+        """
+        with self._lock:
+            return len(self._clients)
+
+
+_CLIENT_REGISTRY: Optional[HexClientRegistry] = None
+
+
+def get_client_registry() -> HexClientRegistry:
+    """
+    Gets the process-wide client registry, creating it on first use.
+
+    Returns:
+        The process-wide `HexClientRegistry`.
+    """
+    global _CLIENT_REGISTRY
+    if _CLIENT_REGISTRY is None:
+        _CLIENT_REGISTRY = HexClientRegistry()
+    return _CLIENT_REGISTRY
+
+
+def set_client_registry(registry: HexClientRegistry) -> None:
+    """
+    Replaces the process-wide client registry, e.g. to configure different
+    pool limits or idle timeouts. Clients held by the previous registry are
+    not closed; call `HexClientRegistry.aclose` on it first if needed.
+
+    Args:
+        registry: The registry to use from now on.
+    """
+    global _CLIENT_REGISTRY
+    _CLIENT_REGISTRY = registry
+
+
+async def aclose_clients() -> None:
+    """
+    Closes all pooled clients of the process-wide registry that are bound
+    to the running event loop; use this during shutdown.
+    """
+    if _CLIENT_REGISTRY is not None:
+        await _CLIENT_REGISTRY.aclose()
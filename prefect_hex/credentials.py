@@ -1,6 +1,8 @@
 """Credential classes used to perform authenticated interactions with Hex"""
 
-from httpx import AsyncClient
+from typing import Any, Dict, Optional
+
+from httpx import AsyncClient, Limits, Timeout
 from prefect.blocks.core import Block
 from pydantic import VERSION as PYDANTIC_VERSION
 
@@ -9,6 +11,9 @@ if PYDANTIC_VERSION.startswith("2."):
 else:
     from pydantic import Field, SecretStr
 
+from prefect_hex.clients import get_client_registry
+from prefect_hex.retries import RetryPolicy
+
 
 class HexCredentials(Block):
     """
@@ -17,7 +22,21 @@ class HexCredentials(Block):
     Attributes:
         domain: Domain to make API requests against.
         token: The token to authenticate with Hex.
+        connect_timeout: Seconds to wait for a connection to be established.
+        read_timeout: Seconds to wait for a chunk of the response to be received.
+        write_timeout: Seconds to wait for a chunk of the request to be sent.
+        pool_timeout: Seconds to wait for a connection from the pool.
+        max_connections: Maximum number of concurrent connections.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+        keepalive_expiry: Seconds an idle keep-alive connection is kept open.
+        http2: Whether to use HTTP/2; requires `httpx[http2]` to be installed.
+        retry_policy: Default policy for retrying rate limited or failed requests.
+        trigger_requests_per_minute: Client-side budget for requests that
+            trigger or cancel runs, shared by the whole process.
+        read_requests_per_minute: Client-side budget for requests that read
+            runs, shared by the whole process.
 
+    Timeouts set to `None` wait indefinitely.
 
     Examples:
         Load stored Hex credentials:
@@ -36,13 +55,76 @@ class HexCredentials(Block):
         default="app.hex.tech", description="Domain to make API requests against."
     )
     token: SecretStr = Field(default=..., description="Token used for authentication.")
+    connect_timeout: Optional[float] = Field(
+        default=5.0,
+        description="Seconds to wait for a connection to be established.",
+    )
+    read_timeout: Optional[float] = Field(
+        default=5.0,
+        description="Seconds to wait for a chunk of the response to be received.",
+    )
+    write_timeout: Optional[float] = Field(
+        default=5.0,
+        description="Seconds to wait for a chunk of the request to be sent.",
+    )
+    pool_timeout: Optional[float] = Field(
+        default=5.0,
+        description="Seconds to wait for a connection from the connection pool.",
+    )
+    max_connections: Optional[int] = Field(
+        default=None,
+        description=(
+            "Maximum number of concurrent connections; "
+            "if unset, the client registry default is used."
+        ),
+    )
+    max_keepalive_connections: Optional[int] = Field(
+        default=None,
+        description=(
+            "Maximum number of idle connections kept alive; "
+            "if unset, the client registry default is used."
+        ),
+    )
+    keepalive_expiry: Optional[float] = Field(
+        default=None,
+        description=(
+            "Seconds an idle keep-alive connection is kept open; "
+            "if unset, the client registry default is used."
+        ),
+    )
+    http2: bool = Field(
+        default=False,
+        description="Whether to use HTTP/2; requires `httpx[http2]` to be installed.",
+    )
+    retry_policy: RetryPolicy = Field(
+        default_factory=RetryPolicy,
+        description="Default policy for retrying rate limited or failed requests.",
+    )
+    trigger_requests_per_minute: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Client-side budget for requests that trigger or cancel runs, "
+            "shared by the whole process; unlimited if unset."
+        ),
+    )
+    read_requests_per_minute: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Client-side budget for requests that read runs, "
+            "shared by the whole process; unlimited if unset."
+        ),
+    )
 
     def get_client(self) -> AsyncClient:
         """
         Gets a Hex REST AsyncClient.
 
         Returns:
-            A Hex REST AsyncClient.
+            A Hex REST AsyncClient. The caller owns the client and is
+            responsible for closing it; tasks in this collection use the
+            pooled clients from `prefect_hex.clients` instead.
 
         Example:
             Gets a Hex REST AsyncClient.
@@ -60,9 +142,35 @@ class HexCredentials(Block):
             example_get_client_flow()
             ```
         """
+        client_kwargs = self._get_client_kwargs()
+        client = AsyncClient(**client_kwargs)
+        return client
+
+    def _get_client_kwargs(self) -> Dict[str, Any]:
+        """
+        Builds the keyword arguments used to construct a Hex REST AsyncClient.
+        """
         client_kwargs = {
             "base_url": f"https://{self.domain}/api/v1",
             "headers": {"Authorization": f"Bearer {self.token.get_secret_value()}"},
+            "timeout": Timeout(
+                connect=self.connect_timeout,
+                read=self.read_timeout,
+                write=self.write_timeout,
+                pool=self.pool_timeout,
+            ),
+            "http2": self.http2,
         }
-        client = AsyncClient(**client_kwargs)
-        return client
+
+        limits_kwargs = {
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+        }
+        if any(value is not None for value in limits_kwargs.values()):
+            default_limits = get_client_registry().limits
+            for key, value in limits_kwargs.items():
+                if value is None:
+                    limits_kwargs[key] = getattr(default_limits, key)
+            client_kwargs["limits"] = Limits(**limits_kwargs)
+        return client_kwargs
@@ -0,0 +1,227 @@
+"""
+This is a module containing a flow for running Hex projects that depend on
+each other, following their dependency graph.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Dict, List, Optional, Union
+
+from prefect import flow, get_run_logger
+from pydantic import VERSION as PYDANTIC_VERSION
+
+if PYDANTIC_VERSION.startswith("2."):
+    from pydantic.v1 import Field
+else:
+    from pydantic import Field
+
+from prefect_hex import HexCredentials
+from prefect_hex.batch import (
+    ProjectRunResult,
+    ProjectRunSpec,
+    _log_failures,
+    _parse_project_run_specs,
+    _trigger_and_wait,
+)
+from prefect_hex.polling import PollingStrategy
+from prefect_hex.watcher import ProjectRunWatcher
+
+
+class ProjectRunNode(ProjectRunSpec):
+    """
+    Specification of a project run in a dependency graph of runs.
+
+    Attributes:
+        upstream: Keys of the runs that must complete before this run starts.
+    """
+
+    upstream: List[str] = Field(
+        default_factory=list,
+        description="Keys of the runs that must complete before this run starts.",
+    )
+
+
+def _get_downstream(nodes: List[ProjectRunNode]) -> Dict[str, List[str]]:
+    """
+    Helper method to map the key of every node to the keys of the nodes
+    depending on it, validating that the nodes form a directed acyclic graph.
+    """
+    keys = {node.result_key for node in nodes}
+    downstream = {key: [] for key in keys}
+    for node in nodes:
+        unknown = sorted(set(node.upstream) - keys)
+        if unknown:
+            raise ValueError(
+                f"Project run {node.result_key!r} depends on unknown runs {unknown}"
+            )
+        # a node listing the same upstream run twice depends on it once
+        for upstream_key in dict.fromkeys(node.upstream):
+            downstream[upstream_key].append(node.result_key)
+
+    # Kahn's algorithm visits every node only if there is no cycle
+    remaining = {node.result_key: len(set(node.upstream)) for node in nodes}
+    ready = deque(key for key, count in remaining.items() if count == 0)
+    visited = 0
+    while ready:
+        key = ready.popleft()
+        visited += 1
+        for downstream_key in downstream[key]:
+            remaining[downstream_key] -= 1
+            if remaining[downstream_key] == 0:
+                ready.append(downstream_key)
+    if visited < len(nodes):
+        cyclic = sorted(key for key, count in remaining.items() if count > 0)
+        raise ValueError(f"Project runs {cyclic} form a dependency cycle")
+    return downstream
+
+
+@flow
+async def trigger_project_dag_and_wait_for_completion(
+    project_run_nodes: List[Union[ProjectRunNode, Dict[str, Any]]],
+    hex_credentials: HexCredentials,
+    max_concurrency: int = 10,
+    max_wait_seconds: int = 900,
+    poll_frequency_seconds: int = 10,
+    polling_strategy: Optional[PollingStrategy] = None,
+) -> Dict[str, ProjectRunResult]:
+    """
+    Flow that runs a dependency graph of projects, triggering every run as soon
+    as all of its upstream runs completed, with at most `max_concurrency` runs
+    in flight at a time. Independent branches run in parallel.
+
+    When a run does not complete, all runs downstream of it are skipped and
+    reported as failed in the results; the rest of the graph keeps running.
+
+    Args:
+        project_run_nodes:
+            Specifications of the runs and the keys of their upstream runs.
+        hex_credentials:
+            Credentials to use for authentication with Hex.
+        max_concurrency:
+            Maximum number of runs triggered and not yet finished at a time.
+        max_wait_seconds: Maximum number of seconds to wait for each run
+            to complete.
+        poll_frequency_seconds: Number of seconds to wait in between checks for
+            run completion.
+        polling_strategy: Strategy deciding how long to wait in between checks
+            for run completion; overrides `poll_frequency_seconds`.
+
+    Returns:
+        The result of each run, keyed by the key of its node.
+
+    Examples:
+        Refresh a dashboard once its staging and mart notebooks ran.
+        ```python
+        from prefect import flow
+        from prefect_hex import HexCredentials
+        from prefect_hex.dag import (
+            ProjectRunNode,
+            trigger_project_dag_and_wait_for_completion,
+        )
+
+        @flow
+        def warehouse_flow():
+            results = trigger_project_dag_and_wait_for_completion(
+                project_run_nodes=[
+                    ProjectRunNode(project_id="staging-orders", key="orders"),
+                    ProjectRunNode(project_id="staging-users", key="users"),
+                    ProjectRunNode(
+                        project_id="mart-sales",
+                        key="sales",
+                        upstream=["orders", "users"],
+                    ),
+                    ProjectRunNode(
+                        project_id="sales-dashboard",
+                        update_cache=True,
+                        upstream=["sales"],
+                    ),
+                ],
+                hex_credentials=HexCredentials.load("hex-token"),
+            )
+            return [key for key, result in results.items() if not result.succeeded]
+        ```
+    """
+    logger = get_run_logger()
+    nodes = _parse_project_run_specs(project_run_nodes, spec_class=ProjectRunNode)
+    nodes_by_key = {node.result_key: node for node in nodes}
+    downstream = _get_downstream(nodes)
+    remaining_upstream = {node.result_key: set(node.upstream) for node in nodes}
+
+    watcher = ProjectRunWatcher(
+        hex_credentials,
+        poll_frequency_seconds=poll_frequency_seconds,
+        polling_strategy=polling_strategy,
+        max_concurrency=max_concurrency,
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _trigger_and_wait_with_limit(node: ProjectRunNode) -> ProjectRunResult:
+        """
+        Runs a node once fewer than `max_concurrency` runs are in flight.
+        """
+        async with semaphore:
+            return await _trigger_and_wait(
+                node, hex_credentials, watcher, max_wait_seconds, logger
+            )
+
+    results: Dict[str, ProjectRunResult] = {}
+    running = set()
+    started = set()
+
+    def _start(key: str):
+        """
+        Starts the run of a node whose upstream runs all completed, unless it
+        was already started.
+        """
+        if key in started:
+            return
+        started.add(key)
+        running.add(
+            asyncio.ensure_future(_trigger_and_wait_with_limit(nodes_by_key[key]))
+        )
+
+    def _skip_downstream(failed_key: str):
+        """
+        Records every run downstream of a failed run as skipped.
+        """
+        pending_keys = deque(downstream[failed_key])
+        while pending_keys:
+            key = pending_keys.popleft()
+            if key in results:
+                continue
+            node = nodes_by_key[key]
+            results[key] = ProjectRunResult(
+                key=key,
+                project_id=node.project_id,
+                input_params=node.input_params,
+                error=f"Skipped because upstream run {failed_key!r} failed",
+            )
+            pending_keys.extend(downstream[key])
+
+    for key, upstream_keys in remaining_upstream.items():
+        if not upstream_keys:
+            _start(key)
+
+    try:
+        while running:
+            done, running = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for finished in done:
+                result = finished.result()
+                results[result.key] = result
+                if not result.succeeded:
+                    _skip_downstream(result.key)
+                    continue
+                for key in downstream[result.key]:
+                    remaining_upstream[key].discard(result.key)
+                    if not remaining_upstream[key] and key not in results:
+                        _start(key)
+    finally:
+        for pending in running:
+            pending.cancel()
+        await watcher.aclose()
+
+    results = {key: results[key] for key in nodes_by_key}
+    _log_failures(results)
+    return results
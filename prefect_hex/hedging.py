@@ -0,0 +1,229 @@
+"""
+This is a module containing the hedging policy that sends a second, identical
+request when the first one is slower than most recent requests to Hex.
+"""
+
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from prefect_hex.clients import token_fingerprint
+
+if TYPE_CHECKING:
+    from prefect_hex import HexCredentials
+
+
+@dataclass
+class HedgingStats:
+    """
+    Counters describing the decisions of a request hedger.
+
+    Attributes:
+        requests: Number of requests sent through the hedger.
+        hedged_requests: Number of requests for which a hedge was sent.
+        hedge_wins: Number of hedged requests answered by the hedge first.
+        rate_limited_hedges: Number of hedges not sent because of the hedge
+            rate cap.
+        delay_seconds: The current delay after which a hedge is sent, or None
+            while too few latencies have been recorded.
+    """
+
+    requests: int = 0
+    hedged_requests: int = 0
+    hedge_wins: int = 0
+    rate_limited_hedges: int = 0
+    delay_seconds: Optional[float] = None
+
+
+class RequestHedger:
+    """
+    Decides when to hedge a request, i.e. send an identical request while the
+    first one is still in flight and use whichever answers first, so that a
+    single stalled connection does not delay the response.
+
+    A hedge is sent once a request has been in flight longer than the
+    `percentile` of the latencies of recent requests, and at most for
+    `max_hedge_rate` of recent requests, which bounds the extra traffic.
+    No hedge is sent until `min_samples` latencies have been recorded.
+
+    Args:
+        percentile: Percentile of recent latencies after which a request
+            is hedged.
+        min_samples: Number of latencies to record before hedging.
+        window_size: Number of recent requests the latencies and the hedge
+            rate are computed over.
+        min_delay_seconds: Lower bound of the delay before a hedge.
+        max_delay_seconds: Upper bound of the delay before a hedge; unbounded
+            if None.
+        max_hedge_rate: Maximum fraction of recent requests that are hedged.
+
+    Examples:
+        Hedge status requests after their 99th percentile latency, for at
+        most 5% of requests.
+        ```python
+        from prefect_hex import HexCredentials
+        from prefect_hex.hedging import RequestHedger, set_request_hedger
+
+        hex_credentials = HexCredentials.load("hex-token")
+        set_request_hedger(
+            hex_credentials, RequestHedger(percentile=99, max_hedge_rate=0.05)
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        min_samples: int = 20,
+        window_size: int = 200,
+        min_delay_seconds: float = 0.05,
+        max_delay_seconds: Optional[float] = None,
+        max_hedge_rate: float = 0.1,
+    ):
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= max_hedge_rate <= 1:
+            raise ValueError("max_hedge_rate must be between 0 and 1")
+        if not 1 <= min_samples <= window_size:
+            raise ValueError("Expected 1 <= min_samples <= window_size")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window_size = window_size
+        self.min_delay_seconds = min_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.max_hedge_rate = max_hedge_rate
+
+        self._latencies = deque(maxlen=window_size)
+        # whether each recent request was hedged
+        self._hedged = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+        self._stats = HedgingStats()
+
+    @property
+    def stats(self) -> HedgingStats:
+        """
+        A snapshot of the counters of the hedger.
+        """
+        with self._lock:
+            return HedgingStats(
+                requests=self._stats.requests,
+                hedged_requests=self._stats.hedged_requests,
+                hedge_wins=self._stats.hedge_wins,
+                rate_limited_hedges=self._stats.rate_limited_hedges,
+                delay_seconds=self._get_delay_seconds(),
+            )
+
+    def get_delay_seconds(self) -> Optional[float]:
+        """
+        Computes how long a request may be in flight before it is hedged.
+
+        Returns:
+            The number of seconds, or None if too few latencies have been
+            recorded to hedge.
+        """
+        with self._lock:
+            return self._get_delay_seconds()
+
+    def _get_delay_seconds(self) -> Optional[float]:
+        """
+        Computes the delay before a hedge; the caller holds the lock.
+        """
+        if len(self._latencies) < self.min_samples:
+            return None
+        latencies = sorted(self._latencies)
+        index = max(math.ceil(self.percentile / 100 * len(latencies)) - 1, 0)
+        delay_seconds = max(self.min_delay_seconds, latencies[index])
+        if self.max_delay_seconds is not None:
+            delay_seconds = min(self.max_delay_seconds, delay_seconds)
+        return delay_seconds
+
+    def allows_hedge(self) -> bool:
+        """
+        Checks whether a hedge for a request that has been in flight longer
+        than the delay fits under the hedge rate cap; a refusal is counted in
+        the stats.
+
+        Returns:
+            Whether the hedge may be sent.
+        """
+        with self._lock:
+            hedged = sum(self._hedged) + 1
+            if hedged > self.max_hedge_rate * (len(self._hedged) + 1):
+                self._stats.rate_limited_hedges += 1
+                return False
+            return True
+
+    def record_hedge(self) -> None:
+        """
+        Records that a hedge was sent, counting it against the hedge rate cap.
+        """
+        with self._lock:
+            self._hedged.append(True)
+            self._stats.requests += 1
+            self._stats.hedged_requests += 1
+
+    def record(
+        self,
+        latency_seconds: Optional[float],
+        hedged: bool = False,
+        hedge_won: bool = False,
+    ) -> None:
+        """
+        Records the outcome of a request.
+
+        Args:
+            latency_seconds: Number of seconds the original request was in
+                flight until it completed, or until it was cancelled because
+                the hedge answered first; None if the request failed.
+            hedged: Whether a hedge was sent for the request, as recorded by
+                `record_hedge`.
+            hedge_won: Whether the hedge answered first.
+        """
+        with self._lock:
+            if latency_seconds is not None:
+                self._latencies.append(latency_seconds)
+            if not hedged:
+                self._hedged.append(False)
+                self._stats.requests += 1
+            self._stats.hedge_wins += hedge_won
+
+
+_REQUEST_HEDGERS: Dict[Tuple, RequestHedger] = {}
+_REQUEST_HEDGERS_LOCK = threading.Lock()
+
+
+def get_request_hedger(hex_credentials: "HexCredentials") -> RequestHedger:
+    """
+    Gets the process-wide request hedger shared by all credentials with the
+    same domain and token, creating it on first use.
+
+    Args:
+        hex_credentials: Credentials to use for authentication with Hex.
+
+    Returns:
+        The request hedger for the credentials.
+    """
+    key = (hex_credentials.domain, token_fingerprint(hex_credentials))
+    with _REQUEST_HEDGERS_LOCK:
+        request_hedger = _REQUEST_HEDGERS.get(key)
+        if request_hedger is None:
+            request_hedger = _REQUEST_HEDGERS[key] = RequestHedger()
+        return request_hedger
+
+
+def set_request_hedger(
+    hex_credentials: "HexCredentials", request_hedger: RequestHedger
+) -> None:
+    """
+    Replaces the process-wide request hedger of the credentials, e.g. to
+    hedge at a different percentile.
+
+    Args:
+        hex_credentials: Credentials to use for authentication with Hex.
+        request_hedger: The hedger to use from now on.
+    """
+    key = (hex_credentials.domain, token_fingerprint(hex_credentials))
+    with _REQUEST_HEDGERS_LOCK:
+        _REQUEST_HEDGERS[key] = request_hedger
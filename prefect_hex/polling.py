@@ -0,0 +1,214 @@
+"""
+This is a module containing strategies that decide how long to wait
+in between checks for run completion.
+"""
+
+from abc import abstractmethod
+from typing import Any, List
+
+from pydantic import VERSION as PYDANTIC_VERSION
+
+if PYDANTIC_VERSION.startswith("2."):
+    from pydantic.v1 import BaseModel, Field
+else:
+    from pydantic import BaseModel, Field
+
+
+class PollingStrategy(BaseModel):
+    """
+    Base class of the strategies deciding how long to wait before the next
+    check for run completion. Subclasses must implement `get_interval`.
+    """
+
+    @abstractmethod
+    def get_interval(self, poll_number: int, elapsed_seconds: float) -> float:
+        """
+        Computes the number of seconds to wait before the next check.
+
+        Args:
+            poll_number: The number of checks made so far, starting at 1.
+            elapsed_seconds: The number of seconds since waiting started.
+
+        Returns:
+            The number of seconds to wait.
+        """
+
+
+class FixedPolling(PollingStrategy):
+    """
+    Waits the same number of seconds in between every check.
+
+    Attributes:
+        interval_seconds: Number of seconds to wait in between checks.
+    """
+
+    interval_seconds: float = Field(
+        default=10, gt=0, description="Number of seconds to wait in between checks."
+    )
+
+    def get_interval(self, poll_number: int, elapsed_seconds: float) -> float:
+        """
+        Returns `interval_seconds`, regardless of progress.
+        """
+        return self.interval_seconds
+
+
+class ExponentialBackoffPolling(PollingStrategy):
+    """
+    Checks quickly at first, multiplying the wait after every check
+    up to a cap.
+
+    Attributes:
+        initial_seconds: Number of seconds to wait after the first check.
+        multiplier: Factor the wait grows by after every check.
+        max_seconds: Upper bound of the wait in between checks.
+    """
+
+    initial_seconds: float = Field(
+        default=1, gt=0, description="Number of seconds to wait after the first check."
+    )
+    multiplier: float = Field(
+        default=2, ge=1, description="Factor the wait grows by after every check."
+    )
+    max_seconds: float = Field(
+        default=30, gt=0, description="Upper bound of the wait in between checks."
+    )
+
+    def get_interval(self, poll_number: int, elapsed_seconds: float) -> float:
+        """
+        Returns `initial_seconds * multiplier ** (poll_number - 1)`, capped.
+        """
+        # cap the exponent so long waits don't overflow
+        exponent = min(poll_number - 1, 64)
+        return min(self.max_seconds, self.initial_seconds * self.multiplier**exponent)
+
+
+class ProportionalPolling(PollingStrategy):
+    """
+    Waits in proportion to how long the run has been waited for, so that
+    short runs are detected quickly and long runs are checked rarely.
+
+    Attributes:
+        ratio: Fraction of the elapsed time to wait before the next check.
+        min_seconds: Lower bound of the wait in between checks.
+        max_seconds: Upper bound of the wait in between checks.
+    """
+
+    ratio: float = Field(
+        default=0.1,
+        gt=0,
+        description="Fraction of the elapsed time to wait before the next check.",
+    )
+    min_seconds: float = Field(
+        default=1, gt=0, description="Lower bound of the wait in between checks."
+    )
+    max_seconds: float = Field(
+        default=60, gt=0, description="Upper bound of the wait in between checks."
+    )
+
+    def get_interval(self, poll_number: int, elapsed_seconds: float) -> float:
+        """
+        Returns `ratio * elapsed_seconds`, bounded by the min and max.
+        """
+        interval = elapsed_seconds * self.ratio
+        return min(self.max_seconds, max(self.min_seconds, interval))
+
+
+class HistoricalDurationPolling(PollingStrategy):
+    """
+    Schedules checks around the durations of past runs of the project:
+    one check when the fastest runs usually finish, checks converging
+    towards the median duration, dense checks in between the median and
+    the 90th percentile, and backing off for runs that take unusually long.
+
+    The elapsed time is measured from when waiting started, so this works best
+    when waiting starts right after the run is triggered.
+
+    Attributes:
+        p10_seconds: 10th percentile of past run durations.
+        p50_seconds: Median of past run durations.
+        p90_seconds: 90th percentile of past run durations.
+        dense_polls: Number of checks in between the median and 90th percentile.
+        min_seconds: Lower bound of the wait in between checks.
+        max_seconds: Upper bound of the wait in between checks.
+
+    Examples:
+        Build the strategy from the durations, in seconds, of past runs.
+        ```python
+        from prefect_hex.polling import HistoricalDurationPolling
+
+        strategy = HistoricalDurationPolling.from_durations([310, 290, 335, 301])
+        ```
+    """
+
+    p10_seconds: float = Field(
+        default=..., ge=0, description="10th percentile of past run durations."
+    )
+    p50_seconds: float = Field(
+        default=..., ge=0, description="Median of past run durations."
+    )
+    p90_seconds: float = Field(
+        default=..., ge=0, description="90th percentile of past run durations."
+    )
+    dense_polls: int = Field(
+        default=10,
+        ge=1,
+        description="Number of checks in between the median and 90th percentile.",
+    )
+    min_seconds: float = Field(
+        default=1, gt=0, description="Lower bound of the wait in between checks."
+    )
+    max_seconds: float = Field(
+        default=300, gt=0, description="Upper bound of the wait in between checks."
+    )
+
+    @classmethod
+    def from_durations(
+        cls, durations_seconds: List[float], **kwargs: Any
+    ) -> "HistoricalDurationPolling":
+        """
+        Builds the strategy from the durations of past runs.
+
+        Args:
+            durations_seconds: Durations of past runs in seconds.
+            **kwargs: Additional fields of the strategy.
+
+        Returns:
+            The strategy scheduled around the percentiles of the durations.
+        """
+        if not durations_seconds:
+            raise ValueError("At least one past run duration is required")
+        durations_seconds = sorted(durations_seconds)
+        return cls(
+            p10_seconds=_percentile(durations_seconds, 10),
+            p50_seconds=_percentile(durations_seconds, 50),
+            p90_seconds=_percentile(durations_seconds, 90),
+            **kwargs,
+        )
+
+    def get_interval(self, poll_number: int, elapsed_seconds: float) -> float:
+        """
+        Returns the wait until the next check of the schedule described above.
+        """
+        if elapsed_seconds < self.p10_seconds:
+            interval = self.p10_seconds - elapsed_seconds
+        elif elapsed_seconds < self.p50_seconds:
+            interval = (self.p50_seconds - elapsed_seconds) / 2
+        elif elapsed_seconds < self.p90_seconds:
+            interval = (self.p90_seconds - self.p50_seconds) / self.dense_polls
+        else:
+            interval = (elapsed_seconds - self.p90_seconds) / 2
+        return min(self.max_seconds, max(self.min_seconds, interval))
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """
+    Computes a percentile of sorted values with linear interpolation.
+    """
+    position = (len(sorted_values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (
+        fraction
+    )
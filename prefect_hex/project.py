@@ -4,9 +4,32 @@ Hex projects
 """
 
 import asyncio
-from typing import Dict, Optional, Tuple
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from uuid import uuid4
+from weakref import WeakKeyDictionary
 
+import httpx
 from prefect import flow, get_run_logger, task
+from prefect.artifacts import create_markdown_artifact
+from prefect.logging import get_logger
+from prefect.utilities.asyncutils import run_sync_in_worker_thread
 
 from prefect_hex import HexCredentials
 from prefect_hex.exceptions import (
@@ -15,7 +38,29 @@ from prefect_hex.exceptions import (
     HexProjectRunTimedOut,
 )
 from prefect_hex.models import project as models
+from prefect_hex.polling import (
+    ExponentialBackoffPolling,
+    HistoricalDurationPolling,
+    PollingStrategy,
+)
 from prefect_hex.rest import HTTPMethod, _unpack_contents, execute_endpoint
+from prefect_hex.retries import CONNECT_ERRORS
+from prefect_hex.store import HexStateStore, get_state_store
+
+logger = get_logger(__name__)
+
+IDEMPOTENCY_NAMESPACE = "idempotency"
+COMPLETED_RUNS_NAMESPACE = "completed-runs"
+UPDATE_CACHE_NAMESPACE = "update-cache"
+STATUS_CACHE_NAMESPACE = "run-status"
+TERMINAL_STATUS_NAMESPACE = "terminal-status"
+
+# in-flight update_cache runs of this process, keyed by domain and project ID
+_UPDATE_CACHE_RUNS: Dict[Tuple[str, str], models.ProjectRunResponsePayload] = {}
+# locks serializing the callers of each project, per event loop
+_UPDATE_CACHE_LOCKS: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = (
+    WeakKeyDictionary()
+)
 
 
 @task
@@ -25,6 +70,10 @@ async def run_project(
     input_params: Optional[Dict] = None,
     dry_run: bool = False,
     update_cache: bool = False,
+    idempotency_key: Optional[str] = None,
+    idempotency_window_seconds: float = 24 * 60 * 60,
+    coalesce_update_cache: bool = True,
+    coalesce_across_processes: bool = False,
 ) -> models.ProjectRunResponsePayload:  # pragma: no cover
     """
     Trigger a run of the latest published version of a project.
@@ -47,10 +96,257 @@ async def run_project(
             that have caching enabled will be re-executed as part of
             this run. Note that this cannot be set to true if custom
             input parameters are provided.
+        idempotency_key:
+            Key identifying this logical run, e.g. derived from the flow run ID,
+            so that retrying the task does not trigger a duplicate run. The run
+            triggered for the key is recorded in the local state store and
+            returned by later calls with the same key. If an earlier call was
+            interrupted before its run was recorded, after its request may have
+            reached Hex, the project's recent runs are checked for the only one
+            started while that request may have been in flight before
+            triggering again; a request rejected by Hex or that never reached
+            it is simply sent again.
+        idempotency_window_seconds:
+            Number of seconds the run recorded for an idempotency key is reused.
+        coalesce_update_cache:
+            Whether an `update_cache` run attaches to the project's
+            `update_cache` run already in flight from this process, if any,
+            instead of starting another run that rebuilds the same cache.
+        coalesce_across_processes:
+            Whether `update_cache` runs also attach to runs in flight from other
+            processes on this host, coordinated through the local state store.
 
     Returns:
         Information about the triggered project run.
     """  # noqa
+    trigger = partial(
+        _trigger_project_run,
+        project_id,
+        hex_credentials,
+        input_params,
+        dry_run,
+        update_cache,
+    )
+    if update_cache and not dry_run and coalesce_update_cache:
+        trigger = partial(
+            _coalesce_update_cache_run,
+            project_id,
+            hex_credentials,
+            trigger,
+            across_processes=coalesce_across_processes,
+        )
+
+    if idempotency_key is None:
+        return await trigger()
+
+    return await _trigger_idempotently(
+        project_id,
+        hex_credentials,
+        trigger,
+        idempotency_key,
+        idempotency_window_seconds,
+    )
+
+
+async def _trigger_idempotently(
+    project_id: str,
+    hex_credentials: HexCredentials,
+    trigger: Callable[[], Awaitable[models.ProjectRunResponsePayload]],
+    idempotency_key: str,
+    idempotency_window_seconds: float,
+    lease_seconds: float = 60,
+    lease_poll_seconds: float = 1,
+) -> models.ProjectRunResponsePayload:
+    """
+    Helper method to trigger the run of an idempotency key at most once.
+    The request is recorded before it is sent, under a lease on the key so
+    concurrent callers don't both send it, and forgotten if it definitely
+    did not start a run, so that only calls that may have reached Hex are
+    followed by a search for the run they started. The lease is renewed while
+    the request is retried, and the request is abandoned after its retry
+    budget, which bounds the start times searched.
+    """
+    store = get_state_store()
+    store_key = f"{project_id}/{idempotency_key}"
+    owner = uuid4().hex
+    while not await run_sync_in_worker_thread(
+        store.acquire_lease,
+        IDEMPOTENCY_NAMESPACE,
+        store_key,
+        owner,
+        ttl_seconds=lease_seconds,
+    ):
+        # another caller is triggering the run; attach to it once recorded
+        await asyncio.sleep(lease_poll_seconds)
+
+    try:
+        recorded = (
+            await run_sync_in_worker_thread(store.get, IDEMPOTENCY_NAMESPACE, store_key)
+            or {}
+        )
+        if "project_run" in recorded:
+            project_run = models.ProjectRunResponsePayload.parse_obj(
+                recorded["project_run"]
+            )
+            logger.info(
+                "Re-attaching to project %s run %s of idempotency key %s",
+                repr(project_id),
+                repr(project_run.run_id),
+                repr(idempotency_key),
+            )
+            return project_run
+
+        trigger_timeout_seconds = _get_trigger_timeout_seconds(hex_credentials)
+        project_run = None
+        if "requested_at" in recorded:
+            # an earlier call was interrupted, possibly after Hex started the run
+            requested_at = datetime.fromisoformat(recorded["requested_at"])
+            project_run = await _find_interrupted_project_run(
+                project_id, hex_credentials, requested_at, trigger_timeout_seconds
+            )
+
+        if project_run is None:
+            requested_at = datetime.now(timezone.utc)
+            await run_sync_in_worker_thread(
+                store.set,
+                IDEMPOTENCY_NAMESPACE,
+                store_key,
+                {"requested_at": requested_at.isoformat()},
+                ttl_seconds=idempotency_window_seconds,
+            )
+            try:
+                # bounded, so that an interrupted request's run starts within
+                # the window searched by later calls
+                async with _renewing_lease(
+                    store, IDEMPOTENCY_NAMESPACE, store_key, owner, lease_seconds
+                ):
+                    project_run = await asyncio.wait_for(
+                        trigger(), timeout=trigger_timeout_seconds
+                    )
+            except Exception as exc:
+                if _is_definitive_trigger_failure(exc):
+                    # no run was started, so a retry must not search for one
+                    await run_sync_in_worker_thread(
+                        store.delete, IDEMPOTENCY_NAMESPACE, store_key
+                    )
+                raise
+        else:
+            logger.info(
+                "Re-attaching to project %s run %s started by an interrupted call "
+                "with idempotency key %s",
+                repr(project_id),
+                repr(project_run.run_id),
+                repr(idempotency_key),
+            )
+
+        await run_sync_in_worker_thread(
+            store.set,
+            IDEMPOTENCY_NAMESPACE,
+            store_key,
+            {
+                "requested_at": requested_at.isoformat(),
+                "project_run": json.loads(project_run.json(by_alias=True)),
+            },
+            ttl_seconds=idempotency_window_seconds,
+        )
+        return project_run
+    finally:
+        await run_sync_in_worker_thread(
+            store.release_lease, IDEMPOTENCY_NAMESPACE, store_key, owner
+        )
+
+
+@asynccontextmanager
+async def _renewing_lease(
+    store: HexStateStore, namespace: str, key: str, owner: str, lease_seconds: float
+) -> AsyncIterator[None]:
+    """
+    Helper context manager to keep renewing a lease held by `owner` while the
+    body runs, so that a request retried or throttled for longer than the
+    lease does not let other callers take the lease over.
+    """
+    stopped = asyncio.Event()
+
+    async def _renew():
+        """
+        Renews the lease every third of its duration until stopped.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(stopped.wait(), timeout=lease_seconds / 3)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                renewed = await run_sync_in_worker_thread(
+                    store.acquire_lease,
+                    namespace,
+                    key,
+                    owner,
+                    ttl_seconds=lease_seconds,
+                )
+            except Exception as exc:
+                logger.warning("Failed to renew the lease of %s: %r", repr(key), exc)
+                return
+            if not renewed:
+                logger.warning(
+                    "The lease of %s was taken over by another caller", repr(key)
+                )
+                return
+
+    renewal = asyncio.ensure_future(_renew())
+    try:
+        yield
+    finally:
+        # wait for an ongoing renewal, so it can't outlive the release
+        stopped.set()
+        await renewal
+
+
+def _get_trigger_timeout_seconds(hex_credentials: HexCredentials) -> float:
+    """
+    Helper method to bound how long a trigger request may take with its
+    retries: the retry budget, or every allowed backoff if unbounded, plus one
+    attempt bounded by the client timeouts, counting unset ones as a minute.
+    """
+    attempt_seconds = sum(
+        60 if timeout is None else timeout
+        for timeout in (
+            hex_credentials.connect_timeout,
+            hex_credentials.pool_timeout,
+            hex_credentials.write_timeout,
+            hex_credentials.read_timeout,
+        )
+    )
+    retry_policy = hex_credentials.retry_policy
+    if retry_policy.budget_seconds is not None:
+        return retry_policy.budget_seconds + attempt_seconds
+    return retry_policy.max_attempts * (
+        attempt_seconds + retry_policy.backoff_max_seconds
+    )
+
+
+def _is_definitive_trigger_failure(exc: Exception) -> bool:
+    """
+    Helper method to check whether a failed trigger request certainly did not
+    start a run: it was rejected by Hex with a client error, or it never
+    reached Hex. Server errors and timeouts may come after the run started.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code < 500
+    return isinstance(exc, CONNECT_ERRORS)
+
+
+async def _trigger_project_run(
+    project_id: str,
+    hex_credentials: HexCredentials,
+    input_params: Optional[Dict],
+    dry_run: bool,
+    update_cache: bool,
+) -> models.ProjectRunResponsePayload:
+    """
+    Helper method to send the request triggering a project run.
+    """
     endpoint = f"/project/{project_id}/run"  # noqa
 
     response = await execute_endpoint.fn(
@@ -66,11 +362,356 @@ async def run_project(
     return models.ProjectRunResponsePayload.parse_obj(contents)
 
 
+async def _coalesce_update_cache_run(
+    project_id: str,
+    hex_credentials: HexCredentials,
+    trigger: Callable[[], Awaitable[models.ProjectRunResponsePayload]],
+    across_processes: bool = False,
+    lease_seconds: float = 60,
+    lease_poll_seconds: float = 1,
+) -> models.ProjectRunResponsePayload:
+    """
+    Helper method to attach to the project's `update_cache` run in flight,
+    if any, or to trigger a new one. Callers in this process are serialized by
+    a lock, so concurrent callers share a single trigger request; callers in
+    other processes are serialized by a lease on the project in the state store,
+    renewed while the trigger request is retried or throttled.
+    """
+    key = (hex_credentials.domain, project_id)
+    loop_locks = _UPDATE_CACHE_LOCKS.setdefault(asyncio.get_running_loop(), {})
+    lock = loop_locks.setdefault(key, asyncio.Lock())
+    store = get_state_store()
+    store_key = "/".join(key)
+    owner = uuid4().hex
+    finished_run_ids = set()
+
+    async with lock:
+        while True:
+            project_run = _UPDATE_CACHE_RUNS.get(key)
+            if project_run is None and across_processes:
+                recorded = await run_sync_in_worker_thread(
+                    store.get, UPDATE_CACHE_NAMESPACE, store_key
+                )
+                if recorded is not None:
+                    project_run = models.ProjectRunResponsePayload.parse_obj(recorded)
+            if project_run is not None and project_run.run_id not in finished_run_ids:
+                project_metadata = await get_run_status.fn(
+                    project_id, project_run.run_id, hex_credentials
+                )
+                if project_metadata.status in (
+                    models.ProjectRunStatus.pending,
+                    models.ProjectRunStatus.running,
+                ):
+                    logger.info(
+                        "Attaching to project %s run %s, which is already "
+                        "updating the cache",
+                        repr(project_id),
+                        repr(project_run.run_id),
+                    )
+                    return project_run
+                finished_run_ids.add(project_run.run_id)
+                _UPDATE_CACHE_RUNS.pop(key, None)
+
+            if not across_processes:
+                break
+            if await run_sync_in_worker_thread(
+                store.acquire_lease,
+                UPDATE_CACHE_NAMESPACE,
+                store_key,
+                owner,
+                ttl_seconds=lease_seconds,
+            ):
+                # another process may have recorded its run and released the
+                # lease since the store was read
+                recorded = await run_sync_in_worker_thread(
+                    store.get, UPDATE_CACHE_NAMESPACE, store_key
+                )
+                if recorded is None or recorded["runId"] in finished_run_ids:
+                    break
+                await run_sync_in_worker_thread(
+                    store.release_lease, UPDATE_CACHE_NAMESPACE, store_key, owner
+                )
+                continue
+            # another process is triggering a run; attach to it once recorded
+            await asyncio.sleep(lease_poll_seconds)
+
+        try:
+            if across_processes:
+                async with _renewing_lease(
+                    store, UPDATE_CACHE_NAMESPACE, store_key, owner, lease_seconds
+                ):
+                    project_run = await trigger()
+            else:
+                project_run = await trigger()
+            _UPDATE_CACHE_RUNS[key] = project_run
+            if across_processes:
+                await run_sync_in_worker_thread(
+                    store.set,
+                    UPDATE_CACHE_NAMESPACE,
+                    store_key,
+                    json.loads(project_run.json(by_alias=True)),
+                    ttl_seconds=24 * 60 * 60,
+                )
+        finally:
+            if across_processes:
+                await run_sync_in_worker_thread(
+                    store.release_lease, UPDATE_CACHE_NAMESPACE, store_key, owner
+                )
+        return project_run
+
+
+async def _find_interrupted_project_run(
+    project_id: str,
+    hex_credentials: HexCredentials,
+    requested_at: datetime,
+    trigger_timeout_seconds: float,
+    clock_skew_seconds: float = 5,
+) -> Optional[models.ProjectRunResponsePayload]:
+    """
+    Helper method to find the run an interrupted trigger request may have
+    started: the only recent run of the project that started while the
+    request may have been in flight and is not recorded for another
+    idempotency key. None is returned if there is no such run, or several,
+    since a run triggered by another caller must not be adopted.
+    """
+    project_runs = await get_project_runs.fn(project_id, hex_credentials, limit=100)
+    claimed_run_ids = {
+        recorded["project_run"]["runId"]
+        for recorded in (
+            await run_sync_in_worker_thread(
+                get_state_store().items, IDEMPOTENCY_NAMESPACE
+            )
+        ).values()
+        if "project_run" in recorded
+    }
+    earliest_start_time = requested_at - timedelta(seconds=clock_skew_seconds)
+    latest_start_time = requested_at + timedelta(
+        seconds=trigger_timeout_seconds + clock_skew_seconds
+    )
+    candidates = [
+        run
+        for run in project_runs.runs
+        if earliest_start_time <= run.start_time <= latest_start_time
+        and run.run_id not in claimed_run_ids
+    ]
+    if len(candidates) != 1:
+        if candidates:
+            logger.warning(
+                "Runs %s of project %s may have been started by the interrupted "
+                "request; triggering a new run instead of guessing",
+                sorted(run.run_id for run in candidates),
+                repr(project_id),
+            )
+        return None
+
+    (run,) = candidates
+    return models.ProjectRunResponsePayload(
+        projectId=run.project_id,
+        runId=run.run_id,
+        runStatusUrl=(
+            f"https://{hex_credentials.domain}/api/v1"
+            f"/project/{run.project_id}/run/{run.run_id}"
+        ),
+        runUrl=run.run_url,
+        traceId=run.trace_id,
+    )
+
+
+@dataclass
+class TerminalStatusCacheStats:
+    """
+    Counters describing the effectiveness of a terminal status cache.
+
+    Attributes:
+        hits: Number of lookups answered from memory.
+        disk_hits: Number of lookups answered from the on-disk tier.
+        misses: Number of lookups that were not answered from the cache.
+        size: Number of statuses held in memory.
+    """
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+
+class TerminalStatusCache:
+    """
+    Least recently used cache of terminal run statuses, which never change,
+    with entries expiring after a time to live and an optional on-disk tier in
+    the local state store, so statuses survive restarts and are shared by the
+    processes on a host. Non-terminal statuses are never cached.
+
+    Args:
+        max_size: Maximum number of statuses held in memory.
+        ttl_seconds: Number of seconds after which cached statuses expire.
+        persist: Whether to also keep the statuses in the local state store.
+        store: State store of the on-disk tier; defaults to the process-wide
+            store.
+
+    Examples:
+        Keep terminal statuses on disk, and check how often they are reused.
+        ```python
+        from prefect_hex.project import TerminalStatusCache, set_terminal_status_cache
+
+        cache = TerminalStatusCache(max_size=10000, persist=True)
+        set_terminal_status_cache(cache)
+        print(cache.stats.hits, cache.stats.misses)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: float = 24 * 60 * 60,
+        persist: bool = False,
+        store: Optional[HexStateStore] = None,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.persist = persist
+        self._store = store
+        # expiry and status of each run, least recently used first
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = TerminalStatusCacheStats()
+
+    @property
+    def store(self) -> HexStateStore:
+        """
+        The state store of the on-disk tier.
+        """
+        return self._store or get_state_store()
+
+    @property
+    def stats(self) -> TerminalStatusCacheStats:
+        """
+        A snapshot of the hit and miss counters of the cache.
+        """
+        with self._lock:
+            return TerminalStatusCacheStats(
+                hits=self._stats.hits,
+                disk_hits=self._stats.disk_hits,
+                misses=self._stats.misses,
+                size=len(self._entries),
+            )
+
+    def get(
+        self, domain: str, project_id: str, run_id: str
+    ) -> Optional[models.ProjectStatusResponsePayload]:
+        """
+        Gets the cached terminal status of a run.
+
+        Args:
+            domain: Domain of the Hex workspace of the run.
+            project_id: Project ID associated with the run.
+            run_id: Run ID of the run.
+
+        Returns:
+            The terminal status payload of the run, or None.
+        """
+        key = (domain, project_id, run_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, project_metadata = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return project_metadata
+                del self._entries[key]
+
+        if self.persist:
+            cached = self.store.get(TERMINAL_STATUS_NAMESPACE, "/".join(key))
+            if cached is not None:
+                project_metadata = models.ProjectStatusResponsePayload.parse_obj(cached)
+                with self._lock:
+                    self._stats.disk_hits += 1
+                    self._insert(key, project_metadata)
+                return project_metadata
+
+        with self._lock:
+            self._stats.misses += 1
+        return None
+
+    def put(
+        self, domain: str, project_metadata: models.ProjectStatusResponsePayload
+    ) -> None:
+        """
+        Caches the status of a run, if it is terminal.
+
+        Args:
+            domain: Domain of the Hex workspace of the run.
+            project_metadata: The status payload of the run.
+        """
+        if project_metadata.status not in TERMINAL_STATUS_EXCEPTIONS:
+            return
+        key = (domain, project_metadata.project_id, project_metadata.run_id)
+        with self._lock:
+            self._insert(key, project_metadata)
+        if self.persist:
+            self.store.set(
+                TERMINAL_STATUS_NAMESPACE,
+                "/".join(key),
+                json.loads(project_metadata.json(by_alias=True)),
+                ttl_seconds=self.ttl_seconds,
+            )
+
+    def clear(self) -> None:
+        """
+        Drops all statuses held in memory.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _insert(
+        self,
+        key: Tuple[str, str, str],
+        project_metadata: models.ProjectStatusResponsePayload,
+    ):
+        """
+        Inserts a status in memory, evicting the least recently used ones
+        beyond the maximum size; must be called with the lock held.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, project_metadata)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+_TERMINAL_STATUS_CACHE = TerminalStatusCache()
+
+
+def get_terminal_status_cache() -> TerminalStatusCache:
+    """
+    Gets the process-wide terminal status cache used by `get_run_status`.
+
+    Returns:
+        The process-wide `TerminalStatusCache`.
+    """
+    return _TERMINAL_STATUS_CACHE
+
+
+def set_terminal_status_cache(cache: TerminalStatusCache) -> None:
+    """
+    Replaces the process-wide terminal status cache, e.g. with one that
+    persists statuses on disk.
+
+    Args:
+        cache: The cache to use from now on.
+    """
+    global _TERMINAL_STATUS_CACHE
+    _TERMINAL_STATUS_CACHE = cache
+
+
 @task
 async def get_run_status(
     project_id: str,
     run_id: str,
     hex_credentials: HexCredentials,
+    max_cached_status_age_seconds: Optional[float] = None,
+    use_terminal_status_cache: bool = True,
+    hedge: bool = False,
 ) -> models.ProjectStatusResponsePayload:  # pragma: no cover
     """
     Get the status of a project run.
@@ -82,22 +723,158 @@ async def get_run_status(
             Run ID of the run to get the status of.
         hex_credentials:
             Credentials to use for authentication with Hex.
+        max_cached_status_age_seconds:
+            If set, the status is read through a cache in the local state
+            store shared by the processes on this host: a cached status at most
+            this many seconds old, or any cached terminal status, is returned
+            without a request, and a lease lets only one process at a time
+            fetch the status of a run while the others wait for its result.
+        use_terminal_status_cache:
+            Whether to return terminal statuses, which never change, from the
+            process-wide `TerminalStatusCache` instead of requesting them again.
+        hedge:
+            Whether to send a second request if the first one is slower than
+            most recent status requests, using whichever answers first;
+            see `execute_endpoint`.
 
     Returns:
         Information about the requested run.
     """  # noqa
+    terminal_status_cache = (
+        get_terminal_status_cache() if use_terminal_status_cache else None
+    )
+    # the on-disk tier reads the state store, off the event loop
+    run_cache_call = (
+        run_sync_in_worker_thread
+        if terminal_status_cache is not None and terminal_status_cache.persist
+        else _call
+    )
+    if terminal_status_cache is not None:
+        project_metadata = await run_cache_call(
+            terminal_status_cache.get, hex_credentials.domain, project_id, run_id
+        )
+        if project_metadata is not None:
+            return project_metadata
+
+    if max_cached_status_age_seconds is not None:
+        project_metadata = await _get_cached_run_status(
+            project_id,
+            run_id,
+            hex_credentials,
+            max_cached_status_age_seconds,
+            hedge=hedge,
+        )
+    else:
+        project_metadata = await _fetch_run_status(
+            project_id, run_id, hex_credentials, hedge=hedge
+        )
+
+    if terminal_status_cache is not None:
+        await run_cache_call(
+            terminal_status_cache.put, hex_credentials.domain, project_metadata
+        )
+    return project_metadata
+
+
+async def _call(fn: Callable, *args, **kwargs):
+    """
+    Helper method to call a function in place of `run_sync_in_worker_thread`.
+    """
+    return fn(*args, **kwargs)
+
+
+async def _fetch_run_status(
+    project_id: str,
+    run_id: str,
+    hex_credentials: HexCredentials,
+    hedge: bool = False,
+) -> models.ProjectStatusResponsePayload:
+    """
+    Helper method to request the status of a project run.
+    """
     endpoint = f"/project/{project_id}/run/{run_id}"  # noqa
 
     response = await execute_endpoint.fn(
         endpoint,
         hex_credentials,
         http_method=HTTPMethod.GET,
+        hedge=hedge,
     )
 
     contents = _unpack_contents(response)
     return models.ProjectStatusResponsePayload.parse_obj(contents)
 
 
+async def _get_cached_run_status(
+    project_id: str,
+    run_id: str,
+    hex_credentials: HexCredentials,
+    max_age_seconds: float,
+    lease_seconds: float = 10,
+    lease_poll_seconds: float = 0.1,
+    hedge: bool = False,
+) -> models.ProjectStatusResponsePayload:
+    """
+    Helper method to get the status of a project run through the status cache
+    of the state store, fetching it under a lease when the cached status is
+    missing or stale.
+    """
+    store = get_state_store()
+    store_key = f"{hex_credentials.domain}/{project_id}/{run_id}"
+    owner = uuid4().hex
+    lease_deadline = time.monotonic() + lease_seconds
+
+    while True:
+        cached = await run_sync_in_worker_thread(
+            store.get, STATUS_CACHE_NAMESPACE, store_key
+        )
+        if cached is not None:
+            project_metadata = models.ProjectStatusResponsePayload.parse_obj(
+                cached["project_metadata"]
+            )
+            # terminal statuses never change
+            if (
+                project_metadata.status in TERMINAL_STATUS_EXCEPTIONS
+                or time.time() - cached["fetched_at"] <= max_age_seconds
+            ):
+                return project_metadata
+        if await run_sync_in_worker_thread(
+            store.acquire_lease,
+            STATUS_CACHE_NAMESPACE,
+            store_key,
+            owner,
+            ttl_seconds=lease_seconds,
+        ):
+            break
+        if time.monotonic() >= lease_deadline:
+            # the lease holder is taking too long; fetch without the lease
+            owner = None
+            break
+        # another process is fetching the status; wait for its result
+        await asyncio.sleep(lease_poll_seconds)
+
+    try:
+        project_metadata = await _fetch_run_status(
+            project_id, run_id, hex_credentials, hedge=hedge
+        )
+        await run_sync_in_worker_thread(
+            store.set,
+            STATUS_CACHE_NAMESPACE,
+            store_key,
+            {
+                "fetched_at": time.time(),
+                "project_metadata": json.loads(project_metadata.json(by_alias=True)),
+            },
+            ttl_seconds=24 * 60 * 60,
+        )
+    finally:
+        if owner is not None:
+            await run_sync_in_worker_thread(
+                store.release_lease, STATUS_CACHE_NAMESPACE, store_key, owner
+            )
+    return project_metadata
+
+
 @task
 async def cancel_run(
     project_id: str,
@@ -172,6 +949,323 @@ async def get_project_runs(
     return models.ProjectRunsResponsePayload.parse_obj(contents)
 
 
+@task
+async def get_all_project_runs(
+    project_id: str,
+    hex_credentials: HexCredentials,
+    status_filter: Optional[models.ProjectRunStatus] = None,
+    page_size: int = 100,
+    max_concurrency: int = 4,
+    max_items: Optional[int] = None,
+    page_overlap: Optional[int] = None,
+) -> List[models.ProjectStatusResponsePayload]:
+    """
+    Get the full history of API-triggered runs of a project, requesting
+    several offset-based pages concurrently instead of following the next
+    page links one at a time. Requests go through the client-side rate
+    limits of the credentials.
+
+    Pages are served against different snapshots of the history, so runs
+    move to later pages as new runs arrive during the scan. Adjacent pages
+    overlap, so that runs shifted past the end of a page are still in the next
+    one; when more runs arrived in between two pages than they overlap by, the
+    seam between them is walked again serially. Runs are only returned once,
+    in the position they were first seen at.
+
+    Args:
+        project_id:
+            Project ID to get runs for.
+        hex_credentials:
+            Credentials to use for authentication with Hex.
+        status_filter:
+            Only get runs with this status.
+        page_size:
+            Number of results to fetch per page, at most 100.
+        max_concurrency:
+            Maximum number of page requests in flight.
+        max_items:
+            Maximum number of runs to get; unlimited if None.
+        page_overlap:
+            Number of runs adjacent pages overlap by; defaults to a tenth
+            of `page_size`, and at least 1 for pages of 2 runs or more.
+            With 0, runs arriving during the scan can be missed.
+
+    Returns:
+        The runs in the order returned by the API, without duplicates.
+
+    Examples:
+        Export the full run history of a project.
+        ```python
+        from prefect import flow
+        from prefect_hex import HexCredentials
+        from prefect_hex.project import get_all_project_runs
+
+        @flow
+        def export_project_runs_flow(project_id: str):
+            hex_credentials = HexCredentials.load("hex-token")
+            runs = get_all_project_runs(project_id, hex_credentials, max_concurrency=8)
+            return [run.dict(by_alias=True) for run in runs]
+        ```
+    """
+    if page_overlap is None:
+        page_overlap = min(page_size - 1, max(1, page_size // 10))
+    if not 0 <= page_overlap < page_size:
+        raise ValueError("page_overlap must be at least 0 and less than page_size")
+    stride = page_size - page_overlap
+
+    async def _get_page(page_offset: int) -> List[models.ProjectStatusResponsePayload]:
+        """
+        Gets the runs of the page starting at the given offset.
+        """
+        page = await get_project_runs.fn(
+            project_id=project_id,
+            hex_credentials=hex_credentials,
+            limit=page_size,
+            offset=page_offset,
+            status_filter=status_filter,
+        )
+        return page.runs
+
+    runs = []
+    seen_run_ids = set()
+
+    def _add(page_runs: List[models.ProjectStatusResponsePayload]):
+        """
+        Appends the runs of a page that were not seen yet.
+        """
+        for run in page_runs:
+            if run.run_id not in seen_run_ids:
+                seen_run_ids.add(run.run_id)
+                runs.append(run)
+
+    previous_offset = previous_runs = None
+    offset = 0
+    exhausted = False
+    while not exhausted:
+        offsets = [offset + stride * i for i in range(max_concurrency)]
+        pages = await asyncio.gather(
+            *(_get_page(page_offset) for page_offset in offsets)
+        )
+        for page_offset, page_runs in zip(offsets, pages):
+            run_ids = {run.run_id for run in page_runs}
+            if (
+                page_overlap
+                and previous_runs
+                and run_ids
+                and run_ids.isdisjoint(run.run_id for run in previous_runs)
+            ):
+                # more runs arrived in between the two pages than they overlap
+                # by, so runs may have shifted past the seam; walk it serially
+                seam_offset = previous_offset
+                while True:
+                    seam_runs = await _get_page(seam_offset)
+                    _add(seam_runs)
+                    if len(seam_runs) < page_size or not run_ids.isdisjoint(
+                        run.run_id for run in seam_runs
+                    ):
+                        break
+                    seam_offset += stride
+            _add(page_runs)
+            previous_offset, previous_runs = page_offset, page_runs
+            if len(page_runs) < page_size:
+                exhausted = True
+                break
+
+        if max_items is not None and len(runs) >= max_items:
+            return runs[:max_items]
+        offset = offsets[-1] + stride
+    return runs
+
+
+async def iter_project_runs(
+    project_id: str,
+    hex_credentials: HexCredentials,
+    status_filter: Optional[models.ProjectRunStatus] = None,
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+) -> AsyncIterator[models.ProjectStatusResponsePayload]:
+    """
+    Iterates over the API-triggered runs of a project, following pagination
+    automatically. The next page is fetched while the current one is being
+    consumed, and at most two pages are held in memory at a time.
+
+    Args:
+        project_id:
+            Project ID to get runs for.
+        hex_credentials:
+            Credentials to use for authentication with Hex.
+        status_filter:
+            Only yield runs with this status.
+        page_size:
+            Number of results to fetch per page, at most 100.
+        max_items:
+            Maximum number of runs to yield; unlimited if None.
+
+    Yields:
+        The status payload of each run.
+
+    Examples:
+        Sum the run time of the 1,000 most recent completed runs of a project.
+        ```python
+        from prefect import flow
+        from prefect_hex import HexCredentials
+        from prefect_hex.models.project import ProjectRunStatus
+        from prefect_hex.project import iter_project_runs
+
+        @flow
+        async def total_run_time_flow(project_id: str) -> float:
+            hex_credentials = HexCredentials.load("hex-token")
+            total_ms = 0
+            async for run in iter_project_runs(
+                project_id,
+                hex_credentials,
+                status_filter=ProjectRunStatus.completed,
+                max_items=1000,
+            ):
+                total_ms += run.elapsed_time
+            return total_ms / 1000
+        ```
+    """
+    page = await get_project_runs.fn(
+        project_id=project_id,
+        hex_credentials=hex_credentials,
+        limit=page_size,
+        status_filter=status_filter,
+    )
+
+    yielded = 0
+    while True:
+        next_page_task = None
+        if page.next_page is not None and (
+            max_items is None or yielded + len(page.runs) < max_items
+        ):
+            next_page_task = asyncio.ensure_future(
+                _get_project_runs_page(str(page.next_page), hex_credentials)
+            )
+
+        try:
+            for run in page.runs:
+                if max_items is not None and yielded >= max_items:
+                    return
+                yield run
+                yielded += 1
+        except BaseException:
+            # the consumer stopped early, e.g. by breaking out of its loop
+            if next_page_task is not None:
+                next_page_task.cancel()
+            raise
+
+        if next_page_task is None or not page.runs:
+            return
+        page = await next_page_task
+
+
+async def _get_project_runs_page(
+    url: str, hex_credentials: HexCredentials
+) -> models.ProjectRunsResponsePayload:
+    """
+    Helper method to fetch a page of project runs from a pagination URL.
+    """
+    response = await execute_endpoint.fn(url, hex_credentials)
+    contents = _unpack_contents(response)
+    return models.ProjectRunsResponsePayload.parse_obj(contents)
+
+
+class CompletedRunLedger:
+    """
+    Ledger of the latest completed run of each project and input parameter
+    value map, kept in the local state store, so that a run whose inputs
+    have not changed since a recent completed run can be skipped.
+
+    Args:
+        store: State store to keep the ledger in; defaults to the
+            process-wide store.
+        ttl_seconds: Number of seconds after which recorded runs expire.
+
+    Examples:
+        Look up a run of a project completed in the last 10 minutes.
+        ```python
+        from prefect_hex.project import CompletedRunLedger
+
+        ledger = CompletedRunLedger()
+        project_metadata = ledger.get(
+            "012345c6-b67c", {"region": "emea"}, within_seconds=600
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        store: Optional[HexStateStore] = None,
+        ttl_seconds: float = 7 * 24 * 60 * 60,
+    ):
+        self.store = store or get_state_store()
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _get_key(project_id: str, input_params: Optional[Dict]) -> str:
+        """
+        Computes the key of a project and a hash of its input parameters.
+        """
+        content = json.dumps(input_params or {}, sort_keys=True, default=str)
+        return f"{project_id}/{hashlib.sha256(content.encode()).hexdigest()}"
+
+    def get(
+        self,
+        project_id: str,
+        input_params: Optional[Dict],
+        within_seconds: float,
+    ) -> Optional[models.ProjectStatusResponsePayload]:
+        """
+        Gets the latest run of the project with the same input parameters,
+        if it completed within the given number of seconds.
+
+        Args:
+            project_id: Project ID of the run.
+            input_params: Input parameter value map of the run.
+            within_seconds: Maximum age of the completed run in seconds.
+
+        Returns:
+            The status payload of the completed run, or None.
+        """
+        recorded = self.store.get(
+            COMPLETED_RUNS_NAMESPACE, self._get_key(project_id, input_params)
+        )
+        if recorded is None:
+            return None
+        if time.time() - recorded["completed_at"] > within_seconds:
+            return None
+        return models.ProjectStatusResponsePayload.parse_obj(
+            recorded["project_metadata"]
+        )
+
+    def record(
+        self,
+        project_metadata: models.ProjectStatusResponsePayload,
+        input_params: Optional[Dict],
+    ) -> None:
+        """
+        Records a completed run of a project.
+
+        Args:
+            project_metadata: The status payload of the completed run.
+            input_params: Input parameter value map of the run.
+        """
+        if project_metadata.end_time is not None:
+            completed_at = project_metadata.end_time.timestamp()
+        else:
+            completed_at = time.time()
+        self.store.set(
+            COMPLETED_RUNS_NAMESPACE,
+            self._get_key(project_metadata.project_id, input_params),
+            {
+                "completed_at": completed_at,
+                "project_metadata": json.loads(project_metadata.json(by_alias=True)),
+            },
+            ttl_seconds=self.ttl_seconds,
+        )
+
+
 @flow
 async def trigger_project_run_and_wait_for_completion(
     project_id: str,
@@ -180,6 +1274,14 @@ async def trigger_project_run_and_wait_for_completion(
     update_cache: bool = False,
     max_wait_seconds: int = 900,
     poll_frequency_seconds: int = 10,
+    polling_strategy: Optional[PollingStrategy] = None,
+    use_historical_durations: bool = False,
+    lightweight_polling: bool = False,
+    idempotency_key: Optional[str] = None,
+    reuse_if_completed_within: Optional[float] = None,
+    use_status_service: bool = False,
+    max_cached_status_age_seconds: Optional[float] = None,
+    hedge_status_requests: bool = False,
 ) -> models.ProjectRunResponsePayload:
     """
     Flow that triggers a project run and waits for the triggered run to complete.
@@ -203,7 +1305,30 @@ async def trigger_project_run_and_wait_for_completion(
         max_wait_seconds: Maximum number of seconds to wait for the entire
             flow to complete.
         poll_frequency_seconds: Number of seconds to wait in between checks for
-            run completion.
+            run completion; the cap of the default polling strategy.
+        polling_strategy: Strategy deciding how long to wait in between checks
+            for run completion; defaults to exponential backoff from 1 second
+            up to `poll_frequency_seconds`.
+        use_historical_durations: Whether to schedule checks around the
+            durations of the project's recent completed runs, if no polling
+            strategy is given; falls back to the default strategy when the
+            project has too few completed runs.
+        lightweight_polling: Whether to check the run status with plain
+            requests instead of creating a task run for every check; a single
+            markdown artifact summarizing the checks is created at the end.
+        idempotency_key: Key identifying this logical run, so that a retry of
+            the flow re-attaches to the run triggered for the key instead of
+            triggering a duplicate; see `run_project`.
+        reuse_if_completed_within: Number of seconds within which a completed
+            run of the project with identical input parameters is returned
+            instead of triggering a new run; runs completed by this flow with
+            the option set are recorded in a local `CompletedRunLedger`.
+        use_status_service: Whether to wait through the process-wide
+            `RunStatusService` shared by all flows in the process.
+        max_cached_status_age_seconds: If set, the status is read through the
+            status cache shared by the processes on this host.
+        hedge_status_requests: Whether to hedge slow status requests;
+            see `get_run_status`.
 
     Returns:
         Information about the triggered project run.
@@ -249,11 +1374,30 @@ async def trigger_project_run_and_wait_for_completion(
     """
     logger = get_run_logger()
 
+    if reuse_if_completed_within is not None:
+        ledger = CompletedRunLedger()
+        project_metadata = await run_sync_in_worker_thread(
+            ledger.get,
+            project_id,
+            input_params,
+            within_seconds=reuse_if_completed_within,
+        )
+        if project_metadata is not None:
+            logger.info(
+                "Reusing project %s run %s, which completed with identical "
+                "input parameters within the last %s seconds",
+                repr(project_id),
+                repr(project_metadata.run_id),
+                reuse_if_completed_within,
+            )
+            return project_metadata
+
     project_run_future = await run_project.submit(
         project_id=project_id,
         hex_credentials=hex_credentials,
         input_params=input_params,
         update_cache=update_cache,
+        idempotency_key=idempotency_key,
     )
     project_run = await project_run_future.result()
     run_id = project_run.run_id
@@ -271,9 +1415,19 @@ async def trigger_project_run_and_wait_for_completion(
         hex_credentials=hex_credentials,
         max_wait_seconds=max_wait_seconds,
         poll_frequency_seconds=poll_frequency_seconds,
+        polling_strategy=polling_strategy,
+        use_historical_durations=use_historical_durations,
+        lightweight_polling=lightweight_polling,
+        use_status_service=use_status_service,
+        max_cached_status_age_seconds=max_cached_status_age_seconds,
+        hedge_status_requests=hedge_status_requests,
     )
 
     if project_status == models.ProjectRunStatus.completed:
+        if reuse_if_completed_within is not None:
+            await run_sync_in_worker_thread(
+                ledger.record, project_metadata, input_params
+            )
         return project_metadata
     else:
         raise TERMINAL_STATUS_EXCEPTIONS.get(project_status, HexProjectRunError)(
@@ -289,6 +1443,12 @@ async def wait_for_project_run_completion(
     hex_credentials: HexCredentials,
     max_wait_seconds: int = 900,
     poll_frequency_seconds: int = 10,
+    polling_strategy: Optional[PollingStrategy] = None,
+    use_historical_durations: bool = False,
+    lightweight_polling: bool = False,
+    use_status_service: bool = False,
+    max_cached_status_age_seconds: Optional[float] = None,
+    hedge_status_requests: bool = False,
 ) -> Tuple[models.ProjectRunStatus, models.ProjectStatusResponsePayload]:
     """
     Flow that waits for the triggered project run to complete.
@@ -303,7 +1463,29 @@ async def wait_for_project_run_completion(
         max_wait_seconds: Maximum number of seconds to wait for the entire
             flow to complete.
         poll_frequency_seconds: Number of seconds to wait in between checks for
-            run completion.
+            run completion; the cap of the default polling strategy.
+        polling_strategy: Strategy deciding how long to wait in between checks
+            for run completion; defaults to exponential backoff from 1 second
+            up to `poll_frequency_seconds`.
+        use_historical_durations: Whether to schedule checks around the
+            durations of the project's recent completed runs, if no polling
+            strategy is given; falls back to the default strategy when the
+            project has too few completed runs.
+        lightweight_polling: Whether to check the run status with plain
+            requests instead of creating a task run for every check; a single
+            markdown artifact summarizing the checks is created at the end.
+        use_status_service: Whether to wait through the process-wide
+            `RunStatusService`, which polls the runs of all flows in the
+            process from one background loop; the polling options of this
+            flow are ignored in favor of the service's strategy.
+        max_cached_status_age_seconds: If set, the status is read through the
+            status cache shared by the processes on this host, so flows in
+            different workers waiting on the same run don't all poll it;
+            see `get_run_status`.
+        hedge_status_requests: Whether to send a second status request when
+            one is slower than most recent ones, so a stalled request does not
+            delay detecting completion; see `get_run_status`. Not used with
+            `use_status_service`.
 
     Returns:
         The status of the project run and the metadata associated with the run.
@@ -330,36 +1512,173 @@ async def wait_for_project_run_completion(
             run_id="654321c6-b67c-1234-1b2c-66e4ad07b9f3",
         )
         ```
+
+        Check a long running project every minute or so, in proportion
+        to how long it has been running.
+        ```python
+        from prefect import flow
+        from prefect_hex import HexCredentials
+        from prefect_hex.polling import ProportionalPolling
+        from prefect_hex.project import wait_for_project_run_completion
+
+        @flow
+        def wait_for_long_project_run_completion_flow(project_id: str, run_id: str):
+            hex_credentials = HexCredentials.load("hex-token")
+            return wait_for_project_run_completion(
+                project_id=project_id,
+                run_id=run_id,
+                hex_credentials=hex_credentials,
+                max_wait_seconds=3 * 60 * 60,
+                polling_strategy=ProportionalPolling(ratio=0.05, max_seconds=120),
+            )
+        ```
     """
     logger = get_run_logger()
-    seconds_waited_for_run_completion = 0
-    wait_for = []
+    started = time.monotonic()
+    deadline = started + max_wait_seconds
 
-    while seconds_waited_for_run_completion <= max_wait_seconds:
-        project_future = await get_run_status.submit(
-            project_id=project_id,
-            run_id=run_id,
-            hex_credentials=hex_credentials,
-            wait_for=wait_for,
+    if use_status_service:
+        # imported here because the watcher depends on this module
+        from prefect_hex.watcher import get_run_status_service
+
+        try:
+            project_metadata = await get_run_status_service(hex_credentials).wait(
+                project_id, run_id, max_wait_seconds=max_wait_seconds
+            )
+        except HexProjectRunTimedOut:
+            raise HexProjectRunTimedOut(
+                f"Max wait time of {max_wait_seconds} seconds exceeded while "
+                f"waiting for project {project_id!r} run {run_id!r}"
+            ) from None
+        return project_metadata.status, project_metadata
+
+    if polling_strategy is None and use_historical_durations:
+        polling_strategy = await _get_historical_duration_polling(
+            project_id, hex_credentials
+        )
+        if polling_strategy is not None:
+            logger.info(
+                "Scheduling checks of project %s run %s around past run durations "
+                "of %.0f seconds (median) and %.0f seconds (90th percentile)",
+                repr(project_id),
+                repr(run_id),
+                polling_strategy.p50_seconds,
+                polling_strategy.p90_seconds,
+            )
+    if polling_strategy is None:
+        polling_strategy = ExponentialBackoffPolling(
+            initial_seconds=min(1, poll_frequency_seconds),
+            max_seconds=poll_frequency_seconds,
         )
-        wait_for = [project_future]
 
-        project_metadata = await project_future.result()
-        project_status = project_metadata.status
-        if project_status in TERMINAL_STATUS_EXCEPTIONS.keys():
-            return project_status, project_metadata
+    poll_number = 0
+    wait_for = []
 
+    while True:
+        if lightweight_polling:
+            project_metadata = await get_run_status.fn(
+                project_id=project_id,
+                run_id=run_id,
+                hex_credentials=hex_credentials,
+                max_cached_status_age_seconds=max_cached_status_age_seconds,
+                hedge=hedge_status_requests,
+            )
+        else:
+            project_future = await get_run_status.submit(
+                project_id=project_id,
+                run_id=run_id,
+                hex_credentials=hex_credentials,
+                max_cached_status_age_seconds=max_cached_status_age_seconds,
+                hedge=hedge_status_requests,
+                wait_for=wait_for,
+            )
+            wait_for = [project_future]
+            project_metadata = await project_future.result()
+
+        poll_number += 1
+        project_status = project_metadata.status
+        now = time.monotonic()
+        if project_status in TERMINAL_STATUS_EXCEPTIONS.keys() or now >= deadline:
+            break
+        wait_seconds = min(
+            polling_strategy.get_interval(poll_number, now - started), deadline - now
+        )
         logger.debug(
-            "Waiting on project %s run %s with sync status %s for %s seconds",
+            "Waiting on project %s run %s with sync status %s for %.1f seconds",
             repr(project_id),
             repr(run_id),
             repr(project_status.value),
-            poll_frequency_seconds,
+            wait_seconds,
+        )
+        await asyncio.sleep(wait_seconds)
+
+    if lightweight_polling:
+        await _create_polling_summary_artifact(
+            project_metadata, poll_number, time.monotonic() - started
         )
-        await asyncio.sleep(poll_frequency_seconds)
-        seconds_waited_for_run_completion += poll_frequency_seconds
+
+    if project_status in TERMINAL_STATUS_EXCEPTIONS.keys():
+        return project_status, project_metadata
 
     raise HexProjectRunTimedOut(
         f"Max wait time of {max_wait_seconds} seconds exceeded while waiting "
         f"for project {project_id!r} run {run_id!r}"
     )
+
+
+async def _create_polling_summary_artifact(
+    project_metadata: models.ProjectStatusResponsePayload,
+    polls: int,
+    seconds_waited: float,
+):
+    """
+    Helper method to record the outcome of a lightweight wait, in place of
+    the task runs that would otherwise have been created for every poll.
+    """
+    markdown = (
+        f"# Hex project run {project_metadata.run_id}\n\n"
+        f"| Project | Run | Status | Polls | Seconds waited |\n"
+        f"|---|---|---|---|---|\n"
+        f"| {project_metadata.project_id} "
+        f"| [{project_metadata.run_id}]({project_metadata.run_url}) "
+        f"| {project_metadata.status.value} | {polls} | {seconds_waited:.1f} |\n"
+    )
+    await create_markdown_artifact(
+        markdown=markdown,
+        description=f"Status polling summary of Hex run {project_metadata.run_id}",
+    )
+
+
+async def _get_historical_duration_polling(
+    project_id: str,
+    hex_credentials: HexCredentials,
+    history_size: int = 50,
+    min_history_size: int = 5,
+) -> Optional[HistoricalDurationPolling]:
+    """
+    Helper method to build a polling strategy from the durations of the
+    recent completed runs of a project, if there are enough of them and
+    they could be requested.
+    """
+    try:
+        project_runs_future = await get_project_runs.submit(
+            project_id=project_id,
+            hex_credentials=hex_credentials,
+            limit=history_size,
+            status_filter=models.ProjectRunStatus.completed,
+        )
+        project_runs = await project_runs_future.result()
+    except Exception as exc:
+        # the run itself may be fine, so wait for it with the default strategy
+        get_run_logger().warning(
+            "Could not get the past runs of project %s to schedule checks "
+            "around their durations; using the default polling strategy: %r",
+            repr(project_id),
+            exc,
+        )
+        return None
+
+    durations_seconds = [run.elapsed_time / 1000 for run in project_runs.runs]
+    if len(durations_seconds) < min_history_size:
+        return None
+    return HistoricalDurationPolling.from_durations(durations_seconds)
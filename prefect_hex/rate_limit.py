@@ -0,0 +1,298 @@
+"""
+This is a module containing the client-side rate limiter shared by all requests
+to Hex made from a process.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from prefect_hex.clients import token_fingerprint
+
+if TYPE_CHECKING:
+    from prefect_hex import HexCredentials
+
+
+class RateLimitBucket(Enum):
+    """
+    Separately budgeted classes of Hex endpoints.
+    """
+
+    TRIGGER = "trigger"
+    READ = "read"
+
+
+def get_rate_limit_bucket(http_method: str) -> RateLimitBucket:
+    """
+    Classifies a request into the budget it is drawn from; GET requests
+    draw from the read budget and all other methods, like the POST that
+    triggers a project run, from the trigger budget.
+
+    Args:
+        http_method: The lowercase HTTP method of the request.
+
+    Returns:
+        The bucket the request is drawn from.
+    """
+    if http_method == "get":
+        return RateLimitBucket.READ
+    return RateLimitBucket.TRIGGER
+
+
+@dataclass
+class RateLimitStats:
+    """
+    Counters describing how much requests have been throttled.
+
+    Attributes:
+        requests: Number of requests that acquired a token.
+        throttled_requests: Number of requests that had to wait for a token.
+        total_wait_seconds: Total number of seconds spent waiting for tokens.
+        max_wait_seconds: Longest wait for a single token.
+    """
+
+    requests: int = 0
+    throttled_requests: int = 0
+    total_wait_seconds: float = 0
+    max_wait_seconds: float = 0
+
+
+class TokenBucket:
+    """
+    Async token bucket that refills at a fixed rate.
+
+    Tokens are reserved synchronously, so concurrent callers are served in
+    the order they call `acquire`, regardless of the event loop or thread
+    they run on.
+
+    Args:
+        requests_per_minute: Rate at which tokens are refilled.
+        capacity: Maximum number of tokens that can accumulate, i.e. the
+            largest allowed burst; defaults to one second worth of tokens.
+    """
+
+    def __init__(self, requests_per_minute: float, capacity: Optional[float] = None):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be greater than 0")
+        self.rate = requests_per_minute / 60
+        self._default_capacity = capacity is None
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate)
+        self.stats = RateLimitStats()
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def requests_per_minute(self) -> float:
+        """
+        The rate at which tokens are refilled, per minute.
+        """
+        return self.rate * 60
+
+    def set_rate(self, requests_per_minute: float) -> None:
+        """
+        Changes the refill rate, keeping the tokens accumulated so far.
+
+        Args:
+            requests_per_minute: The new rate at which tokens are refilled.
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be greater than 0")
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self.rate = requests_per_minute / 60
+            if self._default_capacity:
+                self.capacity = max(1.0, self.rate)
+            self._tokens = min(self.capacity, self._tokens)
+
+    def _reserve(self) -> float:
+        """
+        Takes a token, possibly going into debt, and returns how many
+        seconds the caller has to wait until the token is available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait_seconds = max(0.0, -self._tokens / self.rate)
+
+            self.stats.requests += 1
+            if wait_seconds > 0:
+                self.stats.throttled_requests += 1
+                self.stats.total_wait_seconds += wait_seconds
+                self.stats.max_wait_seconds = max(
+                    self.stats.max_wait_seconds, wait_seconds
+                )
+        return wait_seconds
+
+    def try_acquire(self) -> bool:
+        """
+        Takes a token only if one is available right away.
+
+        Returns:
+            Whether a token was taken.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.stats.requests += 1
+        return True
+
+    async def acquire(self) -> float:
+        """
+        Waits until a token is available and takes it.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        wait_seconds = self._reserve()
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+        return wait_seconds
+
+
+class HexRateLimiter:
+    """
+    Rate limiter holding a token bucket for each budgeted class of endpoints.
+
+    Args:
+        trigger_requests_per_minute: Budget for requests that trigger or
+            modify runs; unlimited if None.
+        read_requests_per_minute: Budget for requests that read runs;
+            unlimited if None.
+    """
+
+    def __init__(
+        self,
+        trigger_requests_per_minute: Optional[float] = None,
+        read_requests_per_minute: Optional[float] = None,
+    ):
+        self.buckets: Dict[RateLimitBucket, TokenBucket] = {}
+        self.restrict(
+            trigger_requests_per_minute=trigger_requests_per_minute,
+            read_requests_per_minute=read_requests_per_minute,
+        )
+
+    def restrict(
+        self,
+        trigger_requests_per_minute: Optional[float] = None,
+        read_requests_per_minute: Optional[float] = None,
+    ) -> None:
+        """
+        Applies budgets on top of the current ones, keeping the lower budget
+        of each class of endpoints, so that the limiter honors every budget
+        configured for the quota it enforces.
+
+        Args:
+            trigger_requests_per_minute: Budget for requests that trigger or
+                modify runs; leaves the current budget unchanged if None.
+            read_requests_per_minute: Budget for requests that read runs;
+                leaves the current budget unchanged if None.
+        """
+        budgets = {
+            RateLimitBucket.TRIGGER: trigger_requests_per_minute,
+            RateLimitBucket.READ: read_requests_per_minute,
+        }
+        for name, requests_per_minute in budgets.items():
+            if requests_per_minute is None:
+                continue
+            bucket = self.buckets.get(name)
+            if bucket is None:
+                self.buckets[name] = TokenBucket(requests_per_minute)
+            elif requests_per_minute < bucket.requests_per_minute:
+                bucket.set_rate(requests_per_minute)
+
+    async def acquire(self, http_method: str) -> float:
+        """
+        Waits until the budget of the request allows it to be sent.
+
+        Args:
+            http_method: The lowercase HTTP method of the request.
+
+        Returns:
+            The number of seconds the request was throttled for.
+        """
+        bucket = self.buckets.get(get_rate_limit_bucket(http_method))
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire()
+
+    def try_acquire(self, http_method: str) -> bool:
+        """
+        Takes a token from the budget of the request only if the request can
+        be sent right away, e.g. for optional requests like hedges.
+
+        Args:
+            http_method: The lowercase HTTP method of the request.
+
+        Returns:
+            Whether the request can be sent.
+        """
+        bucket = self.buckets.get(get_rate_limit_bucket(http_method))
+        if bucket is None:
+            return True
+        return bucket.try_acquire()
+
+    @property
+    def stats(self) -> Dict[RateLimitBucket, RateLimitStats]:
+        """
+        The throttling counters of each budget.
+        """
+        return {name: bucket.stats for name, bucket in self.buckets.items()}
+
+
+_RATE_LIMITERS: Dict[Tuple, HexRateLimiter] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(hex_credentials: "HexCredentials") -> HexRateLimiter:
+    """
+    Gets the process-wide rate limiter shared by all credentials with the same
+    domain and token, which share a single quota at Hex. The limiter is created
+    from the budgets configured on the credentials on first use; when
+    credentials for the same quota configure different budgets, the lowest
+    budget of each class of endpoints applies.
+
+    Args:
+        hex_credentials: Credentials to use for authentication with Hex.
+
+    Returns:
+        The rate limiter for the credentials.
+
+    Examples:
+        Inspect how long requests have been throttled.
+        ```python
+        from prefect_hex import HexCredentials
+        from prefect_hex.rate_limit import get_rate_limiter
+
+        hex_credentials = HexCredentials.load("hex-token")
+        for bucket, stats in get_rate_limiter(hex_credentials).stats.items():
+            print(bucket.value, stats.throttled_requests, stats.total_wait_seconds)
+        ```
+    """
+    key = (hex_credentials.domain, token_fingerprint(hex_credentials))
+    with _RATE_LIMITERS_LOCK:
+        rate_limiter = _RATE_LIMITERS.get(key)
+        if rate_limiter is None:
+            rate_limiter = _RATE_LIMITERS[key] = HexRateLimiter()
+        rate_limiter.restrict(
+            trigger_requests_per_minute=hex_credentials.trigger_requests_per_minute,
+            read_requests_per_minute=hex_credentials.read_requests_per_minute,
+        )
+    return rate_limiter
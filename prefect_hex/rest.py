@@ -2,12 +2,16 @@
 This is a module containing generic REST tasks.
 """
 
+import asyncio
 import json
+import time
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
 
 import httpx
 from prefect import task
+from prefect.logging import get_logger
 from pydantic import VERSION as PYDANTIC_VERSION
 
 if PYDANTIC_VERSION.startswith("2."):
@@ -15,9 +19,24 @@ if PYDANTIC_VERSION.startswith("2."):
 else:
     from pydantic import BaseModel
 
+from prefect_hex.clients import get_client_registry, token_fingerprint
+from prefect_hex.hedging import RequestHedger, get_request_hedger
+from prefect_hex.rate_limit import HexRateLimiter, get_rate_limiter
+from prefect_hex.retries import RetryPolicy
+
 if TYPE_CHECKING:
     from prefect_hex import HexCredentials
 
+logger = get_logger(__name__)
+
+# methods whose identical in-flight requests can share a response
+SAFE_METHODS = {"get", "head", "options"}
+
+# identical in-flight requests, per event loop
+_IN_FLIGHT_REQUESTS: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = (
+    WeakKeyDictionary()
+)
+
 
 class HTTPMethod(Enum):
     """
@@ -80,6 +99,10 @@ async def execute_endpoint(
     http_method: HTTPMethod = HTTPMethod.GET,
     params: Dict[str, Any] = None,
     json: Dict[str, Any] = None,
+    use_pooled_client: bool = True,
+    retry_policy: Optional[RetryPolicy] = None,
+    coalesce: bool = True,
+    hedge: bool = False,
     **kwargs: Dict[str, Any],
 ) -> httpx.Response:
     """
@@ -91,10 +114,29 @@ async def execute_endpoint(
         http_method: Either GET, POST, PUT, DELETE, or PATCH.
         params: URL query parameters in the request.
         json: JSON serializable object to include in the body of the request.
+        use_pooled_client: Whether to send the request through the long-lived,
+            process-wide client for the credentials, reusing open connections;
+            if False, a new client is created and closed for this request.
+        retry_policy: Policy for retrying rate limited or failed requests;
+            defaults to the retry policy of the credentials. Once attempts
+            or the time budget are exhausted, the last response is returned.
+        coalesce: Whether a safe request, like a GET, that is identical to one
+            already in flight, i.e. with the same method, endpoint, params and
+            credentials, awaits the response of that request instead of being
+            sent again; requests with additional keyword arguments are never
+            coalesced. Coalesced callers share the same response object.
+        hedge: Whether to hedge a safe request, like a GET: if it has been in
+            flight longer than most recent hedged requests, an identical
+            request is sent and whichever answers first is used. The delay and
+            the share of requests hedged are set by the process-wide
+            `RequestHedger` of the credentials; see `get_request_hedger`.
         **kwargs: Additional keyword arguments to pass.
 
     Returns:
-        The httpx.Response from interacting with the endpoint.
+        The httpx.Response from interacting with the endpoint. Every attempt
+        waits on the process-wide rate limiter of the credentials; the number
+        of seconds spent waiting is reported in
+        `response.extensions["throttled_seconds"]`.
 
     Examples:
         Queries project runs for a given project ID.
@@ -126,12 +168,198 @@ async def execute_endpoint(
     if json is not None:
         kwargs["json"] = strip_kwargs(**json)
 
-    async with hex_credentials.get_client() as client:
-        response = await getattr(client, http_method)(
-            endpoint, params=stripped_params, **kwargs
+    if retry_policy is None:
+        retry_policy = hex_credentials.retry_policy
+
+    request_hedger = None
+    if hedge and http_method in SAFE_METHODS:
+        request_hedger = get_request_hedger(hex_credentials)
+
+    send = _execute_with_retries(
+        endpoint,
+        hex_credentials,
+        http_method,
+        stripped_params,
+        use_pooled_client,
+        retry_policy,
+        request_hedger,
+        **kwargs,
+    )
+    if not coalesce or http_method not in SAFE_METHODS or kwargs:
+        return await send
+
+    loop = asyncio.get_running_loop()
+    in_flight = _IN_FLIGHT_REQUESTS.setdefault(loop, {})
+    key = _get_coalescing_key(
+        endpoint,
+        hex_credentials,
+        http_method,
+        stripped_params,
+        use_pooled_client,
+        retry_policy,
+        hedge=request_hedger is not None,
+    )
+    request = in_flight.get(key)
+    if request is None:
+        request = in_flight[key] = loop.create_task(send)
+        request.add_done_callback(lambda _: in_flight.pop(key, None))
+    else:
+        send.close()
+        logger.debug(
+            "Coalescing %s %s with an identical request in flight",
+            http_method.upper(),
+            endpoint,
         )
+    # shielded, so a caller giving up does not cancel the request of the others
+    return await asyncio.shield(request)
 
-    return response
+
+def _get_coalescing_key(
+    endpoint: str,
+    hex_credentials: "HexCredentials",
+    http_method: str,
+    params: Optional[Dict[str, Any]],
+    use_pooled_client: bool,
+    retry_policy: RetryPolicy,
+    hedge: bool,
+) -> Tuple[Any, ...]:
+    """
+    Helper method to compute the key identifying identical requests, which
+    includes how they are sent, so that a caller never inherits the retries
+    or hedging of another caller's request.
+    """
+    return (
+        http_method,
+        endpoint,
+        json.dumps(params, sort_keys=True, default=str),
+        hex_credentials.domain,
+        token_fingerprint(hex_credentials),
+        use_pooled_client,
+        json.dumps(retry_policy.dict(), sort_keys=True, default=str),
+        hedge,
+    )
+
+
+async def _execute_with_retries(
+    endpoint: str,
+    hex_credentials: "HexCredentials",
+    http_method: str,
+    params: Optional[Dict[str, Any]],
+    use_pooled_client: bool,
+    retry_policy: RetryPolicy,
+    request_hedger: Optional[RequestHedger] = None,
+    **kwargs: Dict[str, Any],
+) -> httpx.Response:
+    """
+    Helper method to send a request under the rate limiter, retrying it
+    according to the retry policy and hedging every attempt if a hedger
+    is given.
+    """
+    rate_limiter = get_rate_limiter(hex_credentials)
+    throttled_seconds = 0.0
+
+    started = time.monotonic()
+    attempt = 1
+    while True:
+        throttled_seconds += await rate_limiter.acquire(http_method)
+
+        response = error = None
+        try:
+            if request_hedger is not None:
+                response = await _send_hedged_request(
+                    endpoint,
+                    hex_credentials,
+                    http_method,
+                    request_hedger,
+                    rate_limiter,
+                    params=params,
+                    use_pooled_client=use_pooled_client,
+                    **kwargs,
+                )
+            else:
+                response = await _send_request(
+                    endpoint,
+                    hex_credentials,
+                    http_method,
+                    params=params,
+                    use_pooled_client=use_pooled_client,
+                    **kwargs,
+                )
+        except httpx.TransportError as exc:
+            if attempt >= retry_policy.max_attempts or not (
+                retry_policy.is_retryable_error(http_method, exc)
+            ):
+                raise
+            error, reason = exc, repr(exc)
+        else:
+            response.extensions["throttled_seconds"] = throttled_seconds
+            if attempt >= retry_policy.max_attempts or not (
+                retry_policy.is_retryable_status(http_method, response.status_code)
+            ):
+                _log_throttling(http_method, endpoint, throttled_seconds)
+                return response
+            reason = f"status {response.status_code}"
+
+        backoff_seconds = retry_policy.get_backoff_seconds(attempt, response)
+        elapsed_seconds = time.monotonic() - started
+        if (
+            retry_policy.budget_seconds is not None
+            and elapsed_seconds + backoff_seconds > retry_policy.budget_seconds
+        ):
+            logger.debug(
+                "Not retrying %s %s after %s; retry budget of %s seconds exhausted",
+                http_method.upper(),
+                endpoint,
+                reason,
+                retry_policy.budget_seconds,
+            )
+            _log_throttling(http_method, endpoint, throttled_seconds)
+            if error is not None:
+                raise error
+            return response
+
+        logger.debug(
+            "Attempt %s of %s %s failed with %s; retrying in %.2f seconds",
+            attempt,
+            http_method.upper(),
+            endpoint,
+            reason,
+            backoff_seconds,
+        )
+        await asyncio.sleep(backoff_seconds)
+        attempt += 1
+
+
+def _log_throttling(http_method: str, endpoint: str, throttled_seconds: float):
+    """
+    Helper method to report how long a request waited on the rate limiter.
+    """
+    if throttled_seconds > 0:
+        logger.debug(
+            "%s %s was throttled for %.2f seconds by the client-side rate limit",
+            http_method.upper(),
+            endpoint,
+            throttled_seconds,
+        )
+
+
+async def _send_request(
+    endpoint: str,
+    hex_credentials: "HexCredentials",
+    http_method: str,
+    use_pooled_client: bool = True,
+    **kwargs: Dict[str, Any],
+) -> httpx.Response:
+    """
+    Helper method to send a single request, through the pooled client
+    for the credentials or through a new client.
+    """
+    if use_pooled_client:
+        client = await get_client_registry().get_client(hex_credentials)
+        return await getattr(client, http_method)(endpoint, **kwargs)
+
+    async with hex_credentials.get_client() as client:
+        return await getattr(client, http_method)(endpoint, **kwargs)
 
 
 def _unpack_contents(response: httpx.Response) -> Union[Dict[str, Any], bytes]:
@@ -150,3 +378,80 @@ def _unpack_contents(response: httpx.Response) -> Union[Dict[str, Any], bytes]:
         return response.json()
     except json.JSONDecodeError:
         return response.content
+
+
+async def _send_hedged_request(
+    endpoint: str,
+    hex_credentials: "HexCredentials",
+    http_method: str,
+    request_hedger: RequestHedger,
+    rate_limiter: HexRateLimiter,
+    **kwargs: Dict[str, Any],
+) -> httpx.Response:
+    """
+    Helper method to send a request and, if it is still in flight after the
+    delay of the hedger, an identical hedge, returning the first response.
+    Hedges are only sent if the rate limiter has a token available right away.
+    """
+    started = time.monotonic()
+    primary = asyncio.ensure_future(
+        _send_request(endpoint, hex_credentials, http_method, **kwargs)
+    )
+    finished = []
+    primary.add_done_callback(lambda _: finished.append(time.monotonic()))
+    pending = {primary}
+    hedge = None
+    try:
+        delay_seconds = request_hedger.get_delay_seconds()
+        if delay_seconds is not None:
+            await asyncio.wait(pending, timeout=delay_seconds)
+            if (
+                not primary.done()
+                and request_hedger.allows_hedge()
+                and rate_limiter.try_acquire(http_method)
+            ):
+                request_hedger.record_hedge()
+                logger.debug(
+                    "%s %s in flight for over %.2f seconds; sending a hedge",
+                    http_method.upper(),
+                    endpoint,
+                    delay_seconds,
+                )
+                hedge = asyncio.ensure_future(
+                    _send_request(endpoint, hex_credentials, http_method, **kwargs)
+                )
+                pending.add(hedge)
+
+        failed = []
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for request in done:
+                if request.exception() is not None:
+                    failed.append(request)
+                    continue
+                # the latency of the original request, censored when the hedge
+                # answered first, so that slow requests keep the delay high
+                latency_seconds = (
+                    finished[0] if finished else time.monotonic()
+                ) - started
+                request_hedger.record(
+                    latency_seconds,
+                    hedged=hedge is not None,
+                    hedge_won=request is hedge,
+                )
+                return request.result()
+
+        request_hedger.record(None, hedged=hedge is not None)
+        # surface the error of the original request, as without hedging
+        raise (primary if primary in failed else failed[0]).exception()
+    finally:
+        for request in (primary, hedge):
+            if request is None:
+                continue
+            if not request.done():
+                request.cancel()
+            elif not request.cancelled():
+                # retrieves the error of a losing request so it is not logged
+                request.exception()
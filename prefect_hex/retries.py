@@ -0,0 +1,202 @@
+"""
+This is a module containing the retry policy used when executing REST endpoints.
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Optional, Union
+
+import httpx
+from pydantic import VERSION as PYDANTIC_VERSION
+
+if PYDANTIC_VERSION.startswith("2."):
+    from pydantic.v1 import BaseModel, Field
+else:
+    from pydantic import BaseModel, Field
+
+IDEMPOTENT_METHODS = {"get", "head", "options", "put", "delete"}
+
+# errors raised before the request could have reached Hex
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# errors raised after the request may have been processed by Hex
+TRANSPORT_ERRORS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+
+class RetryPolicy(BaseModel):
+    """
+    Policy describing which failed requests to retry and how long to wait
+    in between attempts.
+
+    Status rules are either exact status codes, e.g. `429`, or status
+    classes, e.g. `"5xx"`. Requests with non-idempotent methods, like the POST
+    that triggers a project run, are only retried on the statuses in
+    `non_idempotent_retry_statuses` and on connection errors, where the
+    request is known not to have been processed, so that a retry cannot
+    trigger a duplicate run.
+
+    Attributes:
+        max_attempts: Maximum number of attempts, including the first one;
+            1 disables retries.
+        backoff_base_seconds: Base delay of the exponential backoff.
+        backoff_max_seconds: Upper bound of a single backoff delay.
+        budget_seconds: Overall time budget for all attempts of a request;
+            no retry is scheduled if it would exceed the budget.
+        retry_statuses: Status rules retried for idempotent methods.
+        non_idempotent_retry_statuses: Status rules retried for
+            non-idempotent methods.
+        retry_on_transport_errors: Whether to retry connection errors, and
+            for idempotent methods, timeouts and network errors.
+        respect_retry_after: Whether to wait for the delay requested through
+            the `Retry-After` response header instead of the backoff delay.
+
+    Examples:
+        Retry rate limited and failed requests up to 6 times in 5 minutes.
+        ```python
+        from prefect_hex import HexCredentials
+        from prefect_hex.retries import RetryPolicy
+
+        hex_credentials = HexCredentials(
+            token="a1b2c3d4",
+            retry_policy=RetryPolicy(
+                max_attempts=6, retry_statuses=[429, "5xx"], budget_seconds=300
+            ),
+        )
+        ```
+    """
+
+    max_attempts: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of attempts, including the first one.",
+    )
+    backoff_base_seconds: float = Field(
+        default=0.5, ge=0, description="Base delay of the exponential backoff."
+    )
+    backoff_max_seconds: float = Field(
+        default=30, ge=0, description="Upper bound of a single backoff delay."
+    )
+    budget_seconds: Optional[float] = Field(
+        default=120,
+        ge=0,
+        description="Overall time budget for all attempts of a request.",
+    )
+    retry_statuses: List[Union[int, str]] = Field(
+        default=[429, 502, 503, 504],
+        description="Status codes or classes, like '5xx', retried for idempotent "
+        "methods.",
+    )
+    non_idempotent_retry_statuses: List[Union[int, str]] = Field(
+        default=[429],
+        description="Status codes or classes retried for non-idempotent methods.",
+    )
+    retry_on_transport_errors: bool = Field(
+        default=True, description="Whether to retry connection and network errors."
+    )
+    respect_retry_after: bool = Field(
+        default=True,
+        description="Whether to honor the delay requested by a Retry-After header.",
+    )
+
+    def is_retryable_status(self, http_method: str, status_code: int) -> bool:
+        """
+        Checks whether a response with the given status should be retried.
+
+        Args:
+            http_method: The lowercase HTTP method of the request.
+            status_code: The status code of the response.
+
+        Returns:
+            Whether the request should be retried.
+        """
+        if http_method in IDEMPOTENT_METHODS:
+            rules = self.retry_statuses
+        else:
+            rules = self.non_idempotent_retry_statuses
+        return any(_matches_status_rule(status_code, rule) for rule in rules)
+
+    def is_retryable_error(self, http_method: str, exc: Exception) -> bool:
+        """
+        Checks whether a request that raised the given error should be retried.
+
+        Args:
+            http_method: The lowercase HTTP method of the request.
+            exc: The error raised while sending the request.
+
+        Returns:
+            Whether the request should be retried.
+        """
+        if not self.retry_on_transport_errors:
+            return False
+        if isinstance(exc, CONNECT_ERRORS):
+            return True
+        return http_method in IDEMPOTENT_METHODS and isinstance(exc, TRANSPORT_ERRORS)
+
+    def get_backoff_seconds(
+        self, attempt: int, response: Optional[httpx.Response] = None
+    ) -> float:
+        """
+        Computes the delay before the next attempt, using capped exponential
+        backoff with full jitter, or the `Retry-After` header of the response.
+
+        Args:
+            attempt: The number of the attempt that failed, starting at 1.
+            response: The response of the failed attempt, if any.
+
+        Returns:
+            The number of seconds to wait before the next attempt.
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response)
+            if retry_after is not None:
+                return retry_after
+
+        exponential = self.backoff_base_seconds * 2 ** (attempt - 1)
+        return random.uniform(0, min(self.backoff_max_seconds, exponential))
+
+
+def _matches_status_rule(status_code: int, rule: Union[int, str]) -> bool:
+    """
+    Checks whether a status code matches a rule like `503` or `"5xx"`.
+    """
+    if isinstance(rule, int):
+        return status_code == rule
+    rule = rule.lower()
+    if rule.endswith("xx"):
+        return str(status_code).startswith(rule[:-2])
+    return str(status_code) == rule
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Parses the `Retry-After` header of a response, which is either a
+    number of seconds or an HTTP date.
+
+    Args:
+        response: The response to parse the header of.
+
+    Returns:
+        The number of seconds to wait, or None if the header is missing
+        or invalid.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is None:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
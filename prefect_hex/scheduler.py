@@ -0,0 +1,304 @@
+"""
+This is a module containing a scheduler that dispatches queued Hex project
+runs in priority order under global, per-project and per-tag concurrency caps.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from prefect_hex import HexCredentials
+from prefect_hex.batch import ProjectRunSpec, _get_logger, _trigger_and_wait
+from prefect_hex.polling import PollingStrategy
+from prefect_hex.watcher import ProjectRunWatcher
+
+
+@dataclass
+class SchedulerStats:
+    """
+    Counters describing the queue of a scheduler.
+
+    Attributes:
+        queued: Number of runs waiting to be dispatched.
+        running: Number of runs dispatched and not yet finished.
+        dispatched: Number of runs dispatched so far.
+        queued_by_priority: Number of runs waiting, by priority.
+        total_wait_seconds: Total number of seconds dispatched runs waited
+            in the queue.
+        max_wait_seconds: Longest wait of a dispatched run in the queue.
+        max_wait_seconds_by_priority: Longest wait of a dispatched run in the
+            queue, by priority.
+    """
+
+    queued: int = 0
+    running: int = 0
+    dispatched: int = 0
+    queued_by_priority: Dict[int, int] = field(default_factory=dict)
+    total_wait_seconds: float = 0
+    max_wait_seconds: float = 0
+    max_wait_seconds_by_priority: Dict[int, float] = field(default_factory=dict)
+
+
+@dataclass(order=True)
+class _QueuedRun:
+    """
+    A queued run, ordered by priority and then by submission order.
+    """
+
+    priority: int
+    sequence: int
+    spec: ProjectRunSpec = field(compare=False)
+    tags: Tuple[str, ...] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    queued: float = field(compare=False)
+
+
+class ProjectRunScheduler:
+    """
+    Queues project runs and dispatches them in priority order, lowest priority
+    number first and first in, first out within a priority, keeping at most
+    `max_concurrency` runs live overall and at most the configured number of
+    runs live per project and per tag. A run whose project or tags are at their
+    cap is skipped over, so capped bulk work never holds up other runs.
+
+    A dispatched run is triggered and counts against the caps until it reaches
+    a terminal status, waited for through one `ProjectRunWatcher`.
+    The scheduler is bound to the event loop it is first used on.
+
+    Args:
+        hex_credentials: Credentials to use for authentication with Hex.
+        max_concurrency: Maximum number of runs live at a time.
+        project_concurrency: Maximum number of runs live at a time per
+            project ID; projects not listed are only bound by `max_concurrency`.
+        tag_concurrency: Maximum number of runs live at a time per tag.
+        max_wait_seconds: Maximum number of seconds to wait for each run
+            to complete once dispatched.
+        polling_strategy: Strategy deciding how long to wait in between checks
+            for run completion.
+
+    Examples:
+        Keep a backfill from delaying dashboard refreshes.
+        ```python
+        from prefect_hex import HexCredentials
+        from prefect_hex.batch import ProjectRunSpec
+        from prefect_hex.scheduler import ProjectRunScheduler
+
+        async def example(project_id, days):
+            scheduler = ProjectRunScheduler(
+                HexCredentials.load("hex-token"),
+                max_concurrency=20,
+                tag_concurrency={"backfill": 15},
+            )
+            backfill = [
+                scheduler.submit(
+                    ProjectRunSpec(
+                        project_id=project_id, input_params={"day": day}, key=day
+                    ),
+                    priority=10,
+                    tags=["backfill"],
+                )
+                for day in days
+            ]
+            refresh = scheduler.submit(
+                ProjectRunSpec(project_id=project_id, update_cache=True), priority=0
+            )
+            print((await refresh).succeeded, scheduler.stats)
+            await scheduler.join()
+            await scheduler.aclose()
+        ```
+    """
+
+    def __init__(
+        self,
+        hex_credentials: HexCredentials,
+        max_concurrency: int = 10,
+        project_concurrency: Optional[Dict[str, int]] = None,
+        tag_concurrency: Optional[Dict[str, int]] = None,
+        max_wait_seconds: Optional[float] = 900,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ):
+        self.hex_credentials = hex_credentials
+        self.max_concurrency = max_concurrency
+        self.project_concurrency = project_concurrency or {}
+        self.tag_concurrency = tag_concurrency or {}
+        self.max_wait_seconds = max_wait_seconds
+        self._watcher = ProjectRunWatcher(
+            hex_credentials,
+            polling_strategy=polling_strategy,
+            max_concurrency=max_concurrency,
+        )
+
+        self._queue: List[_QueuedRun] = []
+        self._sequence = itertools.count()
+        self._running: Dict[asyncio.Task, _QueuedRun] = {}
+        self._running_by_project: Counter = Counter()
+        self._running_by_tag: Counter = Counter()
+        self._stats = SchedulerStats()
+
+    @property
+    def stats(self) -> SchedulerStats:
+        """
+        A snapshot of the queue depth and wait time metrics of the scheduler.
+        """
+        return SchedulerStats(
+            queued=len(self._queue),
+            running=len(self._running),
+            dispatched=self._stats.dispatched,
+            queued_by_priority=dict(
+                sorted(Counter(queued.priority for queued in self._queue).items())
+            ),
+            total_wait_seconds=self._stats.total_wait_seconds,
+            max_wait_seconds=self._stats.max_wait_seconds,
+            max_wait_seconds_by_priority=dict(
+                sorted(self._stats.max_wait_seconds_by_priority.items())
+            ),
+        )
+
+    def submit(
+        self,
+        project_run_spec: Union[ProjectRunSpec, Dict[str, Any]],
+        priority: int = 0,
+        tags: Iterable[str] = (),
+    ) -> asyncio.Future:
+        """
+        Queues a project run.
+
+        Args:
+            project_run_spec: Specification of the run to trigger.
+            priority: Priority of the run; runs with a lower number are
+                dispatched first.
+            tags: Tags of the run, whose concurrency caps the run counts against.
+
+        Returns:
+            A future resolving to the `ProjectRunResult` of the run once it
+            reached a terminal status or failed.
+        """
+        if not isinstance(project_run_spec, ProjectRunSpec):
+            project_run_spec = ProjectRunSpec.parse_obj(project_run_spec)
+        queued = _QueuedRun(
+            priority=priority,
+            sequence=next(self._sequence),
+            spec=project_run_spec,
+            tags=tuple(tags),
+            future=asyncio.get_running_loop().create_future(),
+            queued=time.monotonic(),
+        )
+        heapq.heappush(self._queue, queued)
+        self._dispatch()
+        return queued.future
+
+    async def join(self) -> None:
+        """
+        Waits until all queued and running runs have finished.
+        """
+        while True:
+            # drops cancelled runs from the queue
+            self._dispatch()
+            if not self._queue and not self._running:
+                return
+            await asyncio.gather(
+                *(queued.future for queued in self._queue),
+                *self._running,
+                return_exceptions=True,
+            )
+
+    async def aclose(self) -> None:
+        """
+        Cancels the queued and running runs, without cancelling the runs
+        already triggered in Hex, and stops waiting for them.
+        """
+        for queued in self._queue:
+            queued.future.cancel()
+        self._queue.clear()
+        for task in self._running:
+            task.cancel()
+        await asyncio.gather(*self._running, return_exceptions=True)
+        await self._watcher.aclose()
+
+    def _can_dispatch(self, queued: _QueuedRun) -> bool:
+        """
+        Checks whether a run fits under its project and tag caps.
+        """
+        project_id = queued.spec.project_id
+        if project_id in self.project_concurrency and (
+            self._running_by_project[project_id] >= self.project_concurrency[project_id]
+        ):
+            return False
+        return all(
+            self._running_by_tag[tag] < self.tag_concurrency[tag]
+            for tag in queued.tags
+            if tag in self.tag_concurrency
+        )
+
+    def _dispatch(self):
+        """
+        Starts the queued runs with the highest priority that fit under the
+        caps, until the overall cap is reached.
+        """
+        if len(self._running) >= self.max_concurrency:
+            return
+        removed = []
+        for queued in sorted(self._queue):
+            if len(self._running) >= self.max_concurrency:
+                break
+            if queued.future.cancelled():
+                removed.append(queued)
+            elif self._can_dispatch(queued):
+                removed.append(queued)
+                self._start(queued)
+        if removed:
+            removed_ids = {id(queued) for queued in removed}
+            self._queue = [
+                queued for queued in self._queue if id(queued) not in removed_ids
+            ]
+            heapq.heapify(self._queue)
+
+    def _start(self, queued: _QueuedRun):
+        """
+        Starts a queued run and records how long it waited.
+        """
+        wait_seconds = time.monotonic() - queued.queued
+        self._stats.dispatched += 1
+        self._stats.total_wait_seconds += wait_seconds
+        self._stats.max_wait_seconds = max(self._stats.max_wait_seconds, wait_seconds)
+        by_priority = self._stats.max_wait_seconds_by_priority
+        by_priority[queued.priority] = max(
+            by_priority.get(queued.priority, 0), wait_seconds
+        )
+
+        self._running_by_project[queued.spec.project_id] += 1
+        for tag in queued.tags:
+            self._running_by_tag[tag] += 1
+        task = asyncio.ensure_future(
+            _trigger_and_wait(
+                queued.spec,
+                self.hex_credentials,
+                self._watcher,
+                self.max_wait_seconds,
+                _get_logger(),
+            )
+        )
+        self._running[task] = queued
+        task.add_done_callback(self._finish)
+
+    def _finish(self, task: asyncio.Task):
+        """
+        Resolves the future of a finished run and dispatches the next runs.
+        """
+        queued = self._running.pop(task)
+        self._running_by_project[queued.spec.project_id] -= 1
+        for tag in queued.tags:
+            self._running_by_tag[tag] -= 1
+
+        if not queued.future.done():
+            if task.cancelled():
+                queued.future.cancel()
+            elif task.exception() is not None:
+                queued.future.set_exception(task.exception())
+            else:
+                queued.future.set_result(task.result())
+        self._dispatch()
@@ -0,0 +1,268 @@
+"""
+This is a module containing a small local state store, shared by the
+processes on a host, used to persist checkpoints and caches of Hex runs.
+"""
+
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+from prefect.settings import PREFECT_HOME
+
+
+class HexStateStore:
+    """
+    JSON key-value store backed by a SQLite file, partitioned into namespaces,
+    with optional expiry of entries and leases that let one process at a time
+    own a key. SQLite's file locking makes the store safe to share between
+    processes on the same host; the file is in WAL mode, so reads don't wait
+    for writers.
+
+    The methods of the store block on file I/O and locks; from async code,
+    call them in a worker thread, e.g. with
+    `prefect.utilities.asyncutils.run_sync_in_worker_thread`.
+
+    Args:
+        path: Path of the SQLite file; defaults to `prefect-hex.db` in the
+            Prefect home directory.
+        purge_interval_seconds: Minimum number of seconds in between purges of
+            expired values and leases, run as part of `set`.
+
+    Examples:
+        Persist a value for a day.
+        ```python
+        from prefect_hex.store import HexStateStore
+
+        store = HexStateStore("/tmp/prefect-hex.db")
+        store.set("example", "key", {"run_id": "1234"}, ttl_seconds=86400)
+        store.get("example", "key")
+        ```
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        purge_interval_seconds: float = 600,
+    ):
+        if path is None:
+            path = Path(PREFECT_HOME.value()) / "prefect-hex.db"
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.purge_interval_seconds = purge_interval_seconds
+        self._last_purge = time.monotonic()
+
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            # the journal mode is persistent and can't change in a transaction
+            connection.execute("PRAGMA journal_mode=WAL")
+        finally:
+            connection.close()
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "expires_at REAL, PRIMARY KEY (namespace, key))"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, owner TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+
+    @contextmanager
+    def _connect(self, write: bool = True) -> Iterator[sqlite3.Connection]:
+        """
+        Opens a connection that commits on success and rolls back on error.
+        Write transactions take the write lock upfront; read transactions
+        don't take it at all.
+        """
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            connection.execute("BEGIN IMMEDIATE" if write else "BEGIN DEFERRED")
+            yield connection
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        Gets the value stored for a key, if any and not expired.
+
+        Args:
+            namespace: Namespace of the key.
+            key: Key to get the value of.
+
+        Returns:
+            The stored value, or None.
+        """
+        with self._connect(write=False) as connection:
+            row = connection.execute(
+                "SELECT value FROM entries WHERE namespace = ? AND key = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Stores a JSON serializable value for a key, replacing any existing value,
+        and purges expired values and leases if the purge interval elapsed.
+
+        Args:
+            namespace: Namespace of the key.
+            key: Key to store the value for.
+            value: JSON serializable value to store.
+            ttl_seconds: Number of seconds after which the value expires;
+                never expires if None.
+        """
+        expires_at = time.time() + ttl_seconds if ttl_seconds is not None else None
+        purge = time.monotonic() - self._last_purge >= self.purge_interval_seconds
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (namespace, key, json.dumps(value), expires_at),
+            )
+            if purge:
+                self._purge_expired(connection)
+
+    def delete(self, namespace: str, key: str) -> None:
+        """
+        Deletes the value stored for a key, if any.
+
+        Args:
+            namespace: Namespace of the key.
+            key: Key to delete the value of.
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+
+    def items(self, namespace: str) -> Dict[str, Any]:
+        """
+        Gets all values of a namespace that have not expired.
+
+        Args:
+            namespace: Namespace to get the values of.
+
+        Returns:
+            The stored values, keyed by their keys.
+        """
+        with self._connect(write=False) as connection:
+            rows = connection.execute(
+                "SELECT key, value FROM entries WHERE namespace = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, time.time()),
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def purge_expired(self) -> int:
+        """
+        Deletes all expired values and leases.
+
+        Returns:
+            The number of deleted values.
+        """
+        with self._connect() as connection:
+            return self._purge_expired(connection)
+
+    def _purge_expired(self, connection: sqlite3.Connection) -> int:
+        """
+        Deletes all expired values and leases in the transaction of the
+        given connection.
+        """
+        now = time.time()
+        self._last_purge = time.monotonic()
+        deleted = connection.execute(
+            "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,),
+        ).rowcount
+        connection.execute("DELETE FROM leases WHERE expires_at <= ?", (now,))
+        return deleted
+
+    def acquire_lease(
+        self, namespace: str, key: str, owner: str, ttl_seconds: float
+    ) -> bool:
+        """
+        Acquires or renews the lease of a key, unless another owner holds an
+        unexpired lease on it.
+
+        Args:
+            namespace: Namespace of the key.
+            key: Key to lease.
+            owner: Unique identifier of the caller.
+            ttl_seconds: Number of seconds after which the lease expires,
+                so that crashed owners don't hold keys forever.
+
+        Returns:
+            Whether the caller now holds the lease.
+        """
+        now = time.time()
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT owner, expires_at FROM leases WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is not None and row[0] != owner and row[1] > now:
+                return False
+            connection.execute(
+                "INSERT OR REPLACE INTO leases (namespace, key, owner, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (namespace, key, owner, now + ttl_seconds),
+            )
+        return True
+
+    def release_lease(self, namespace: str, key: str, owner: str) -> None:
+        """
+        Releases the lease of a key, if held by the caller.
+
+        Args:
+            namespace: Namespace of the key.
+            key: Key to release.
+            owner: Unique identifier of the caller.
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM leases WHERE namespace = ? AND key = ? AND owner = ?",
+                (namespace, key, owner),
+            )
+
+
+_STATE_STORE: Optional[HexStateStore] = None
+
+
+def get_state_store() -> HexStateStore:
+    """
+    Gets the process-wide state store, creating it on first use.
+
+    Returns:
+        The process-wide `HexStateStore`.
+    """
+    global _STATE_STORE
+    if _STATE_STORE is None:
+        _STATE_STORE = HexStateStore()
+    return _STATE_STORE
+
+
+def set_state_store(store: HexStateStore) -> None:
+    """
+    Replaces the process-wide state store, e.g. to keep it on a different path.
+
+    Args:
+        store: The store to use from now on.
+    """
+    global _STATE_STORE
+    _STATE_STORE = store
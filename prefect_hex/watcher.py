@@ -0,0 +1,696 @@
+"""
+This is a module containing a watcher that polls many Hex project runs
+from a single scheduling loop.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from prefect import flow, get_run_logger
+
+from prefect_hex import HexCredentials
+from prefect_hex.clients import token_fingerprint
+from prefect_hex.exceptions import (
+    TERMINAL_STATUS_EXCEPTIONS,
+    HexProjectRunError,
+    HexProjectRunTimedOut,
+)
+from prefect_hex.models import project as models
+from prefect_hex.polling import (
+    ExponentialBackoffPolling,
+    FixedPolling,
+    PollingStrategy,
+)
+from prefect_hex.project import get_project_runs, get_run_status
+
+
+@dataclass
+class _WatchedRun:
+    """
+    A run being watched, when it is due for its next check and the callers
+    waiting for it.
+    """
+
+    project_id: str
+    run_id: str
+    started: float
+    next_poll: float
+    # pairs of future and monotonic deadline, if any, of each caller
+    waiters: List[Tuple[asyncio.Future, Optional[float]]] = field(default_factory=list)
+    polls: int = 0
+
+
+class ProjectRunWatcher:
+    """
+    Polls the status of many project runs from one loop with bounded
+    concurrency, instead of one poll loop and one task run per poll for
+    every watched run. Status requests go straight through the REST
+    layer, so they share the pooled client, retries and rate limits.
+
+    Watching the same run more than once costs a single poll per cycle.
+    The watcher is bound to the event loop it is first used on.
+
+    Args:
+        hex_credentials: Credentials to use for authentication with Hex.
+        poll_frequency_seconds: Number of seconds to wait in between checks
+            of a run, if no polling strategy is given.
+        max_concurrency: Maximum number of status requests in flight.
+        polling_strategy: Strategy deciding how long to wait in between checks
+            of a run, based on how long that run has been watched for.
+        bulk_refresh_threshold: Minimum number of due runs of the same project
+            for which their statuses are refreshed in bulk, by fetching the
+            project's pending and running runs pages, instead of one request
+            per run; runs missing from those pages are fetched individually.
+            Bulk refreshes are disabled if None.
+        max_cached_status_age_seconds: If set, individual statuses are read
+            through the status cache shared by the processes on this host;
+            see `get_run_status`.
+
+    Examples:
+        Wait for several runs and handle them as they finish.
+        ```python
+        from prefect_hex import HexCredentials
+        from prefect_hex.watcher import ProjectRunWatcher
+
+        async def example(project_runs):
+            watcher = ProjectRunWatcher(HexCredentials.load("hex-token"))
+            async for project_metadata in watcher.as_completed(project_runs):
+                print(project_metadata.run_id, project_metadata.status)
+        ```
+    """
+
+    def __init__(
+        self,
+        hex_credentials: HexCredentials,
+        poll_frequency_seconds: float = 10,
+        max_concurrency: int = 10,
+        polling_strategy: Optional[PollingStrategy] = None,
+        bulk_refresh_threshold: Optional[int] = 3,
+        max_cached_status_age_seconds: Optional[float] = None,
+    ):
+        self.hex_credentials = hex_credentials
+        self.polling_strategy = polling_strategy or FixedPolling(
+            interval_seconds=poll_frequency_seconds
+        )
+        self.max_concurrency = max_concurrency
+        self.bulk_refresh_threshold = bulk_refresh_threshold
+        self.max_cached_status_age_seconds = max_cached_status_age_seconds
+        self._runs: Dict[Tuple[str, str], _WatchedRun] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def watch(
+        self,
+        project_id: str,
+        run_id: str,
+        max_wait_seconds: Optional[float] = None,
+    ) -> asyncio.Future:
+        """
+        Starts watching a project run.
+
+        Args:
+            project_id: Project ID associated with the run to watch.
+            run_id: Run ID of the run to watch.
+            max_wait_seconds: Maximum number of seconds to wait for the run
+                to reach a terminal status; unlimited if None.
+
+        Returns:
+            A future resolving to the `ProjectStatusResponsePayload` of the run
+            once it reaches a terminal status, or raising
+            `HexProjectRunTimedOut` if the run does not finish in time.
+        """
+        now = time.monotonic()
+        deadline = now + max_wait_seconds if max_wait_seconds is not None else None
+        future = asyncio.get_running_loop().create_future()
+
+        watched_run = self._runs.get((project_id, run_id))
+        if watched_run is None:
+            watched_run = self._runs[(project_id, run_id)] = _WatchedRun(
+                project_id=project_id, run_id=run_id, started=now, next_poll=now
+            )
+        watched_run.waiters.append((future, deadline))
+
+        self._ensure_running()
+        return future
+
+    async def as_completed(
+        self,
+        project_runs: Iterable[Tuple[str, str]],
+        max_wait_seconds: Optional[float] = None,
+    ) -> AsyncIterator[models.ProjectStatusResponsePayload]:
+        """
+        Watches the given project runs and yields their statuses in the order
+        they reach a terminal status.
+
+        Args:
+            project_runs: Pairs of project ID and run ID to watch.
+            max_wait_seconds: Maximum number of seconds to wait for each run.
+
+        Yields:
+            The `ProjectStatusResponsePayload` of each run as it finishes.
+
+        Raises:
+            HexProjectRunTimedOut: If a run does not finish in time.
+        """
+        futures = [
+            self.watch(project_id, run_id, max_wait_seconds=max_wait_seconds)
+            for project_id, run_id in project_runs
+        ]
+        try:
+            for next_completed in asyncio.as_completed(futures):
+                yield await next_completed
+        finally:
+            for future in futures:
+                future.cancel()
+
+    async def aclose(self) -> None:
+        """
+        Stops polling and cancels the futures of all watched runs.
+        """
+        for watched_run in self._runs.values():
+            for future, _ in watched_run.waiters:
+                future.cancel()
+        self._runs.clear()
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+            self._loop_task = None
+
+    def _ensure_running(self):
+        """
+        Starts the polling loop if it is not running and wakes it up
+        so that newly watched runs are polled right away.
+        """
+        if self._loop_task is None or self._loop_task.done():
+            self._wakeup = asyncio.Event()
+            self._loop_task = asyncio.get_running_loop().create_task(self._run())
+        self._wakeup.set()
+
+    async def _run(self):
+        """
+        Polls the runs that are due, then sleeps until the next one is due,
+        until no runs are left to watch.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        while self._runs:
+            self._wakeup.clear()
+            self._expire(time.monotonic())
+
+            now = time.monotonic()
+            due = [run for run in self._runs.values() if run.next_poll <= now]
+            await self._refresh(due, semaphore)
+            self._expire(time.monotonic())
+
+            if not self._runs:
+                break
+            wake_at = min(
+                min(run.next_poll for run in self._runs.values()),
+                min(
+                    (
+                        deadline
+                        for run in self._runs.values()
+                        for _, deadline in run.waiters
+                        if deadline is not None
+                    ),
+                    default=float("inf"),
+                ),
+            )
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), max(0.0, wake_at - time.monotonic())
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _refresh(
+        self, watched_runs: List[_WatchedRun], semaphore: asyncio.Semaphore
+    ):
+        """
+        Refreshes the statuses of the given runs, in bulk for projects with
+        enough due runs and individually otherwise.
+        """
+        runs_by_project = defaultdict(list)
+        for watched_run in watched_runs:
+            runs_by_project[watched_run.project_id].append(watched_run)
+
+        individual_runs = []
+        bulk_refreshes = []
+        for project_id, project_runs in runs_by_project.items():
+            if (
+                self.bulk_refresh_threshold is not None
+                and len(project_runs) >= self.bulk_refresh_threshold
+            ):
+                bulk_refreshes.append(
+                    self._bulk_refresh(project_id, project_runs, semaphore)
+                )
+            else:
+                individual_runs.extend(project_runs)
+
+        for missing_runs in await asyncio.gather(*bulk_refreshes):
+            individual_runs.extend(missing_runs)
+        await asyncio.gather(*(self._poll(run, semaphore) for run in individual_runs))
+
+    async def _bulk_refresh(
+        self,
+        project_id: str,
+        watched_runs: List[_WatchedRun],
+        semaphore: asyncio.Semaphore,
+    ) -> List[_WatchedRun]:
+        """
+        Updates the given runs of a project from the pages of its pending and
+        running runs and returns the runs missing from those pages.
+        """
+
+        async def _get_active_runs(status_filter: models.ProjectRunStatus):
+            """
+            Gets the first page of runs of the project with the given status.
+            """
+            async with semaphore:
+                return await get_project_runs.fn(
+                    project_id=project_id,
+                    hex_credentials=self.hex_credentials,
+                    limit=100,
+                    status_filter=status_filter,
+                )
+
+        try:
+            pages = await asyncio.gather(
+                _get_active_runs(models.ProjectRunStatus.pending),
+                _get_active_runs(models.ProjectRunStatus.running),
+            )
+        except Exception:
+            # fall back to fetching every run individually
+            return watched_runs
+
+        active_runs = {run.run_id: run for page in pages for run in page.runs}
+        missing_runs = []
+        for watched_run in watched_runs:
+            project_metadata = active_runs.get(watched_run.run_id)
+            if project_metadata is None:
+                missing_runs.append(watched_run)
+            else:
+                watched_run.polls += 1
+                self._update(watched_run, project_metadata)
+        return missing_runs
+
+    async def _poll(self, watched_run: _WatchedRun, semaphore: asyncio.Semaphore):
+        """
+        Fetches the status of a run and resolves its futures if it is terminal.
+        """
+        async with semaphore:
+            try:
+                project_metadata = await get_run_status.fn(
+                    project_id=watched_run.project_id,
+                    run_id=watched_run.run_id,
+                    hex_credentials=self.hex_credentials,
+                    max_cached_status_age_seconds=self.max_cached_status_age_seconds,
+                )
+            except Exception as exc:
+                self._resolve(watched_run, exception=exc)
+                return
+
+        watched_run.polls += 1
+        self._update(watched_run, project_metadata)
+
+    def _update(
+        self,
+        watched_run: _WatchedRun,
+        project_metadata: models.ProjectStatusResponsePayload,
+    ):
+        """
+        Records a fetched status, resolving the run if it is terminal and
+        scheduling its next poll otherwise.
+        """
+        if project_metadata.status in TERMINAL_STATUS_EXCEPTIONS:
+            self._resolve(watched_run, result=project_metadata)
+        else:
+            now = time.monotonic()
+            watched_run.next_poll = now + self.polling_strategy.get_interval(
+                watched_run.polls, now - watched_run.started
+            )
+
+    def _resolve(
+        self,
+        watched_run: _WatchedRun,
+        result: Optional[models.ProjectStatusResponsePayload] = None,
+        exception: Optional[BaseException] = None,
+    ):
+        """
+        Stops watching a run and resolves its futures.
+        """
+        self._runs.pop((watched_run.project_id, watched_run.run_id), None)
+        for future, _ in watched_run.waiters:
+            if future.done():
+                continue
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+    def _expire(self, now: float):
+        """
+        Fails the waiters that have exceeded their deadline with a timeout and
+        stops watching runs that nobody is waiting for anymore.
+        """
+        for key, watched_run in list(self._runs.items()):
+            for future, deadline in watched_run.waiters:
+                if not future.done() and deadline is not None and deadline <= now:
+                    future.set_exception(
+                        HexProjectRunTimedOut(
+                            f"Max wait time exceeded while waiting for project "
+                            f"{watched_run.project_id!r} run {watched_run.run_id!r}"
+                        )
+                    )
+            watched_run.waiters = [
+                (future, deadline)
+                for future, deadline in watched_run.waiters
+                if not future.done()
+            ]
+            if not watched_run.waiters:
+                del self._runs[key]
+
+
+class RunStatusService:
+    """
+    Process-wide service waiting for project runs on behalf of every flow in
+    the process: a single `ProjectRunWatcher` runs on a background thread with
+    its own event loop, and callers on any thread or event loop register runs
+    and await their terminal statuses. Status requests are batched, deduped
+    and go through the process-wide rate limiter, so callers waiting on the
+    same run share a single poll.
+
+    Use `get_run_status_service` to get the service of some credentials.
+
+    Args:
+        hex_credentials: Credentials to use for authentication with Hex.
+        max_concurrency: Maximum number of status requests in flight.
+        polling_strategy: Strategy deciding how long to wait in between checks
+            of a run; defaults to exponential backoff from 1 up to 10 seconds.
+        bulk_refresh_threshold: Minimum number of due runs of the same project
+            for which their statuses are refreshed in bulk.
+        max_cached_status_age_seconds: If set, individual statuses are read
+            through the status cache shared by the processes on this host,
+            so services of different processes don't poll the same run.
+
+    Examples:
+        Wait for a run from a flow, sharing polls with every other flow
+        of the process.
+        ```python
+        from prefect import flow
+        from prefect_hex import HexCredentials
+        from prefect_hex.watcher import get_run_status_service
+
+        @flow
+        async def wait_flow(project_id: str, run_id: str):
+            service = get_run_status_service(HexCredentials.load("hex-token"))
+            project_metadata = await service.wait(
+                project_id, run_id, max_wait_seconds=900
+            )
+            return project_metadata.status
+        ```
+    """
+
+    def __init__(
+        self,
+        hex_credentials: HexCredentials,
+        max_concurrency: int = 10,
+        polling_strategy: Optional[PollingStrategy] = None,
+        bulk_refresh_threshold: Optional[int] = 3,
+        max_cached_status_age_seconds: Optional[float] = None,
+    ):
+        self._watcher = ProjectRunWatcher(
+            hex_credentials,
+            max_concurrency=max_concurrency,
+            polling_strategy=polling_strategy
+            or ExponentialBackoffPolling(initial_seconds=1, max_seconds=10),
+            bulk_refresh_threshold=bulk_refresh_threshold,
+            max_cached_status_age_seconds=max_cached_status_age_seconds,
+        )
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """
+        Starts the background thread and its event loop on first use.
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="prefect-hex-run-status-service",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def watch(
+        self,
+        project_id: str,
+        run_id: str,
+        max_wait_seconds: Optional[float] = None,
+    ) -> concurrent.futures.Future:
+        """
+        Registers a project run to wait for, from any thread.
+
+        Args:
+            project_id: Project ID associated with the run to wait for.
+            run_id: Run ID of the run to wait for.
+            max_wait_seconds: Maximum number of seconds to wait for the run
+                to reach a terminal status; unlimited if None.
+
+        Returns:
+            A thread-safe future resolving to the `ProjectStatusResponsePayload`
+            of the run once it reaches a terminal status, or raising
+            `HexProjectRunTimedOut` if the run does not finish in time.
+            Cancelling the future stops waiting for the run.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._watch(project_id, run_id, max_wait_seconds),
+            self._ensure_started(),
+        )
+
+    async def _watch(
+        self, project_id: str, run_id: str, max_wait_seconds: Optional[float]
+    ) -> models.ProjectStatusResponsePayload:
+        """
+        Waits for a run through the watcher, on the service's event loop.
+        """
+        return await self._watcher.watch(
+            project_id, run_id, max_wait_seconds=max_wait_seconds
+        )
+
+    async def wait(
+        self,
+        project_id: str,
+        run_id: str,
+        max_wait_seconds: Optional[float] = None,
+    ) -> models.ProjectStatusResponsePayload:
+        """
+        Waits for a project run to reach a terminal status, from any event loop.
+
+        Args:
+            project_id: Project ID associated with the run to wait for.
+            run_id: Run ID of the run to wait for.
+            max_wait_seconds: Maximum number of seconds to wait for the run
+                to reach a terminal status; unlimited if None.
+
+        Returns:
+            The `ProjectStatusResponsePayload` of the finished run.
+
+        Raises:
+            HexProjectRunTimedOut: If the run does not finish in time.
+        """
+        return await asyncio.wrap_future(
+            self.watch(project_id, run_id, max_wait_seconds=max_wait_seconds)
+        )
+
+    def close(self) -> None:
+        """
+        Stops waiting for all runs and stops the background thread.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._watcher.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+_RUN_STATUS_SERVICES: Dict[Tuple[str, str], RunStatusService] = {}
+_RUN_STATUS_SERVICES_LOCK = threading.Lock()
+
+
+def get_run_status_service(hex_credentials: HexCredentials) -> RunStatusService:
+    """
+    Gets the process-wide run status service shared by all credentials with
+    the same domain and token, creating it with default settings on first use.
+
+    Args:
+        hex_credentials: Credentials to use for authentication with Hex.
+
+    Returns:
+        The run status service for the credentials.
+    """
+    key = (hex_credentials.domain, token_fingerprint(hex_credentials))
+    with _RUN_STATUS_SERVICES_LOCK:
+        service = _RUN_STATUS_SERVICES.get(key)
+        if service is None:
+            service = _RUN_STATUS_SERVICES[key] = RunStatusService(hex_credentials)
+    return service
+
+
+def set_run_status_service(
+    hex_credentials: HexCredentials, service: RunStatusService
+) -> None:
+    """
+    Replaces the process-wide run status service of the credentials, e.g. to
+    use a different polling strategy.
+
+    Args:
+        hex_credentials: Credentials the service is used for.
+        service: The service to use from now on.
+    """
+    key = (hex_credentials.domain, token_fingerprint(hex_credentials))
+    with _RUN_STATUS_SERVICES_LOCK:
+        _RUN_STATUS_SERVICES[key] = service
+
+
+def close_run_status_services() -> None:
+    """
+    Closes all process-wide run status services.
+    """
+    with _RUN_STATUS_SERVICES_LOCK:
+        services = list(_RUN_STATUS_SERVICES.values())
+        _RUN_STATUS_SERVICES.clear()
+    for service in services:
+        service.close()
+
+
+@flow
+async def wait_for_project_runs_completion(
+    project_runs: List[Tuple[str, str]],
+    hex_credentials: HexCredentials,
+    max_wait_seconds: int = 900,
+    poll_frequency_seconds: int = 10,
+    max_concurrency: int = 10,
+    polling_strategy: Optional[PollingStrategy] = None,
+    bulk_refresh_threshold: Optional[int] = 3,
+    max_cached_status_age_seconds: Optional[float] = None,
+) -> Dict[str, Tuple[models.ProjectRunStatus, models.ProjectStatusResponsePayload]]:
+    """
+    Flow that waits for many project runs to complete, polling all of them
+    from a single loop instead of running a subflow per run.
+
+    Args:
+        project_runs:
+            Pairs of project ID and run ID to wait for.
+        hex_credentials:
+            Credentials to use for authentication with Hex.
+        max_wait_seconds: Maximum number of seconds to wait for each run
+            to complete.
+        poll_frequency_seconds: Number of seconds to wait in between checks for
+            run completion.
+        max_concurrency: Maximum number of status requests in flight.
+        polling_strategy: Strategy deciding how long to wait in between checks
+            of a run; overrides `poll_frequency_seconds`.
+        bulk_refresh_threshold: Minimum number of runs of the same project
+            for which their statuses are refreshed in bulk through the
+            project's runs pages; disabled if None.
+        max_cached_status_age_seconds: If set, statuses are read through the
+            status cache shared by the processes on this host.
+
+    Returns:
+        The status and the metadata of each run, keyed by run ID.
+
+    Raises:
+        HexProjectRunTimedOut: If any run does not complete in time; the
+            other runs are still waited for.
+        HexProjectRunError: If waiting for any run fails otherwise, e.g. its
+            status can't be requested; the other runs are still waited for.
+
+    Examples:
+        Wait for completion of several project runs as a subflow.
+        ```python
+        from prefect import flow
+        from prefect_hex import HexCredentials
+        from prefect_hex.watcher import wait_for_project_runs_completion
+
+        @flow
+        def wait_for_project_runs_completion_flow(project_runs):
+            hex_credentials = HexCredentials.load("hex-token")
+            return wait_for_project_runs_completion(
+                project_runs=project_runs,
+                hex_credentials=hex_credentials
+            )
+
+        wait_for_project_runs_completion_flow(
+            project_runs=[
+                ("012345c6-b67c-1234-1b2c-66e4ad07b9f3", "654321c6-b67c-1234"),
+                ("012345c6-b67c-1234-1b2c-66e4ad07b9f3", "765432c6-b67c-1234"),
+            ]
+        )
+        ```
+    """
+    logger = get_run_logger()
+    watcher = ProjectRunWatcher(
+        hex_credentials,
+        poll_frequency_seconds=poll_frequency_seconds,
+        max_concurrency=max_concurrency,
+        polling_strategy=polling_strategy,
+        bulk_refresh_threshold=bulk_refresh_threshold,
+        max_cached_status_age_seconds=max_cached_status_age_seconds,
+    )
+    futures = [
+        watcher.watch(project_id, run_id, max_wait_seconds=max_wait_seconds)
+        for project_id, run_id in project_runs
+    ]
+
+    results = {}
+    timed_out = []
+    failed = []
+    try:
+        for next_completed in asyncio.as_completed(futures):
+            try:
+                project_metadata = await next_completed
+            except HexProjectRunTimedOut as exc:
+                timed_out.append(str(exc))
+                continue
+            except Exception as exc:
+                failed.append(exc)
+                logger.error("Failed to wait for a project run: %r", exc)
+                continue
+            logger.info(
+                "Project %s run %s finished with status %s",
+                repr(project_metadata.project_id),
+                repr(project_metadata.run_id),
+                repr(project_metadata.status.value),
+            )
+            results[project_metadata.run_id] = (
+                project_metadata.status,
+                project_metadata,
+            )
+    finally:
+        await watcher.aclose()
+
+    if failed:
+        raise HexProjectRunError(
+            f"Failed to wait for {len(failed) + len(timed_out)} of {len(futures)} "
+            f"project runs, of which {len(timed_out)} timed out; first error: "
+            f"{failed[0]!r}"
+        ) from failed[0]
+    if timed_out:
+        raise HexProjectRunTimedOut(
+            f"Max wait time of {max_wait_seconds} seconds exceeded while waiting "
+            f"for {len(timed_out)} of {len(futures)} project runs"
+        )
+    return results
@@ -1,7 +1,9 @@
 import pytest
+from httpx import Response
 from prefect.testing.utilities import prefect_test_harness
 
 from prefect_hex import HexCredentials
+from prefect_hex.store import HexStateStore, set_state_store
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -24,6 +26,111 @@ def reset_object_registry():
         yield
 
 
+@pytest.fixture(autouse=True)
+def state_store(tmp_path) -> HexStateStore:
+    """
+    Ensures each test has a clean local state store.
+    """
+    store = HexStateStore(tmp_path / "prefect-hex.db")
+    set_state_store(store)
+    return store
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiters():
+    """
+    Ensures each test starts with fresh rate limiters, since the budgets of
+    credentials sharing a quota are merged.
+    """
+    from prefect_hex.rate_limit import _RATE_LIMITERS
+
+    _RATE_LIMITERS.clear()
+    yield
+    _RATE_LIMITERS.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_update_cache_runs():
+    """
+    Ensures each test starts without in-flight update_cache runs.
+    """
+    from prefect_hex.project import _UPDATE_CACHE_RUNS
+
+    _UPDATE_CACHE_RUNS.clear()
+    yield
+    _UPDATE_CACHE_RUNS.clear()
+
+
+@pytest.fixture(autouse=True)
+def terminal_status_cache():
+    """
+    Ensures each test starts with an empty terminal status cache.
+    """
+    from prefect_hex.project import TerminalStatusCache, set_terminal_status_cache
+
+    cache = TerminalStatusCache()
+    set_terminal_status_cache(cache)
+    return cache
+
+
 @pytest.fixture
 def hex_credentials() -> HexCredentials:
     return HexCredentials(token="token")
+
+
+def project_run_json(project_id, run_id):
+    """
+    Builds the payload of a triggered project run.
+    """
+    return {
+        "projectId": project_id,
+        "runId": run_id,
+        "runUrl": f"https://app.hex.tech/12345/app/{project_id}",
+        "runStatusUrl": (
+            f"https://app.hex.tech/api/v1/project/{project_id}/run/{run_id}"
+        ),
+        "traceId": "123456",
+    }
+
+
+def project_status_json(project_id, run_id, status):
+    """
+    Builds the status payload of a project run.
+    """
+    return {
+        "projectId": project_id,
+        "runId": run_id,
+        "status": status,
+        "runUrl": f"https://app.hex.tech/12345/app/{project_id}",
+        "startTime": "2022-11-15T23:53:31.554Z",
+        "endTime": None,
+        "elapsedTime": 1234,
+        "traceId": "123456",
+    }
+
+
+@pytest.fixture
+def triggered(respx_mock):
+    """
+    Mocks projects whose runs complete right away, except the runs of project
+    "broken", which error; records the order in which projects are triggered.
+    """
+    triggered = []
+
+    def trigger(request):
+        project_id = request.url.path.split("/")[-2]
+        triggered.append(project_id)
+        return Response(200, json=project_run_json(project_id, str(len(triggered))))
+
+    def status(request):
+        _, project_id, _, run_id = request.url.path.rsplit("/", 3)
+        run_status = "ERRORED" if project_id == "broken" else "COMPLETED"
+        return Response(200, json=project_status_json(project_id, run_id, run_status))
+
+    respx_mock.post(url__regex=r"https://app.hex.tech/api/v1/project/\w+/run").mock(
+        side_effect=trigger
+    )
+    respx_mock.get(url__regex=r"https://app.hex.tech/api/v1/project/\w+/run/\d+").mock(
+        side_effect=status
+    )
+    return triggered
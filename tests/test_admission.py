@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from prefect_hex.admission import KernelAdmissionController
+from prefect_hex.models.project import ProjectRunStatus
+
+
+async def test_kernel_admission_controller_limits_live_runs():
+    controller = KernelAdmissionController(initial_concurrency=2)
+    tickets = [await controller.acquire(), await controller.acquire()]
+    third = asyncio.ensure_future(controller.acquire())
+    await asyncio.sleep(0.01)
+    assert not third.done()
+
+    await controller.release(tickets[0], ProjectRunStatus.completed)
+    await asyncio.wait_for(third, 1)
+    assert controller.live == 2
+
+
+async def test_kernel_admission_controller_aimd():
+    controller = KernelAdmissionController(initial_concurrency=8, max_concurrency=9)
+    tickets = [await controller.acquire() for _ in range(4)]
+
+    # a burst of rejections of the same window decreases the limit once
+    for ticket in tickets[:3]:
+        await controller.release(ticket, ProjectRunStatus.unabletoallocatekernel)
+    assert controller.concurrency_limit == 4
+    assert controller.stats.kernel_rejections == 3
+    assert controller.stats.decreases == 1
+
+    # runs that don't finish leave the limit unchanged
+    await controller.release(tickets[3], None)
+    assert controller.concurrency_limit == 4
+
+    # about a full window of runs that got a kernel grows the limit by one
+    for _ in range(5):
+        await controller.release(
+            await controller.acquire(requeue=True), ProjectRunStatus.errored
+        )
+    assert controller.concurrency_limit == 5
+    assert controller.stats.requeues == 5
+
+    for _ in range(100):
+        await controller.release(await controller.acquire(), ProjectRunStatus.completed)
+    assert controller.concurrency_limit == 9
+
+
+def test_kernel_admission_controller_backoff():
+    controller = KernelAdmissionController(
+        backoff_base_seconds=5, backoff_max_seconds=12
+    )
+    assert 0 <= controller.get_backoff_seconds(1) <= 5
+    assert all(0 <= controller.get_backoff_seconds(100) <= 12 for _ in range(10))
+
+
+def test_kernel_admission_controller_validation():
+    with pytest.raises(ValueError, match="initial_concurrency"):
+        KernelAdmissionController(initial_concurrency=100, max_concurrency=10)
+    with pytest.raises(ValueError, match="decrease_factor"):
+        KernelAdmissionController(decrease_factor=2)
@@ -0,0 +1,253 @@
+import json
+
+import pytest
+from conftest import project_run_json, project_status_json
+from httpx import Response
+from prefect import flow
+
+from prefect_hex.admission import KernelAdmissionController
+from prefect_hex.batch import (
+    ProjectRunSpec,
+    RunCheckpoint,
+    _get_item_key,
+    run_projects,
+    sweep_project_input_params,
+    trigger_project_runs_and_wait_for_completion,
+    trigger_project_sweep_and_wait_for_completion,
+)
+from prefect_hex.models import project as models
+
+
+@pytest.fixture
+def hex_projects(respx_mock):
+    """
+    Mocks projects "a", which completes, "b", which errors,
+    and "c", which cannot be triggered.
+    """
+    for project_id, status in (("a", "COMPLETED"), ("b", "ERRORED")):
+        respx_mock.post(f"https://app.hex.tech/api/v1/project/{project_id}/run").mock(
+            return_value=Response(200, json=project_run_json(project_id, "1"))
+        )
+        respx_mock.get(f"https://app.hex.tech/api/v1/project/{project_id}/run/1").mock(
+            return_value=Response(
+                200, json=project_status_json(project_id, "1", status)
+            )
+        )
+    respx_mock.post("https://app.hex.tech/api/v1/project/c/run").mock(
+        return_value=Response(404, json={"reason": "not found"})
+    )
+
+
+async def test_run_projects(hex_credentials, hex_projects):
+    @flow
+    async def test_flow():
+        return await run_projects(
+            [{"project_id": "a"}, ProjectRunSpec(project_id="c")], hex_credentials
+        )
+
+    results = await test_flow()
+    assert results["a"].succeeded
+    assert results["a"].project_run.run_id == "1"
+    assert not results["c"].succeeded
+    assert "Failed to trigger run" in results["c"].error
+
+
+async def test_run_projects_duplicate_keys(hex_credentials):
+    with pytest.raises(ValueError, match="duplicate keys"):
+        await run_projects.fn(
+            [{"project_id": "a"}, {"project_id": "a"}], hex_credentials
+        )
+
+
+async def test_trigger_project_runs_and_wait_for_completion(
+    hex_credentials, hex_projects
+):
+    results = await trigger_project_runs_and_wait_for_completion(
+        project_run_specs=[
+            ProjectRunSpec(project_id=project_id) for project_id in ("a", "b", "c")
+        ],
+        hex_credentials=hex_credentials,
+        max_concurrency=2,
+    )
+    assert results["a"].succeeded
+    assert results["a"].project_metadata.status.value == "COMPLETED"
+    assert "HexProjectRunErrored" in results["b"].error
+    assert results["c"].project_run is None
+
+
+@pytest.fixture
+def sweep_project(respx_mock):
+    """
+    Mocks project "s", whose runs are named after their "i" input parameter
+    and error out if "i" is odd.
+    """
+
+    def trigger(request):
+        run_id = str(json.loads(request.content)["inputParams"]["i"])
+        return Response(200, json=project_run_json("s", run_id))
+
+    def status(request):
+        run_id = request.url.path.rsplit("/", 1)[-1]
+        run_status = "ERRORED" if int(run_id) % 2 else "COMPLETED"
+        return Response(200, json=project_status_json("s", run_id, run_status))
+
+    respx_mock.post("https://app.hex.tech/api/v1/project/s/run").mock(
+        side_effect=trigger
+    )
+    respx_mock.get(url__regex=r"https://app.hex.tech/api/v1/project/s/run/\d+").mock(
+        side_effect=status
+    )
+
+
+async def test_sweep_project_input_params(hex_credentials, sweep_project):
+    consumed = []
+
+    async def input_params():
+        for i in range(5):
+            consumed.append(i)
+            yield {"i": i}
+
+    results = []
+    async for result in sweep_project_input_params(
+        "s", input_params(), hex_credentials, max_in_flight=2
+    ):
+        # the sweep never runs more than max_in_flight items ahead
+        assert len(consumed) - len(results) <= 2
+        results.append(result)
+
+    assert sorted(result.key for result in results) == ["0", "1", "2", "3", "4"]
+    assert all(result.input_params == {"i": int(result.key)} for result in results)
+    assert [result.succeeded for result in sorted(results, key=lambda r: r.key)] == [
+        True,
+        False,
+        True,
+        False,
+        True,
+    ]
+
+
+async def test_trigger_project_sweep_and_wait_for_completion(
+    hex_credentials, sweep_project
+):
+    results = await trigger_project_sweep_and_wait_for_completion(
+        project_id="s",
+        input_params=[{"i": 0}, {"i": 1}],
+        hex_credentials=hex_credentials,
+    )
+    assert {result.key: result.succeeded for result in results} == {
+        "0": True,
+        "1": False,
+    }
+
+
+async def test_trigger_project_runs_and_wait_for_completion_checkpoint(
+    hex_credentials, hex_projects, respx_mock
+):
+    kwargs = dict(
+        project_run_specs=[ProjectRunSpec(project_id="a")],
+        hex_credentials=hex_credentials,
+        checkpoint_key="nightly",
+    )
+    await trigger_project_runs_and_wait_for_completion(**kwargs)
+    results = await trigger_project_runs_and_wait_for_completion(**kwargs)
+
+    # the completed run is not triggered again when resuming
+    assert results["a"].succeeded
+    assert respx_mock.routes[0].call_count == 1
+
+
+async def test_sweep_project_input_params_checkpoint(
+    hex_credentials, sweep_project, respx_mock
+):
+    checkpoint = RunCheckpoint("sweep")
+    async for _ in sweep_project_input_params(
+        "s", [{"i": 0}, {"i": 1}], hex_credentials, checkpoint=checkpoint
+    ):
+        pass
+    # run "2" was triggered before a crash, so it is re-attached to
+    checkpoint.record(
+        _get_item_key(ProjectRunSpec(project_id="s", input_params={"i": 2})),
+        models.ProjectRunResponsePayload.parse_obj(project_run_json("s", "2")),
+    )
+
+    results = [
+        result
+        async for result in sweep_project_input_params(
+            "s",
+            [{"i": 0}, {"i": 1}, {"i": 2}],
+            hex_credentials,
+            checkpoint=checkpoint,
+        )
+    ]
+    assert {result.key: result.succeeded for result in results} == {
+        "0": True,
+        "1": False,
+        "2": True,
+    }
+    # "0" and "1" were triggered by the first sweep, and only the errored "1"
+    # was triggered again
+    assert respx_mock.routes[0].call_count == 3
+
+
+async def test_trigger_project_runs_and_wait_for_completion_reuse(
+    hex_credentials, hex_projects, respx_mock
+):
+    kwargs = dict(
+        project_run_specs=[ProjectRunSpec(project_id="a")],
+        hex_credentials=hex_credentials,
+        reuse_if_completed_within=600,
+    )
+    await trigger_project_runs_and_wait_for_completion(**kwargs)
+    results = await trigger_project_runs_and_wait_for_completion(**kwargs)
+
+    assert results["a"].succeeded
+    assert results["a"].project_run is None
+    assert results["a"].project_metadata.run_id == "1"
+    assert respx_mock.routes[0].call_count == 1
+
+
+async def test_sweep_project_input_params_admission_controller(
+    hex_credentials, respx_mock
+):
+    # every run of project "k" with an even "i" fails to allocate a kernel
+    # on its first attempt
+    def trigger(request):
+        i = json.loads(request.content)["inputParams"]["i"]
+        attempt = trigger.attempts[i] = trigger.attempts.get(i, 0) + 1
+        return Response(200, json=project_run_json("k", f"{i}{attempt}"))
+
+    trigger.attempts = {}
+
+    def status(request):
+        run_id = request.url.path.rsplit("/", 1)[-1]
+        i, attempt = int(run_id[:-1]), int(run_id[-1])
+        run_status = (
+            "UNABLE_TO_ALLOCATE_KERNEL" if i % 2 == 0 and attempt == 1 else "COMPLETED"
+        )
+        return Response(200, json=project_status_json("k", run_id, run_status))
+
+    respx_mock.post("https://app.hex.tech/api/v1/project/k/run").mock(
+        side_effect=trigger
+    )
+    respx_mock.get(url__regex=r"https://app.hex.tech/api/v1/project/k/run/\d+").mock(
+        side_effect=status
+    )
+
+    controller = KernelAdmissionController(
+        initial_concurrency=4, max_concurrency=4, backoff_base_seconds=0
+    )
+    results = [
+        result
+        async for result in sweep_project_input_params(
+            "k",
+            [{"i": i} for i in range(4)],
+            hex_credentials,
+            max_in_flight=4,
+            admission_controller=controller,
+        )
+    ]
+    assert all(result.succeeded for result in results)
+    assert trigger.attempts == {0: 2, 1: 1, 2: 2, 3: 1}
+    assert controller.stats.kernel_rejections == 2
+    assert controller.stats.requeues == 2
+    assert controller.live == 0
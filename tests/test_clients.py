@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from prefect_hex import HexCredentials
+from prefect_hex.clients import HexClientRegistry, token_fingerprint
+
+
+@pytest.fixture
+def registry():
+    return HexClientRegistry(idle_timeout=60)
+
+
+async def test_get_client_reuses_client(registry, hex_credentials):
+    client = await registry.get_client(hex_credentials)
+    assert isinstance(client, httpx.AsyncClient)
+    assert client.headers["authorization"] == "Bearer token"
+    assert await registry.get_client(HexCredentials(token="token")) is client
+    assert len(registry) == 1
+    await registry.aclose()
+    assert client.is_closed
+
+
+async def test_get_client_keyed_by_domain_and_token(registry, hex_credentials):
+    client = await registry.get_client(hex_credentials)
+    other_token = await registry.get_client(HexCredentials(token="other"))
+    other_domain = await registry.get_client(
+        HexCredentials(domain="other.hex.tech", token="token")
+    )
+    assert len({id(client), id(other_token), id(other_domain)}) == 3
+    await registry.aclose()
+
+
+async def test_evict_idle(registry, hex_credentials):
+    client = await registry.get_client(hex_credentials)
+    registry.idle_timeout = -1
+    assert await registry.evict_idle() == 1
+    assert client.is_closed
+    assert len(registry) == 0
+
+
+def test_token_fingerprint_does_not_leak_token(hex_credentials):
+    fingerprint = token_fingerprint(hex_credentials)
+    assert "token" not in fingerprint
+    assert fingerprint == token_fingerprint(HexCredentials(token="token"))
+
+
+async def test_get_client_keyed_by_transport_settings(registry, hex_credentials):
+    client = await registry.get_client(hex_credentials)
+    tuned = await registry.get_client(HexCredentials(token="token", read_timeout=60))
+    assert tuned is not client
+    assert tuned.timeout.read == 60
+    await registry.aclose()
+
+
+async def test_aclose_keeps_clients_of_other_loops(registry, hex_credentials):
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        other_client = asyncio.run_coroutine_threadsafe(
+            registry.get_client(hex_credentials), other_loop
+        ).result()
+        client = await registry.get_client(hex_credentials)
+
+        await registry.aclose()
+        assert client.is_closed
+        # the client of the other loop can't be closed from here, so it is kept
+        assert not other_client.is_closed
+        assert len(registry) == 1
+
+        asyncio.run_coroutine_threadsafe(registry.aclose(), other_loop).result()
+        assert other_client.is_closed
+        assert len(registry) == 0
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+
+async def test_evict_idle_from_several_threads(registry, hex_credentials):
+    for _ in range(4):
+        # clients of closed loops are evicted without their loop
+        await asyncio.to_thread(asyncio.run, registry.get_client(hex_credentials))
+    held = len(registry)
+    evicted = await asyncio.gather(
+        *(asyncio.to_thread(asyncio.run, registry.evict_idle()) for _ in range(4))
+    )
+    assert sum(evicted) == held >= 1
+    assert len(registry) == 0
@@ -1,9 +1,55 @@
-from httpx import AsyncClient
+from httpx import AsyncClient, Limits
 
 from prefect_hex import HexCredentials
+from prefect_hex.clients import HexClientRegistry
 
 
 def test_hex_credentials_get_client():
     client = HexCredentials(domain="domain", token="token_value").get_client()
     assert isinstance(client, AsyncClient)
     assert client.headers["authorization"] == "Bearer token_value"
+
+
+def test_hex_credentials_get_client_transport_settings():
+    client = HexCredentials(
+        token="token_value",
+        connect_timeout=1.5,
+        read_timeout=30,
+        pool_timeout=None,
+    ).get_client()
+    assert client.timeout.connect == 1.5
+    assert client.timeout.read == 30
+    assert client.timeout.write == 5
+    assert client.timeout.pool is None
+
+
+def test_hex_credentials_get_client_kwargs_limits():
+    assert "limits" not in HexCredentials(token="token")._get_client_kwargs()
+
+    limits = HexCredentials(
+        token="token", max_connections=50, keepalive_expiry=60
+    )._get_client_kwargs()["limits"]
+    assert limits.max_connections == 50
+    assert limits.max_keepalive_connections == 20
+    assert limits.keepalive_expiry == 60
+
+
+def test_hex_credentials_get_client_kwargs_limits_use_registry_defaults(monkeypatch):
+    limits = HexCredentials(token="token", max_connections=50)._get_client_kwargs()[
+        "limits"
+    ]
+    assert limits.max_keepalive_connections == 20
+    assert limits.keepalive_expiry == 30
+
+    registry = HexClientRegistry(
+        limits=Limits(
+            max_connections=10, max_keepalive_connections=5, keepalive_expiry=90
+        )
+    )
+    monkeypatch.setattr("prefect_hex.clients._CLIENT_REGISTRY", registry)
+    limits = HexCredentials(
+        token="token", max_keepalive_connections=2
+    )._get_client_kwargs()["limits"]
+    assert limits.max_connections == 10
+    assert limits.max_keepalive_connections == 2
+    assert limits.keepalive_expiry == 90
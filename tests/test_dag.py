@@ -0,0 +1,76 @@
+import pytest
+
+from prefect_hex.dag import ProjectRunNode, trigger_project_dag_and_wait_for_completion
+from prefect_hex.polling import FixedPolling
+
+
+async def test_trigger_project_dag_and_wait_for_completion(hex_credentials, triggered):
+    results = await trigger_project_dag_and_wait_for_completion(
+        project_run_nodes=[
+            ProjectRunNode(project_id="dashboard", upstream=["mart"]),
+            ProjectRunNode(project_id="mart", upstream=["orders", "users"]),
+            ProjectRunNode(project_id="orders"),
+            {"project_id": "users"},
+            ProjectRunNode(project_id="broken"),
+            ProjectRunNode(project_id="report", upstream=["broken", "mart"]),
+            ProjectRunNode(project_id="archive", upstream=["report"]),
+        ],
+        hex_credentials=hex_credentials,
+        polling_strategy=FixedPolling(interval_seconds=0.01),
+    )
+
+    # upstreams always run before their downstreams
+    assert set(triggered[:3]) == {"orders", "users", "broken"}
+    assert triggered[3:] == ["mart", "dashboard"]
+    assert {key: result.succeeded for key, result in results.items()} == {
+        "dashboard": True,
+        "mart": True,
+        "orders": True,
+        "users": True,
+        "broken": False,
+        "report": False,
+        "archive": False,
+    }
+    # only the subtree downstream of the failed run is skipped
+    assert "HexProjectRunErrored" in results["broken"].error
+    assert results["report"].error == "Skipped because upstream run 'broken' failed"
+    assert results["archive"].error == "Skipped because upstream run 'broken' failed"
+
+
+async def test_trigger_project_dag_and_wait_for_completion_duplicate_upstream(
+    hex_credentials, triggered
+):
+    results = await trigger_project_dag_and_wait_for_completion(
+        project_run_nodes=[
+            ProjectRunNode(project_id="orders"),
+            ProjectRunNode(project_id="mart", upstream=["orders", "orders"]),
+        ],
+        hex_credentials=hex_credentials,
+        polling_strategy=FixedPolling(interval_seconds=0.01),
+    )
+
+    assert triggered == ["orders", "mart"]
+    assert all(result.succeeded for result in results.values())
+
+
+@pytest.mark.parametrize(
+    "nodes, match",
+    [
+        ([{"project_id": "a", "upstream": ["b"]}], "unknown runs"),
+        (
+            [
+                {"project_id": "a", "upstream": ["b"]},
+                {"project_id": "b", "upstream": ["a"]},
+                {"project_id": "c"},
+            ],
+            r"\['a', 'b'\] form a dependency cycle",
+        ),
+    ],
+)
+async def test_trigger_project_dag_and_wait_for_completion_invalid(
+    hex_credentials, nodes, match
+):
+    with pytest.raises(ValueError, match=match):
+        await trigger_project_dag_and_wait_for_completion(
+            project_run_nodes=nodes, hex_credentials=hex_credentials
+        )
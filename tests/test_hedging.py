@@ -0,0 +1,63 @@
+import pytest
+
+from prefect_hex import HexCredentials
+from prefect_hex.hedging import RequestHedger, get_request_hedger, set_request_hedger
+
+
+def test_request_hedger_waits_for_samples():
+    hedger = RequestHedger(min_samples=3, min_delay_seconds=0)
+    hedger.record(0.1)
+    hedger.record(0.2)
+    assert hedger.get_delay_seconds() is None
+    hedger.record(0.3)
+    assert hedger.get_delay_seconds() == 0.3
+
+
+def test_request_hedger_delay_percentile_and_bounds():
+    hedger = RequestHedger(percentile=95, min_samples=1, min_delay_seconds=0)
+    for latency in range(1, 101):
+        hedger.record(latency / 100)
+    assert hedger.get_delay_seconds() == 0.95
+
+    hedger.min_delay_seconds = 2
+    assert hedger.get_delay_seconds() == 2
+    hedger.max_delay_seconds = 0.5
+    assert hedger.get_delay_seconds() == 0.5
+
+
+def test_request_hedger_caps_hedge_rate():
+    hedger = RequestHedger(min_samples=1, max_hedge_rate=0.1)
+    for _ in range(9):
+        hedger.record(0.1)
+    assert hedger.allows_hedge()
+    hedger.record_hedge()
+    assert not hedger.allows_hedge()
+    for _ in range(10):
+        hedger.record(0.1)
+    assert hedger.allows_hedge()
+    hedger.record_hedge()
+    hedger.record(0.1, hedged=True, hedge_won=True)
+
+    stats = hedger.stats
+    assert stats.requests == 21
+    assert stats.hedged_requests == 2
+    assert stats.hedge_wins == 1
+    assert stats.rate_limited_hedges == 1
+
+
+def test_request_hedger_validates_arguments():
+    with pytest.raises(ValueError):
+        RequestHedger(max_hedge_rate=2)
+    with pytest.raises(ValueError):
+        RequestHedger(min_samples=10, window_size=5)
+
+
+def test_get_request_hedger_per_credentials():
+    credentials = HexCredentials(token="hedged_token")
+    hedger = get_request_hedger(credentials)
+    assert get_request_hedger(HexCredentials(token="hedged_token")) is hedger
+    assert get_request_hedger(HexCredentials(token="other_token")) is not hedger
+
+    replacement = RequestHedger(percentile=99)
+    set_request_hedger(credentials, replacement)
+    assert get_request_hedger(credentials) is replacement
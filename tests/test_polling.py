@@ -0,0 +1,68 @@
+import pytest
+
+from prefect_hex.polling import (
+    ExponentialBackoffPolling,
+    FixedPolling,
+    HistoricalDurationPolling,
+    PollingStrategy,
+    ProportionalPolling,
+)
+
+
+def test_fixed_polling():
+    strategy = FixedPolling(interval_seconds=5)
+    assert strategy.get_interval(1, 0) == strategy.get_interval(100, 3600) == 5
+
+
+def test_exponential_backoff_polling():
+    strategy = ExponentialBackoffPolling(
+        initial_seconds=1, multiplier=2, max_seconds=10
+    )
+    intervals = [strategy.get_interval(poll_number, 0) for poll_number in range(1, 7)]
+    assert intervals == [1, 2, 4, 8, 10, 10]
+    assert strategy.get_interval(10_000, 0) == 10
+
+
+def test_proportional_polling():
+    strategy = ProportionalPolling(ratio=0.1, min_seconds=2, max_seconds=60)
+    assert strategy.get_interval(1, 0) == 2
+    assert strategy.get_interval(5, 300) == 30
+    assert strategy.get_interval(50, 3600) == 60
+
+
+def test_polling_strategy_is_abstract():
+    with pytest.raises(TypeError):
+        PollingStrategy()
+
+
+def test_polling_strategy_subclass_without_get_interval():
+    class IncompletePolling(PollingStrategy):
+        interval_seconds: float = 1
+
+    with pytest.raises(TypeError):
+        IncompletePolling()
+
+
+def test_historical_duration_polling_from_durations():
+    strategy = HistoricalDurationPolling.from_durations(list(range(100, 201, 10)))
+    assert strategy.p10_seconds == 110
+    assert strategy.p50_seconds == 150
+    assert strategy.p90_seconds == 190
+
+    with pytest.raises(ValueError, match="At least one"):
+        HistoricalDurationPolling.from_durations([])
+
+
+def test_historical_duration_polling_schedule():
+    strategy = HistoricalDurationPolling(
+        p10_seconds=100, p50_seconds=150, p90_seconds=190, dense_polls=10
+    )
+    # sparse before the fastest runs usually finish
+    assert strategy.get_interval(1, 0) == 100
+    # converging towards the median
+    assert strategy.get_interval(2, 110) == 20
+    # dense in between the median and 90th percentile
+    assert strategy.get_interval(5, 160) == 4
+    # backing off for unusually long runs
+    assert strategy.get_interval(20, 250) == 30
+    assert strategy.get_interval(50, 10_000) == 300
@@ -1,9 +1,34 @@
+import asyncio
+import time
+from unittest.mock import patch
+
 import pytest
-from httpx import Response
+from httpx import HTTPStatusError, Response
+from prefect.client.orchestration import get_client
 
 from prefect_hex.exceptions import TERMINAL_STATUS_EXCEPTIONS, HexProjectRunTimedOut
-from prefect_hex.models.project import ProjectStatusResponsePayload
-from prefect_hex.project import trigger_project_run_and_wait_for_completion
+from prefect_hex.models.project import (
+    ProjectRunResponsePayload,
+    ProjectRunStatus,
+    ProjectStatusResponsePayload,
+)
+from prefect_hex.polling import ExponentialBackoffPolling, FixedPolling
+from prefect_hex.project import (
+    IDEMPOTENCY_NAMESPACE,
+    STATUS_CACHE_NAMESPACE,
+    UPDATE_CACHE_NAMESPACE,
+    CompletedRunLedger,
+    TerminalStatusCache,
+    TerminalStatusCacheStats,
+    _coalesce_update_cache_run,
+    _trigger_idempotently,
+    get_all_project_runs,
+    get_run_status,
+    iter_project_runs,
+    run_project,
+    trigger_project_run_and_wait_for_completion,
+    wait_for_project_run_completion,
+)
 
 
 @pytest.fixture()
@@ -90,3 +115,644 @@ async def test_trigger_project_run_and_wait_for_completion_unsuccessful(
             project_id="123",
             hex_credentials=hex_credentials,
         )
+
+
+async def test_wait_for_project_run_completion_polling_strategy(
+    hex_credentials, respx_mock, project_status_json
+):
+    running_json = dict(project_status_json, status="RUNNING")
+    route = respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1234").mock(
+        side_effect=[
+            Response(200, json=running_json),
+            Response(200, json=running_json),
+            Response(200, json=project_status_json),
+        ]
+    )
+    project_status, project_metadata = await wait_for_project_run_completion(
+        project_id="123",
+        run_id="1234",
+        hex_credentials=hex_credentials,
+        polling_strategy=ExponentialBackoffPolling(initial_seconds=0.1),
+    )
+    assert project_status == ProjectRunStatus.completed
+    assert route.call_count == 3
+
+
+async def test_wait_for_project_run_completion_deadline(
+    hex_credentials, respx_mock, project_status_json
+):
+    project_status_json["status"] = "RUNNING"
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1234").mock(
+        return_value=Response(200, json=project_status_json)
+    )
+    start = time.monotonic()
+    with pytest.raises(HexProjectRunTimedOut):
+        await wait_for_project_run_completion(
+            project_id="123",
+            run_id="1234",
+            hex_credentials=hex_credentials,
+            max_wait_seconds=1,
+            polling_strategy=FixedPolling(interval_seconds=30),
+        )
+    assert time.monotonic() - start < 10
+
+
+async def test_wait_for_project_run_completion_historical_durations(
+    hex_credentials, respx_mock, project_status_json
+):
+    history_route = respx_mock.get(
+        "https://app.hex.tech/api/v1/project/123/runs",
+        params={"statusFilter": "COMPLETED"},
+    ).mock(
+        return_value=Response(
+            200,
+            json={
+                "runs": [
+                    dict(project_status_json, elapsedTime=elapsed_time)
+                    for elapsed_time in (1000, 1100, 1200, 1300, 1400)
+                ],
+                "traceId": "123456",
+            },
+        )
+    )
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1234").mock(
+        side_effect=[
+            Response(200, json=dict(project_status_json, status="RUNNING")),
+            Response(200, json=project_status_json),
+        ]
+    )
+    project_status, _ = await wait_for_project_run_completion(
+        project_id="123",
+        run_id="1234",
+        hex_credentials=hex_credentials,
+        use_historical_durations=True,
+    )
+    assert project_status == ProjectRunStatus.completed
+    assert history_route.called
+
+
+async def test_wait_for_project_run_completion_historical_durations_unavailable(
+    hex_credentials, respx_mock, project_status_json
+):
+    history_route = respx_mock.get(
+        "https://app.hex.tech/api/v1/project/123/runs",
+        params={"statusFilter": "COMPLETED"},
+    ).mock(return_value=Response(403, json={"reason": "forbidden"}))
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1234").mock(
+        return_value=Response(200, json=project_status_json)
+    )
+    project_status, _ = await wait_for_project_run_completion(
+        project_id="123",
+        run_id="1234",
+        hex_credentials=hex_credentials,
+        use_historical_durations=True,
+    )
+    assert project_status == ProjectRunStatus.completed
+    assert history_route.called
+
+
+async def test_wait_for_project_run_completion_lightweight_polling(
+    hex_credentials, respx_mock, project_status_json
+):
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1234").mock(
+        side_effect=[
+            Response(200, json=dict(project_status_json, status="PENDING")),
+            Response(200, json=project_status_json),
+        ]
+    )
+    with patch.object(get_run_status, "submit") as mock_submit:
+        project_status, _ = await wait_for_project_run_completion(
+            project_id="123",
+            run_id="1234",
+            hex_credentials=hex_credentials,
+            polling_strategy=FixedPolling(interval_seconds=0.1),
+            lightweight_polling=True,
+        )
+    assert project_status == ProjectRunStatus.completed
+    mock_submit.assert_not_called()
+
+    async with get_client() as client:
+        artifacts = await client.read_artifacts()
+    summaries = [
+        artifact
+        for artifact in artifacts
+        if artifact.description == "Status polling summary of Hex run 1234"
+    ]
+    assert len(summaries) == 1
+    assert "| COMPLETED | 2 |" in summaries[0].data
+
+
+@pytest.fixture()
+def paginated_runs(respx_mock, project_status_json):
+    def runs_page(request):
+        offset = int(request.url.params.get("offset", 0))
+        runs = [
+            dict(project_status_json, runId=str(run_id))
+            for run_id in range(offset, min(offset + 2, 5))
+        ]
+        next_page = (
+            f"https://app.hex.tech/api/v1/project/123/runs?limit=2&offset={offset + 2}"
+            if offset + 2 < 5
+            else None
+        )
+        return Response(
+            200, json={"runs": runs, "nextPage": next_page, "traceId": "123456"}
+        )
+
+    return respx_mock.get("https://app.hex.tech/api/v1/project/123/runs").mock(
+        side_effect=runs_page
+    )
+
+
+async def test_iter_project_runs(hex_credentials, paginated_runs):
+    run_ids = [
+        run.run_id
+        async for run in iter_project_runs("123", hex_credentials, page_size=2)
+    ]
+    assert run_ids == ["0", "1", "2", "3", "4"]
+    assert paginated_runs.call_count == 3
+
+
+async def test_iter_project_runs_max_items(hex_credentials, paginated_runs):
+    run_ids = [
+        run.run_id
+        async for run in iter_project_runs(
+            "123", hex_credentials, page_size=2, max_items=2
+        )
+    ]
+    assert run_ids == ["0", "1"]
+    assert paginated_runs.call_count == 1
+
+
+async def test_get_all_project_runs(hex_credentials, paginated_runs):
+    runs = await get_all_project_runs.fn(
+        "123", hex_credentials, page_size=2, max_concurrency=2
+    )
+    assert [run.run_id for run in runs] == ["0", "1", "2", "3", "4"]
+    # pages overlap by a run, so they start at offsets 0 to 5
+    assert paginated_runs.call_count == 6
+
+
+async def test_get_all_project_runs_dedupes_shifted_runs(
+    hex_credentials, respx_mock, project_status_json
+):
+    # a new run arrived in between the requests of the first and second page
+    pages = {
+        "0": ["4", "3"],
+        "2": ["2", "1"],
+        "4": ["1", "0"],
+        "6": [],
+    }
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/runs").mock(
+        side_effect=lambda request: Response(
+            200,
+            json={
+                "runs": [
+                    dict(project_status_json, runId=run_id)
+                    for run_id in pages[request.url.params["offset"]]
+                ],
+                "traceId": "123456",
+            },
+        )
+    )
+    runs = await get_all_project_runs.fn(
+        "123", hex_credentials, page_size=2, max_concurrency=4, page_overlap=0
+    )
+    assert [run.run_id for run in runs] == ["4", "3", "2", "1", "0"]
+
+
+async def test_get_all_project_runs_walks_seam_of_shifted_runs(
+    hex_credentials, respx_mock, project_status_json
+):
+    # two new runs arrived in between the requests of the first and second
+    # page, shifting run "4" past the end of the first page
+    before = ["5", "4", "3", "2", "1", "0"]
+    after = ["7", "6"] + before
+    requested_offsets = []
+
+    def runs_page(request):
+        offset = int(request.url.params["offset"])
+        served_after = offset == 0 or offset in requested_offsets
+        requested_offsets.append(offset)
+        run_ids = (after if served_after else before)[offset : offset + 3]
+        return Response(
+            200,
+            json={
+                "runs": [dict(project_status_json, runId=run_id) for run_id in run_ids],
+                "traceId": "123456",
+            },
+        )
+
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/runs").mock(
+        side_effect=runs_page
+    )
+    runs = await get_all_project_runs.fn(
+        "123", hex_credentials, page_size=3, max_concurrency=4, page_overlap=1
+    )
+    assert [run.run_id for run in runs] == after
+
+
+async def test_run_project_idempotency_key(
+    hex_credentials, respx_mock, project_run_json
+):
+    trigger_route = respx_mock.post("https://app.hex.tech/api/v1/project/123/run").mock(
+        return_value=Response(200, json=project_run_json)
+    )
+    for _ in range(2):
+        project_run = await run_project.fn(
+            "123", hex_credentials, idempotency_key="nightly"
+        )
+        assert project_run.run_id == "1234"
+    assert trigger_route.call_count == 1
+
+    await run_project.fn("123", hex_credentials, idempotency_key="other")
+    assert trigger_route.call_count == 2
+
+
+async def test_run_project_idempotency_key_concurrent(
+    hex_credentials, respx_mock, project_run_json
+):
+    async def _slow_trigger(request):
+        await asyncio.sleep(0.1)
+        return Response(200, json=project_run_json)
+
+    trigger_route = respx_mock.post("https://app.hex.tech/api/v1/project/123/run").mock(
+        side_effect=_slow_trigger
+    )
+    # the second caller waits on the lease of the first and attaches to its run
+    project_runs = await asyncio.gather(
+        *(
+            run_project.fn("123", hex_credentials, idempotency_key="nightly")
+            for _ in range(2)
+        )
+    )
+    assert [project_run.run_id for project_run in project_runs] == ["1234", "1234"]
+    assert trigger_route.call_count == 1
+
+
+async def test_run_project_idempotency_key_rejected(
+    hex_credentials, respx_mock, project_run_json, state_store
+):
+    trigger_route = respx_mock.post("https://app.hex.tech/api/v1/project/123/run").mock(
+        side_effect=[
+            Response(422, json={"reason": "invalid input"}),
+            Response(200, json=project_run_json),
+        ]
+    )
+    runs_route = respx_mock.get("https://app.hex.tech/api/v1/project/123/runs")
+
+    with pytest.raises(HTTPStatusError):
+        await run_project.fn("123", hex_credentials, idempotency_key="nightly")
+    assert state_store.get(IDEMPOTENCY_NAMESPACE, "123/nightly") is None
+
+    # the rejected request started no run, so the retry triggers its own
+    project_run = await run_project.fn(
+        "123", hex_credentials, idempotency_key="nightly"
+    )
+    assert project_run.run_id == "1234"
+    assert trigger_route.call_count == 2
+    assert not runs_route.called
+
+
+async def test_run_project_idempotency_key_interrupted(
+    hex_credentials, respx_mock, project_status_json, state_store
+):
+    # the first call recorded its request, but was interrupted before the
+    # response, while Hex started run "1234"
+    state_store.set(
+        IDEMPOTENCY_NAMESPACE,
+        "123/nightly",
+        {"requested_at": "2022-11-15T23:53:30+00:00"},
+    )
+    old_run_json = dict(
+        project_status_json, runId="1233", startTime="2022-11-15T20:00:00.000Z"
+    )
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/runs").mock(
+        return_value=Response(
+            200,
+            json={"runs": [project_status_json, old_run_json], "traceId": "1"},
+        )
+    )
+    trigger_route = respx_mock.post("https://app.hex.tech/api/v1/project/123/run")
+
+    project_run = await run_project.fn(
+        "123", hex_credentials, idempotency_key="nightly"
+    )
+    assert project_run.run_id == "1234"
+    assert project_run.run_status_url == (
+        "https://app.hex.tech/api/v1/project/123/run/1234"
+    )
+    assert not trigger_route.called
+
+
+@pytest.mark.parametrize(
+    "start_times",
+    [
+        # started by another caller long after the interrupted request
+        ["2022-11-16T01:00:00.000Z"],
+        # several runs may have been started by the interrupted request
+        ["2022-11-15T23:53:31.554Z", "2022-11-15T23:53:40.000Z"],
+    ],
+)
+async def test_run_project_idempotency_key_interrupted_unmatched(
+    hex_credentials,
+    respx_mock,
+    project_run_json,
+    project_status_json,
+    state_store,
+    start_times,
+):
+    state_store.set(
+        IDEMPOTENCY_NAMESPACE,
+        "123/nightly",
+        {"requested_at": "2022-11-15T23:53:30+00:00"},
+    )
+    runs_json = [
+        dict(project_status_json, runId=f"other-{index}", startTime=start_time)
+        for index, start_time in enumerate(start_times)
+    ]
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/runs").mock(
+        return_value=Response(200, json={"runs": runs_json, "traceId": "1"})
+    )
+    trigger_route = respx_mock.post("https://app.hex.tech/api/v1/project/123/run").mock(
+        return_value=Response(200, json=project_run_json)
+    )
+
+    project_run = await run_project.fn(
+        "123", hex_credentials, idempotency_key="nightly"
+    )
+    assert project_run.run_id == "1234"
+    assert trigger_route.call_count == 1
+    recorded = state_store.get(IDEMPOTENCY_NAMESPACE, "123/nightly")
+    assert recorded["requested_at"] > "2022-11-15T23:53:30+00:00"
+
+
+async def test_trigger_idempotently_renews_lease(hex_credentials, project_run_json):
+    triggered = []
+
+    async def _slow_trigger():
+        triggered.append(True)
+        # outlasts the lease several times over
+        await asyncio.sleep(0.5)
+        return ProjectRunResponsePayload.parse_obj(project_run_json)
+
+    project_runs = await asyncio.gather(
+        _trigger_idempotently(
+            "123",
+            hex_credentials,
+            _slow_trigger,
+            "nightly",
+            idempotency_window_seconds=60,
+            lease_seconds=0.15,
+            lease_poll_seconds=0.05,
+        ),
+        _trigger_idempotently(
+            "123",
+            hex_credentials,
+            _slow_trigger,
+            "nightly",
+            idempotency_window_seconds=60,
+            lease_seconds=0.15,
+            lease_poll_seconds=0.05,
+        ),
+    )
+    assert [project_run.run_id for project_run in project_runs] == ["1234", "1234"]
+    assert len(triggered) == 1
+
+
+async def test_trigger_project_run_and_wait_for_completion_reuse(
+    hex_credentials, respx_mock, project_run_json, project_status_json
+):
+    trigger_route = respx_mock.post("https://app.hex.tech/api/v1/project/123/run").mock(
+        return_value=Response(200, json=project_run_json)
+    )
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1234").mock(
+        return_value=Response(200, json=project_status_json)
+    )
+    for input_params in ({"a": 1, "b": 2}, {"b": 2, "a": 1}, {"a": 2}):
+        actual = await trigger_project_run_and_wait_for_completion(
+            project_id="123",
+            hex_credentials=hex_credentials,
+            input_params=input_params,
+            reuse_if_completed_within=600,
+        )
+        assert actual.run_id == "1234"
+    # the second run has identical inputs and reuses the first one
+    assert trigger_route.call_count == 2
+
+
+def test_completed_run_ledger(project_status_json):
+    ledger = CompletedRunLedger()
+    project_status_json["endTime"] = "2022-11-15T23:55:31.554Z"
+    ledger.record(ProjectStatusResponsePayload.parse_obj(project_status_json), None)
+
+    end_time = 1668556531.554
+    with patch("prefect_hex.project.time.time", return_value=end_time + 60):
+        assert ledger.get("123", {}, within_seconds=120).run_id == "1234"
+        assert ledger.get("123", {}, within_seconds=30) is None
+        assert ledger.get("123", {"a": 1}, within_seconds=120) is None
+
+
+@pytest.fixture
+def update_cache_project(respx_mock, project_run_json, project_status_json):
+    """
+    Mocks project "123", whose runs are running until marked complete.
+    """
+    project_status_json["status"] = "RUNNING"
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1234").mock(
+        side_effect=lambda request: Response(200, json=project_status_json)
+    )
+    return respx_mock.post("https://app.hex.tech/api/v1/project/123/run").mock(
+        return_value=Response(200, json=project_run_json)
+    )
+
+
+async def test_run_project_coalesces_update_cache_runs(
+    hex_credentials, update_cache_project, project_status_json
+):
+    project_runs = await asyncio.gather(
+        *(run_project.fn("123", hex_credentials, update_cache=True) for _ in range(3))
+    )
+    assert {project_run.run_id for project_run in project_runs} == {"1234"}
+    assert update_cache_project.call_count == 1
+
+    # once the run finished, the next update_cache run is triggered
+    project_status_json["status"] = "COMPLETED"
+    await run_project.fn("123", hex_credentials, update_cache=True)
+    assert update_cache_project.call_count == 2
+
+    # runs without update_cache are never coalesced
+    await run_project.fn("123", hex_credentials)
+    assert update_cache_project.call_count == 3
+
+
+async def test_run_project_coalesces_update_cache_runs_across_processes(
+    hex_credentials, update_cache_project
+):
+    await run_project.fn(
+        "123", hex_credentials, update_cache=True, coalesce_across_processes=True
+    )
+    # forget the in-flight run of this process, like another process would
+    with patch.dict("prefect_hex.project._UPDATE_CACHE_RUNS", clear=True):
+        project_run = await run_project.fn(
+            "123", hex_credentials, update_cache=True, coalesce_across_processes=True
+        )
+    assert project_run.run_id == "1234"
+    assert update_cache_project.call_count == 1
+
+
+async def test_run_project_coalesces_update_cache_run_recorded_before_lease(
+    hex_credentials, update_cache_project, project_run_json, state_store
+):
+    acquire_lease = state_store.acquire_lease
+
+    def _acquire_lease_after_other_process(*args, **kwargs):
+        # another process recorded its run and released the lease in between
+        state_store.set(UPDATE_CACHE_NAMESPACE, "app.hex.tech/123", project_run_json)
+        return acquire_lease(*args, **kwargs)
+
+    with patch.object(
+        state_store, "acquire_lease", side_effect=_acquire_lease_after_other_process
+    ):
+        project_run = await run_project.fn(
+            "123", hex_credentials, update_cache=True, coalesce_across_processes=True
+        )
+    assert project_run.run_id == "1234"
+    assert not update_cache_project.called
+
+
+async def test_coalesce_update_cache_run_renews_lease(
+    hex_credentials, update_cache_project, project_run_json
+):
+    triggered = []
+
+    async def _slow_trigger():
+        triggered.append(True)
+        # outlasts the lease several times over
+        await asyncio.sleep(0.5)
+        return ProjectRunResponsePayload.parse_obj(project_run_json)
+
+    def _coalesce():
+        return _coalesce_update_cache_run(
+            "123",
+            hex_credentials,
+            _slow_trigger,
+            across_processes=True,
+            lease_seconds=0.15,
+            lease_poll_seconds=0.05,
+        )
+
+    first = asyncio.ensure_future(_coalesce())
+    await asyncio.sleep(0.1)
+    # forget the locks of this process, like another process would
+    with patch.dict("prefect_hex.project._UPDATE_CACHE_LOCKS", clear=True):
+        second = await _coalesce()
+    assert (await first).run_id == second.run_id == "1234"
+    assert len(triggered) == 1
+
+
+async def test_get_run_status_cached(hex_credentials, respx_mock, project_status_json):
+    project_status_json["status"] = "RUNNING"
+    route = respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1234").mock(
+        side_effect=lambda request: Response(200, json=project_status_json)
+    )
+    kwargs = dict(
+        project_id="123",
+        run_id="1234",
+        hex_credentials=hex_credentials,
+        max_cached_status_age_seconds=60,
+    )
+    await get_run_status.fn(**kwargs)
+    await get_run_status.fn(**kwargs)
+    assert route.call_count == 1
+
+    # stale statuses are fetched again
+    project_status_json["status"] = "COMPLETED"
+    now = time.time()
+    with patch("prefect_hex.project.time.time", return_value=now + 61):
+        assert (await get_run_status.fn(**kwargs)).status == ProjectRunStatus.completed
+    assert route.call_count == 2
+
+    # terminal statuses are served however old they are
+    with patch("prefect_hex.project.time.time", return_value=now + 3600):
+        assert (await get_run_status.fn(**kwargs)).status == ProjectRunStatus.completed
+    assert route.call_count == 2
+
+
+async def test_get_run_status_cached_lease(
+    hex_credentials, respx_mock, project_status_json, state_store
+):
+    route = respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1234").mock(
+        return_value=Response(200, json=project_status_json)
+    )
+    store_key = "app.hex.tech/123/1234"
+    # another process is fetching the status of the run
+    state_store.acquire_lease(STATUS_CACHE_NAMESPACE, store_key, "other", 10)
+
+    async def other_process():
+        await asyncio.sleep(0.2)
+        state_store.set(
+            STATUS_CACHE_NAMESPACE,
+            store_key,
+            {"fetched_at": time.time(), "project_metadata": project_status_json},
+        )
+
+    project_metadata, _ = await asyncio.gather(
+        get_run_status.fn(
+            "123", "1234", hex_credentials, max_cached_status_age_seconds=5
+        ),
+        other_process(),
+    )
+    assert project_metadata.run_id == "1234"
+    assert not route.called
+
+
+async def test_get_run_status_terminal_status_cache(
+    hex_credentials, respx_mock, project_status_json, terminal_status_cache
+):
+    project_status_json["status"] = "RUNNING"
+    route = respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1234").mock(
+        side_effect=lambda request: Response(200, json=project_status_json)
+    )
+    # non-terminal statuses keep going to the API
+    await get_run_status.fn("123", "1234", hex_credentials)
+    await get_run_status.fn("123", "1234", hex_credentials)
+    assert route.call_count == 2
+
+    project_status_json["status"] = "ERRORED"
+    for _ in range(3):
+        project_metadata = await get_run_status.fn("123", "1234", hex_credentials)
+        assert project_metadata.status == ProjectRunStatus.errored
+    assert route.call_count == 3
+    assert terminal_status_cache.stats == TerminalStatusCacheStats(
+        hits=2, disk_hits=0, misses=3, size=1
+    )
+
+    await get_run_status.fn(
+        "123", "1234", hex_credentials, use_terminal_status_cache=False
+    )
+    assert route.call_count == 4
+
+
+def test_terminal_status_cache(project_status_json, state_store):
+    cache = TerminalStatusCache(max_size=2, ttl_seconds=60, persist=True)
+    for run_id in ("1", "2", "3"):
+        cache.put(
+            "app.hex.tech",
+            ProjectStatusResponsePayload.parse_obj(
+                dict(project_status_json, runId=run_id)
+            ),
+        )
+    assert cache.stats.size == 2
+
+    # the least recently used status was evicted from memory, but not from disk
+    assert cache.get("app.hex.tech", "123", "1").run_id == "1"
+    assert cache.get("app.hex.tech", "123", "3").run_id == "3"
+    assert cache.stats.disk_hits == 1
+    assert cache.stats.hits == 1
+
+    # statuses expire after the time to live
+    now = time.monotonic()
+    with patch("prefect_hex.project.time.monotonic", return_value=now + 61):
+        cache.persist = False
+        assert cache.get("app.hex.tech", "123", "3") is None
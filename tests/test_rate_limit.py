@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from prefect_hex import HexCredentials
+from prefect_hex.rate_limit import (
+    HexRateLimiter,
+    RateLimitBucket,
+    TokenBucket,
+    get_rate_limit_bucket,
+    get_rate_limiter,
+)
+
+
+def test_get_rate_limit_bucket():
+    assert get_rate_limit_bucket("get") == RateLimitBucket.READ
+    assert get_rate_limit_bucket("post") == RateLimitBucket.TRIGGER
+    assert get_rate_limit_bucket("delete") == RateLimitBucket.TRIGGER
+
+
+def test_token_bucket_requires_positive_rate():
+    with pytest.raises(ValueError, match="greater than 0"):
+        TokenBucket(0)
+
+
+async def test_token_bucket_throttles_after_burst():
+    bucket = TokenBucket(requests_per_minute=600, capacity=2)
+    start = time.monotonic()
+    waits = [await bucket.acquire() for _ in range(4)]
+    assert waits[:2] == [0, 0]
+    assert 0 < waits[2] <= 0.1
+    assert time.monotonic() - start >= 0.15
+    assert bucket.stats.requests == 4
+    assert bucket.stats.throttled_requests == 2
+    assert bucket.stats.total_wait_seconds == pytest.approx(sum(waits))
+
+
+async def test_hex_rate_limiter_separate_budgets():
+    rate_limiter = HexRateLimiter(trigger_requests_per_minute=60)
+    assert await rate_limiter.acquire("post") == 0
+    assert await rate_limiter.acquire("get") == 0
+    assert list(rate_limiter.stats) == [RateLimitBucket.TRIGGER]
+
+
+def test_get_rate_limiter_shared_by_credentials():
+    rate_limiter = get_rate_limiter(
+        HexCredentials(token="budgeted", read_requests_per_minute=60)
+    )
+    assert rate_limiter is get_rate_limiter(
+        HexCredentials(token="budgeted", read_requests_per_minute=60)
+    )
+    # credentials without budgets share the quota and keep its budget
+    assert rate_limiter is get_rate_limiter(HexCredentials(token="budgeted"))
+    assert rate_limiter is not get_rate_limiter(HexCredentials(token="other"))
+
+    # the lowest budget configured for the quota applies
+    assert get_rate_limiter(
+        HexCredentials(token="budgeted", read_requests_per_minute=30)
+    ) is get_rate_limiter(
+        HexCredentials(token="budgeted", read_requests_per_minute=120)
+    )
+    assert rate_limiter.buckets[RateLimitBucket.READ].requests_per_minute == 30
+    assert RateLimitBucket.TRIGGER not in rate_limiter.buckets
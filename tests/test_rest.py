@@ -1,3 +1,4 @@
+import asyncio
 from typing import List
 
 import httpx
@@ -10,7 +11,10 @@ else:
     from pydantic import BaseModel, Extra
 
 from prefect_hex import HexCredentials
+from prefect_hex.clients import get_client_registry
+from prefect_hex.hedging import RequestHedger, set_request_hedger
 from prefect_hex.rest import HTTPMethod, execute_endpoint, serialize_model, strip_kwargs
+from prefect_hex.retries import RetryPolicy
 
 
 @pytest.mark.parametrize("params", [dict(a="A", b="B"), None])
@@ -89,3 +93,177 @@ def test_serialize_model():
     )
 
     assert expected == actual
+
+
+async def test_execute_endpoint_reuses_pooled_client(respx_mock):
+    url = "https://prefect.io/"
+    respx_mock.get(url).mock(return_value=httpx.Response(200))
+
+    credentials = HexCredentials(token="token_value")
+    first = await execute_endpoint.fn(url, credentials)
+    second = await execute_endpoint.fn(url, credentials)
+    unpooled = await execute_endpoint.fn(url, credentials, use_pooled_client=False)
+    assert first.status_code == second.status_code == unpooled.status_code == 200
+
+    registry = get_client_registry()
+    assert await registry.get_client(credentials) is await registry.get_client(
+        credentials
+    )
+    await registry.aclose()
+
+
+async def test_execute_endpoint_retries(respx_mock):
+    url = "https://prefect.io/"
+    route = respx_mock.get(url).mock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.ConnectError("refused"),
+            httpx.Response(503),
+            httpx.Response(200),
+        ]
+    )
+    credentials = HexCredentials(
+        token="token_value", retry_policy=RetryPolicy(backoff_base_seconds=0)
+    )
+    response = await execute_endpoint.fn(url, credentials)
+    assert response.status_code == 200
+    assert route.call_count == 4
+
+
+async def test_execute_endpoint_does_not_retry_unsafe_post(respx_mock):
+    url = "https://prefect.io/"
+    route = respx_mock.post(url).mock(return_value=httpx.Response(503))
+    credentials = HexCredentials(token="token_value")
+    response = await execute_endpoint.fn(url, credentials, http_method="post")
+    assert response.status_code == 503
+    assert route.call_count == 1
+
+
+async def test_execute_endpoint_retry_budget(respx_mock):
+    url = "https://prefect.io/"
+    route = respx_mock.get(url).mock(
+        return_value=httpx.Response(503, headers={"Retry-After": "60"})
+    )
+    credentials = HexCredentials(token="token_value")
+    response = await execute_endpoint.fn(
+        url, credentials, retry_policy=RetryPolicy(budget_seconds=10)
+    )
+    assert response.status_code == 503
+    assert route.call_count == 1
+
+
+async def test_execute_endpoint_reports_throttling(respx_mock):
+    url = "https://prefect.io/"
+    respx_mock.get(url).mock(return_value=httpx.Response(200))
+    credentials = HexCredentials(token="throttled", read_requests_per_minute=120)
+    responses = [await execute_endpoint.fn(url, credentials) for _ in range(3)]
+    assert responses[0].extensions["throttled_seconds"] == 0
+    assert responses[-1].extensions["throttled_seconds"] > 0
+
+
+async def _delayed_response(request):
+    await asyncio.sleep(0.05)
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+@pytest.mark.parametrize("coalesce", [True, False])
+async def test_execute_endpoint_coalesces_identical_gets(coalesce, respx_mock):
+    url = "https://prefect.io/"
+    route = respx_mock.get(url).mock(side_effect=_delayed_response)
+    credentials = HexCredentials(token="token_value")
+    responses = await asyncio.gather(
+        *(
+            execute_endpoint.fn(
+                url, credentials, params=dict(a="A", b="B"), coalesce=coalesce
+            )
+            for _ in range(5)
+        )
+    )
+    assert all(response.status_code == 200 for response in responses)
+    assert route.call_count == (1 if coalesce else 5)
+
+
+async def test_execute_endpoint_does_not_coalesce_different_requests(respx_mock):
+    url = "https://prefect.io/"
+    get_route = respx_mock.get(url).mock(side_effect=_delayed_response)
+    post_route = respx_mock.post(url).mock(side_effect=_delayed_response)
+    credentials = HexCredentials(token="token_value")
+    other_credentials = HexCredentials(token="other_token_value")
+    await asyncio.gather(
+        execute_endpoint.fn(url, credentials, params=dict(a="A")),
+        execute_endpoint.fn(url, credentials, params=dict(a="B")),
+        execute_endpoint.fn(url, other_credentials, params=dict(a="A")),
+        execute_endpoint.fn(url, credentials, params=dict(a="A"), hedge=True),
+        execute_endpoint.fn(
+            url,
+            credentials,
+            params=dict(a="A"),
+            retry_policy=RetryPolicy(max_attempts=1),
+        ),
+        execute_endpoint.fn(
+            url, credentials, params=dict(a="A"), use_pooled_client=False
+        ),
+        execute_endpoint.fn(url, credentials, http_method="post"),
+        execute_endpoint.fn(url, credentials, http_method="post"),
+    )
+    assert get_route.call_count == 6
+    assert post_route.call_count == 2
+
+
+async def test_execute_endpoint_hedges_slow_get(respx_mock):
+    url = "https://prefect.io/"
+
+    requests = []
+
+    async def _stall_first_response(request):
+        requests.append(request)
+        if len(requests) == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200)
+
+    respx_mock.get(url).mock(side_effect=_stall_first_response)
+    credentials = HexCredentials(token="hedged_token_value")
+    hedger = RequestHedger(min_samples=1, min_delay_seconds=0, max_hedge_rate=1)
+    hedger.record(0.01)
+    set_request_hedger(credentials, hedger)
+
+    response = await asyncio.wait_for(
+        execute_endpoint.fn(url, credentials, hedge=True), timeout=2
+    )
+    assert response.status_code == 200
+    assert len(requests) == 2
+    stats = hedger.stats
+    assert stats.hedged_requests == stats.hedge_wins == 1
+    # the latency of the stalled request is recorded, not that of the hedge
+    assert stats.delay_seconds > 0.01
+
+
+async def test_execute_endpoint_does_not_hedge_over_rate(respx_mock):
+    url = "https://prefect.io/"
+    route = respx_mock.get(url).mock(side_effect=_delayed_response)
+    credentials = HexCredentials(token="capped_token_value")
+    hedger = RequestHedger(min_samples=1, min_delay_seconds=0, max_hedge_rate=0)
+    hedger.record(0.01)
+    set_request_hedger(credentials, hedger)
+
+    response = await execute_endpoint.fn(url, credentials, hedge=True)
+    assert response.status_code == 200
+    assert route.call_count == 1
+    assert hedger.stats.rate_limited_hedges == 1
+
+
+async def test_execute_endpoint_does_not_hedge_without_rate_limit_token(respx_mock):
+    url = "https://prefect.io/"
+    route = respx_mock.get(url).mock(side_effect=_delayed_response)
+    credentials = HexCredentials(
+        token="limited_token_value", read_requests_per_minute=1
+    )
+    hedger = RequestHedger(min_samples=1, min_delay_seconds=0, max_hedge_rate=1)
+    hedger.record(0.01)
+    set_request_hedger(credentials, hedger)
+
+    response = await execute_endpoint.fn(url, credentials, hedge=True)
+    assert response.status_code == 200
+    assert route.call_count == 1
+    assert hedger.stats.hedged_requests == 0
+    assert hedger.allows_hedge()
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from prefect_hex.retries import RetryPolicy, parse_retry_after
+
+
+@pytest.mark.parametrize(
+    "http_method,status_code,expected",
+    [
+        ("get", 429, True),
+        ("get", 503, True),
+        ("get", 500, False),
+        ("get", 404, False),
+        ("post", 429, True),
+        ("post", 503, False),
+    ],
+)
+def test_is_retryable_status(http_method, status_code, expected):
+    assert RetryPolicy().is_retryable_status(http_method, status_code) is expected
+
+
+def test_is_retryable_status_class():
+    policy = RetryPolicy(retry_statuses=["5xx"])
+    assert policy.is_retryable_status("get", 500)
+    assert not policy.is_retryable_status("get", 429)
+
+
+def test_is_retryable_error():
+    policy = RetryPolicy()
+    assert policy.is_retryable_error("post", httpx.ConnectError("refused"))
+    assert policy.is_retryable_error("get", httpx.ReadTimeout("slow"))
+    assert not policy.is_retryable_error("post", httpx.ReadTimeout("slow"))
+    policy = RetryPolicy(retry_on_transport_errors=False)
+    assert not policy.is_retryable_error("get", httpx.ConnectError("refused"))
+
+
+def test_get_backoff_seconds_is_capped():
+    policy = RetryPolicy(backoff_base_seconds=1, backoff_max_seconds=4)
+    for attempt in range(1, 10):
+        assert 0 <= policy.get_backoff_seconds(attempt) <= min(4, 2 ** (attempt - 1))
+
+
+def test_get_backoff_seconds_retry_after():
+    response = httpx.Response(429, headers={"Retry-After": "7"})
+    assert RetryPolicy().get_backoff_seconds(1, response) == 7
+    policy = RetryPolicy(respect_retry_after=False, backoff_base_seconds=1)
+    assert policy.get_backoff_seconds(1, response) <= 1
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    response = httpx.Response(
+        503, headers={"Retry-After": format_datetime(retry_at, usegmt=True)}
+    )
+    assert 25 < parse_retry_after(response) <= 30
+    assert parse_retry_after(httpx.Response(503)) is None
+    assert parse_retry_after(httpx.Response(503, headers={"Retry-After": "?"})) is None
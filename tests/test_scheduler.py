@@ -0,0 +1,78 @@
+import asyncio
+
+from prefect_hex.batch import ProjectRunSpec
+from prefect_hex.polling import FixedPolling
+from prefect_hex.scheduler import ProjectRunScheduler
+
+
+async def test_project_run_scheduler_priority(hex_credentials, triggered):
+    scheduler = ProjectRunScheduler(
+        hex_credentials,
+        max_concurrency=1,
+        polling_strategy=FixedPolling(interval_seconds=0.01),
+    )
+    futures = [
+        scheduler.submit(
+            ProjectRunSpec(project_id="backfill", key=str(day)),
+            priority=10,
+            tags=["backfill"],
+        )
+        for day in range(3)
+    ]
+    futures.append(scheduler.submit({"project_id": "dashboard"}, priority=0))
+    assert scheduler.stats.queued == 3
+    assert scheduler.stats.queued_by_priority == {0: 1, 10: 2}
+
+    results = await asyncio.gather(*futures)
+    assert all(result.succeeded for result in results)
+    # the first backfill run was dispatched right away, then the dashboard
+    # refresh jumped ahead of the rest of the backfill
+    assert triggered == [
+        "backfill",
+        "dashboard",
+        "backfill",
+        "backfill",
+    ]
+    stats = scheduler.stats
+    assert stats.dispatched == 4
+    assert stats.queued == 0
+    assert stats.max_wait_seconds_by_priority[0] <= stats.max_wait_seconds
+    await scheduler.aclose()
+
+
+async def test_project_run_scheduler_caps(hex_credentials, triggered):
+    scheduler = ProjectRunScheduler(
+        hex_credentials,
+        max_concurrency=3,
+        project_concurrency={"a": 1},
+        tag_concurrency={"backfill": 1},
+        polling_strategy=FixedPolling(interval_seconds=0.01),
+    )
+    for i in range(2):
+        scheduler.submit(ProjectRunSpec(project_id="a", key=str(i)))
+        scheduler.submit(ProjectRunSpec(project_id="b", key=str(i)), tags=["backfill"])
+    scheduler.submit(ProjectRunSpec(project_id="c"))
+
+    # the second runs of "a" and of the backfill tag are skipped over for "c"
+    assert scheduler.stats.running == 3
+    assert scheduler.stats.queued == 2
+
+    await scheduler.join()
+    assert scheduler.stats.dispatched == 5
+    await scheduler.aclose()
+
+
+async def test_project_run_scheduler_cancel(hex_credentials, triggered):
+    scheduler = ProjectRunScheduler(
+        hex_credentials,
+        max_concurrency=1,
+        polling_strategy=FixedPolling(interval_seconds=0.01),
+    )
+    first = scheduler.submit(ProjectRunSpec(project_id="a"))
+    second = scheduler.submit(ProjectRunSpec(project_id="b"))
+    second.cancel()
+
+    await scheduler.join()
+    assert first.result().succeeded
+    assert triggered == ["a"]
+    await scheduler.aclose()
@@ -0,0 +1,62 @@
+import sqlite3
+import time
+
+from prefect_hex.store import HexStateStore
+
+
+def test_state_store(tmp_path):
+    store = HexStateStore(tmp_path / "store.db")
+    store.set("namespace", "key", {"run_id": "1"})
+    store.set("other", "key", [1, 2])
+    assert store.get("namespace", "key") == {"run_id": "1"}
+    assert store.items("other") == {"key": [1, 2]}
+
+    store.delete("namespace", "key")
+    assert store.get("namespace", "key") is None
+    # a second store on the same path shares the entries
+    assert HexStateStore(tmp_path / "store.db").get("other", "key") == [1, 2]
+
+
+def test_state_store_expiry(tmp_path, monkeypatch):
+    store = HexStateStore(tmp_path / "store.db")
+    store.set("namespace", "expiring", 1, ttl_seconds=10)
+    store.set("namespace", "lasting", 2)
+    assert store.get("namespace", "expiring") == 1
+
+    now = time.time()
+    monkeypatch.setattr("prefect_hex.store.time.time", lambda: now + 11)
+    assert store.get("namespace", "expiring") is None
+    assert store.items("namespace") == {"lasting": 2}
+    assert store.purge_expired() == 1
+
+
+def test_state_store_lease(tmp_path, monkeypatch):
+    store = HexStateStore(tmp_path / "store.db")
+    assert store.acquire_lease("namespace", "key", "a", ttl_seconds=10)
+    assert store.acquire_lease("namespace", "key", "a", ttl_seconds=10)
+    assert not store.acquire_lease("namespace", "key", "b", ttl_seconds=10)
+
+    store.release_lease("namespace", "key", "b")
+    assert not store.acquire_lease("namespace", "key", "b", ttl_seconds=10)
+    store.release_lease("namespace", "key", "a")
+    assert store.acquire_lease("namespace", "key", "b", ttl_seconds=10)
+
+    # expired leases can be taken over
+    now = time.time()
+    monkeypatch.setattr("prefect_hex.store.time.time", lambda: now + 11)
+    assert store.acquire_lease("namespace", "key", "a", ttl_seconds=10)
+
+
+def test_state_store_purges_on_set(tmp_path, monkeypatch):
+    store = HexStateStore(tmp_path / "store.db", purge_interval_seconds=0)
+    store.set("namespace", "expiring", 1, ttl_seconds=10)
+    store.acquire_lease("namespace", "expiring", "a", ttl_seconds=10)
+
+    now = time.time()
+    monkeypatch.setattr("prefect_hex.store.time.time", lambda: now + 11)
+    store.set("namespace", "lasting", 2)
+    # the expired value and lease are gone, not only hidden
+    assert store.purge_expired() == 0
+    with sqlite3.connect(store.path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM leases").fetchone() == (0,)
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
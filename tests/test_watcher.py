@@ -0,0 +1,214 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from httpx import Response
+
+from prefect_hex import HexCredentials
+from prefect_hex.exceptions import HexProjectRunError, HexProjectRunTimedOut
+from prefect_hex.models.project import ProjectRunStatus
+from prefect_hex.polling import FixedPolling
+from prefect_hex.project import wait_for_project_run_completion
+from prefect_hex.watcher import (
+    ProjectRunWatcher,
+    RunStatusService,
+    close_run_status_services,
+    get_run_status_service,
+    wait_for_project_runs_completion,
+)
+
+
+def status_json(run_id, status):
+    return {
+        "projectId": "123",
+        "runId": run_id,
+        "status": status,
+        "runUrl": "https://app.hex.tech/12345/app/123",
+        "startTime": "2022-11-15T23:53:31.554Z",
+        "endTime": None,
+        "elapsedTime": 1234,
+        "traceId": "123456",
+    }
+
+
+async def test_watcher_as_completed(hex_credentials, respx_mock):
+    slow = respx_mock.get("https://app.hex.tech/api/v1/project/123/run/slow").mock(
+        side_effect=[
+            Response(200, json=status_json("slow", "PENDING")),
+            Response(200, json=status_json("slow", "RUNNING")),
+            Response(200, json=status_json("slow", "COMPLETED")),
+        ]
+    )
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/run/fast").mock(
+        return_value=Response(200, json=status_json("fast", "ERRORED"))
+    )
+    watcher = ProjectRunWatcher(hex_credentials, poll_frequency_seconds=0.01)
+    finished = [
+        (project_metadata.run_id, project_metadata.status)
+        async for project_metadata in watcher.as_completed(
+            [("123", "slow"), ("123", "fast")]
+        )
+    ]
+    assert finished == [
+        ("fast", ProjectRunStatus.errored),
+        ("slow", ProjectRunStatus.completed),
+    ]
+    assert slow.call_count == 3
+
+
+async def test_watcher_dedupes_runs(hex_credentials, respx_mock):
+    route = respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1").mock(
+        return_value=Response(200, json=status_json("1", "COMPLETED"))
+    )
+    watcher = ProjectRunWatcher(hex_credentials)
+    first = watcher.watch("123", "1")
+    second = watcher.watch("123", "1")
+    assert (await first).run_id == (await second).run_id == "1"
+    assert route.call_count == 1
+
+
+async def test_watcher_timeout(hex_credentials, respx_mock):
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1").mock(
+        return_value=Response(200, json=status_json("1", "RUNNING"))
+    )
+    watcher = ProjectRunWatcher(hex_credentials, poll_frequency_seconds=0.01)
+    with pytest.raises(HexProjectRunTimedOut, match="run '1'"):
+        await watcher.watch("123", "1", max_wait_seconds=0.05)
+    await watcher.aclose()
+
+
+async def test_wait_for_project_runs_completion(hex_credentials, respx_mock):
+    for run_id in ("1", "2"):
+        respx_mock.get(f"https://app.hex.tech/api/v1/project/123/run/{run_id}").mock(
+            return_value=Response(200, json=status_json(run_id, "COMPLETED"))
+        )
+    results = await wait_for_project_runs_completion(
+        project_runs=[("123", "1"), ("123", "2")], hex_credentials=hex_credentials
+    )
+    assert set(results) == {"1", "2"}
+    assert results["1"][0] == ProjectRunStatus.completed
+
+
+async def test_wait_for_project_runs_completion_collects_errors(
+    hex_credentials, respx_mock
+):
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1").mock(
+        return_value=Response(404, json={"reason": "not found"})
+    )
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/run/2").mock(
+        return_value=Response(200, json=status_json("2", "COMPLETED"))
+    )
+    watch = ProjectRunWatcher.watch
+    watched = []
+
+    def _watch(self, project_id, run_id, **kwargs):
+        future = watch(self, project_id, run_id, **kwargs)
+        watched.append(future)
+        return future
+
+    with patch.object(ProjectRunWatcher, "watch", _watch):
+        with pytest.raises(HexProjectRunError, match="1 of 2 project runs"):
+            await wait_for_project_runs_completion(
+                project_runs=[("123", "1"), ("123", "2")],
+                hex_credentials=hex_credentials,
+            )
+    # the other run was still waited for
+    assert watched[1].result().status == ProjectRunStatus.completed
+
+
+async def test_watcher_bulk_refresh(hex_credentials, respx_mock):
+    runs_route = respx_mock.get("https://app.hex.tech/api/v1/project/123/runs").mock(
+        side_effect=lambda request: Response(
+            200,
+            json={
+                "runs": (
+                    [status_json("1", "RUNNING"), status_json("2", "RUNNING")]
+                    if request.url.params["statusFilter"] == "RUNNING"
+                    else []
+                ),
+                "traceId": "123456",
+            },
+        )
+    )
+    run_routes = {
+        run_id: respx_mock.get(
+            f"https://app.hex.tech/api/v1/project/123/run/{run_id}"
+        ).mock(return_value=Response(200, json=status_json(run_id, "COMPLETED")))
+        for run_id in ("1", "2", "3")
+    }
+    watcher = ProjectRunWatcher(
+        hex_credentials, poll_frequency_seconds=0.01, bulk_refresh_threshold=3
+    )
+    futures = [watcher.watch("123", run_id) for run_id in ("1", "2", "3")]
+    for future in futures:
+        assert (await future).status == ProjectRunStatus.completed
+
+    # the first cycle refreshes all three runs with the two runs pages,
+    # only the finished run is fetched on its own
+    assert runs_route.call_count == 2
+    assert run_routes["3"].call_count == 1
+    assert run_routes["1"].call_count == run_routes["2"].call_count == 1
+
+
+async def test_run_status_service_shares_polls(hex_credentials, respx_mock):
+    route = respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1").mock(
+        side_effect=[
+            Response(200, json=status_json("1", "RUNNING")),
+            Response(200, json=status_json("1", "COMPLETED")),
+        ]
+    )
+    service = RunStatusService(
+        hex_credentials, polling_strategy=FixedPolling(interval_seconds=0.1)
+    )
+    try:
+        # waiters on another thread and event loop share the same polls
+        other_thread_future = service.watch("123", "1")
+        first, second = await asyncio.gather(
+            service.wait("123", "1"), service.wait("123", "1")
+        )
+        assert first.status == second.status == ProjectRunStatus.completed
+        assert other_thread_future.result(timeout=5).run_id == "1"
+        assert route.call_count == 2
+    finally:
+        service.close()
+
+
+async def test_run_status_service_timeout(hex_credentials, respx_mock):
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1").mock(
+        return_value=Response(200, json=status_json("1", "RUNNING"))
+    )
+    service = RunStatusService(
+        hex_credentials, polling_strategy=FixedPolling(interval_seconds=0.01)
+    )
+    try:
+        with pytest.raises(HexProjectRunTimedOut):
+            await service.wait("123", "1", max_wait_seconds=0.05)
+    finally:
+        service.close()
+
+
+def test_get_run_status_service(hex_credentials):
+    try:
+        service = get_run_status_service(hex_credentials)
+        assert get_run_status_service(hex_credentials.copy()) is service
+        assert get_run_status_service(HexCredentials(token="other")) is not service
+    finally:
+        close_run_status_services()
+
+
+async def test_wait_for_project_run_completion_status_service(
+    hex_credentials, respx_mock
+):
+    respx_mock.get("https://app.hex.tech/api/v1/project/123/run/1").mock(
+        return_value=Response(200, json=status_json("1", "KILLED"))
+    )
+    try:
+        project_status, _ = await wait_for_project_run_completion(
+            project_id="123",
+            run_id="1",
+            hex_credentials=hex_credentials,
+            use_status_service=True,
+        )
+    finally:
+        close_run_status_services()
+    assert project_status == ProjectRunStatus.killed